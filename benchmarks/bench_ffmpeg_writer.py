@@ -0,0 +1,92 @@
+"""Benchmark FFMpegWriter encoding throughput for each encoder profile.
+
+Encodes the same synthetic frames with each profile in ffmpeg_writer.ENCODER_PROFILES,
+and with SegmentedFFMpegWriter, and reports the throughput in frames per second.
+Profiles that the local ffmpeg build does not support, such as nvenc, are skipped.
+
+Usage:
+    python benchmarks/bench_ffmpeg_writer.py [--width 1920] [--height 1080] [--frames 300]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from director.ffmpeg_writer import ENCODER_PROFILES, FFMpegWriter, SegmentedFFMpegWriter
+
+
+def make_frames(width, height, count):
+    """Return count distinct frames of a moving gradient with some noise, so they don't compress trivially."""
+    x = np.linspace(0, 255, width, dtype=np.float32)
+    y = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    rng = np.random.default_rng(0)
+    frames = []
+    for i in range(count):
+        frame = np.empty((height, width, 3), dtype=np.uint8)
+        frame[..., 0] = (x + 4 * i) % 256
+        frame[..., 1] = (y + 2 * i) % 256
+        frame[..., 2] = rng.integers(0, 32, size=(height, width), dtype=np.uint8)
+        frames.append(frame)
+    return frames
+
+
+def encode(writer, frames, repeat):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for frame in frames:
+            writer.write_frame(frame)
+    writer.close()
+    return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, default=1920, help="frame width in pixels")
+    parser.add_argument("--height", type=int, default=1080, help="frame height in pixels")
+    parser.add_argument("--frames", type=int, default=300, help="number of frames to encode")
+    parser.add_argument("--framerate", type=float, default=60.0, help="output frame rate")
+    parser.add_argument("--segments", type=int, default=4, help="parallel segments for SegmentedFFMpegWriter")
+    args = parser.parse_args()
+
+    # Cycle through a small set of frames to bound the benchmark's memory use
+    frames = make_frames(args.width, args.height, min(args.frames, 30))
+    repeat = max(1, args.frames // len(frames))
+    num_frames = repeat * len(frames)
+    print(f"{num_frames} frames at {args.width}x{args.height}")
+
+    def profile_writer(profile):
+        return lambda filename: FFMpegWriter(filename, args.width, args.height, args.framerate, profile=profile)
+
+    cases = [(profile, profile_writer(profile)) for profile in ENCODER_PROFILES]
+    cases.append(
+        (
+            f"quality, {args.segments} segments",
+            lambda filename: SegmentedFFMpegWriter(
+                filename,
+                args.width,
+                args.height,
+                args.framerate,
+                num_segments=args.segments,
+                frames_per_segment=max(1, num_frames // args.segments),
+                profile="quality",
+            ),
+        )
+    )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, make_writer in cases:
+            filename = os.path.join(tmpdir, "bench.mp4")
+            try:
+                elapsed = encode(make_writer(filename), frames, repeat)
+            except RuntimeError as e:
+                print(f"{name:22s} skipped: {str(e).splitlines()[0]}")
+                continue
+            size = os.path.getsize(filename) / 2**20
+            print(f"{name:22s} {num_frames / elapsed:8.1f} fps  {size:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark MuJoCo mesh to vtkPolyData conversion.
+
+Compares the per-face vtkTriangle loop that mj_mesh_to_vtk_polydata used to run
+against the current numpy connectivity path on a generated high-poly mesh.
+
+Usage:
+    python benchmarks/bench_mujoco_mesh.py [--faces 1000000]
+"""
+
+import argparse
+import time
+import types
+
+import numpy as np
+
+import director.vtkAll as vtk
+import director.vtkNumpy as vnp
+from director.mujoco_model import mj_mesh_to_vtk_polydata
+
+
+def make_grid_mesh(num_faces):
+    """Return vertices and faces of a closed slab built from a triangulated grid."""
+    n = max(2, int(np.sqrt(num_faces / 4)) + 1)
+    x, y = np.meshgrid(np.linspace(0, 1, n), np.linspace(0, 1, n))
+    top = np.column_stack([x.ravel(), y.ravel(), np.full(n * n, 0.1)])
+    bottom = top.copy()
+    bottom[:, 2] = 0.0
+    vertices = np.vstack([top, bottom])
+
+    ids = np.arange(n * n).reshape(n, n)
+    a, b, c, d = ids[:-1, :-1].ravel(), ids[:-1, 1:].ravel(), ids[1:, :-1].ravel(), ids[1:, 1:].ravel()
+    top_faces = np.vstack([np.column_stack([a, b, d]), np.column_stack([a, d, c])])
+    bottom_faces = top_faces[:, ::-1] + n * n
+    faces = np.vstack([top_faces, bottom_faces])
+    return vertices, faces
+
+
+def make_model(vertices, faces):
+    """Return an object exposing the MjModel mesh fields read by mj_mesh_to_vtk_polydata.
+
+    Compiling a million-face mesh with MuJoCo takes minutes, so the benchmark fills in
+    the mesh arrays directly using the same layout and dtypes as MjModel.
+    """
+    edges = vertices[faces[:, 1]] - vertices[faces[:, 0]], vertices[faces[:, 2]] - vertices[faces[:, 0]]
+    face_normals = np.cross(*edges)
+    face_normals /= np.linalg.norm(face_normals, axis=1)[:, np.newaxis]
+    return types.SimpleNamespace(
+        nmesh=1,
+        mesh_vertadr=np.array([0]),
+        mesh_vertnum=np.array([len(vertices)]),
+        mesh_vert=vertices.astype(np.float32),
+        mesh_faceadr=np.array([0]),
+        mesh_facenum=np.array([len(faces)]),
+        mesh_face=faces.astype(np.int32),
+        mesh_normaladr=np.array([0]),
+        mesh_normalnum=np.array([len(faces)]),
+        mesh_normal=face_normals.astype(np.float32),
+        mesh_facenormal=np.repeat(np.arange(len(faces), dtype=np.int32), 3).reshape(-1, 3),
+    )
+
+
+def mj_mesh_to_vtk_polydata_loop(model, mesh_id):
+    """The previous implementation, building one vtkTriangle per face."""
+    vert_start = model.mesh_vertadr[mesh_id]
+    vert_count = model.mesh_vertnum[mesh_id]
+    vertices = model.mesh_vert[vert_start : vert_start + vert_count]
+    face_start = model.mesh_faceadr[mesh_id]
+    face_count = model.mesh_facenum[mesh_id]
+    faces = model.mesh_face[face_start : face_start + face_count]
+
+    polyData = vnp.numpyToPolyData(vertices, createVertexCells=False)
+    cells = vtk.vtkCellArray()
+    for face in faces:
+        triangle = vtk.vtkTriangle()
+        triangle.GetPointIds().SetId(0, int(face[0]))
+        triangle.GetPointIds().SetId(1, int(face[1]))
+        triangle.GetPointIds().SetId(2, int(face[2]))
+        cells.InsertNextCell(triangle)
+    polyData.SetPolys(cells)
+    return polyData
+
+
+def timeit(func, *args):
+    t0 = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--faces", type=int, default=1_000_000, help="approximate number of mesh faces")
+    args = parser.parse_args()
+
+    print(f"building mesh with ~{args.faces} faces...")
+    model = make_model(*make_grid_mesh(args.faces))
+    print(f"model mesh: {model.mesh_vertnum[0]} vertices, {model.mesh_facenum[0]} faces")
+
+    loop_polydata, loop_time = timeit(mj_mesh_to_vtk_polydata_loop, model, 0)
+    numpy_polydata, numpy_time = timeit(mj_mesh_to_vtk_polydata, model, 0)
+
+    assert loop_polydata.GetNumberOfCells() == numpy_polydata.GetNumberOfCells()
+    assert numpy_polydata.GetPointData().GetNormals() is not None
+
+    print(f"vtkTriangle loop:   {loop_time:8.3f} s")
+    print(f"numpy connectivity: {numpy_time:8.3f} s (includes normals)")
+    print(f"speedup:            {loop_time / numpy_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark numpy point cloud to vtkPolyData conversion.
+
+Compares the previous numpyToPolyData implementation, which copied the points and
+point data and created vertex cells with vtkVertexGlyphFilter, against the current
+copy=True and zero-copy copy=False modes.
+
+Usage:
+    python benchmarks/bench_numpy_to_polydata.py [--points 5000000] [--repeat 5]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+import director.vtkAll as vtk
+import director.vtkNumpy as vnp
+from director.shallowCopy import shallowCopy
+
+
+def numpy_to_polydata_glyph_filter(pts, pointData=None):
+    """The previous implementation, creating vertex cells with vtkVertexGlyphFilter."""
+    pd = vtk.vtkPolyData()
+    pd.SetPoints(vnp.getVtkPointsFromNumpy(pts.copy()))
+    if pointData is not None:
+        for key, value in list(pointData.items()):
+            vnp.addNumpyToVtk(pd, value.copy(), key)
+    f = vtk.vtkVertexGlyphFilter()
+    f.SetInputData(pd)
+    f.Update()
+    return shallowCopy(f.GetOutput())
+
+
+def best_time(func, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - t0)
+    return result, min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--points", type=int, default=5_000_000, help="number of points")
+    parser.add_argument("--repeat", type=int, default=5, help="number of timed runs, the best is reported")
+    args = parser.parse_args()
+
+    pts = np.random.rand(args.points, 3).astype(np.float32)
+    pointData = {"intensity": np.random.rand(args.points).astype(np.float32)}
+    print(f"{args.points} points with one point data array")
+
+    results = {}
+    for name, func in [
+        ("vtkVertexGlyphFilter", lambda: numpy_to_polydata_glyph_filter(pts, pointData)),
+        ("copy=True", lambda: vnp.numpyToPolyData(pts, pointData)),
+        ("copy=False", lambda: vnp.numpyToPolyData(pts, pointData, copy=False)),
+    ]:
+        polyData, elapsed = best_time(func, args.repeat)
+        assert polyData.GetNumberOfVerts() == args.points
+        results[name] = elapsed
+
+    baseline = results["vtkVertexGlyphFilter"]
+    for name, elapsed in results.items():
+        print(f"{name:22s} {elapsed * 1000:9.1f} ms  {baseline / elapsed:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark adding and removing many object model items.
+
+Compares adding and removing items one at a time against doing the same inside
+om.batch(), which makes the changes inside a single item model reset with the
+model's signals blocked, so the sort proxy and tree view rebuild once instead of
+updating for every row.
+
+Usage:
+    python benchmarks/bench_objectmodel_batch.py [--items 10000]
+"""
+
+import argparse
+import os
+import time
+
+from qtpy.QtWidgets import QApplication, QTreeView
+
+from director.objectmodel import ObjectModelItem, ObjectModelTree
+
+
+def add_and_remove(tree, num_items, batch):
+    """Return (add seconds, remove seconds) for num_items items under one folder."""
+    items = [ObjectModelItem(f"item {i}") for i in range(num_items)]
+
+    t0 = time.perf_counter()
+    with tree.batch() if batch else _noop():
+        folder = tree.addContainer("folder")
+        for item in items:
+            tree.addToObjectModel(item, folder)
+    add_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    with tree.batch() if batch else _noop():
+        for item in items:
+            tree.removeFromObjectModel(item)
+        tree.removeFromObjectModel(folder)
+    remove_time = time.perf_counter() - t0
+    return add_time, remove_time
+
+
+class _noop:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=10_000, help="number of items to add and remove")
+    args = parser.parse_args()
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QApplication.instance() or QApplication([])
+
+    results = {}
+    for name, batch in [("one at a time", False), ("om.batch()", True)]:
+        tree = ObjectModelTree()
+        tree_view = QTreeView()
+        tree.init(tree_view)
+        tree_view.show()
+        app.processEvents()
+        results[name] = add_and_remove(tree, args.items, batch)
+
+    print(f"{args.items} items")
+    for name, (add_time, remove_time) in results.items():
+        print(f"{name:14s} add {add_time * 1000:9.1f} ms   remove {remove_time * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Benchmark level of detail rendering of long time series in PlotWidget.
+
+Adds series with a total of --samples samples to a PlotWidget, then pans and
+zooms the plot through random x ranges, painting the widget after each change.
+Reports the time to add the data, which includes building the min/max
+pyramids, and the time per pan or zoom step.
+
+Usage:
+    python benchmarks/bench_plot_lod.py [--samples 100000000] [--series 4] [--steps 50]
+"""
+
+import argparse
+import time
+
+import numpy as np
+from qtpy.QtWidgets import QApplication
+
+from director.plot_widget import PlotWidget
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--samples", type=int, default=20_000_000, help="total samples over all series")
+    parser.add_argument("--series", type=int, default=4)
+    parser.add_argument("--steps", type=int, default=50)
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])
+    plot_widget = PlotWidget()
+    widget = plot_widget.plot_widget
+    widget.resize(1600, 900)
+    widget.show()
+    app.processEvents()
+
+    samples_per_series = args.samples // args.series
+    t = np.arange(samples_per_series) * 0.001
+    rng = np.random.default_rng(0)
+    values = np.cumsum(rng.normal(size=(samples_per_series, args.series)), axis=0)
+
+    start = time.perf_counter()
+    plot_item = plot_widget.add_plot(title="Telemetry")
+    plot_widget.add_data_to_plot(plot_item, t, [("signal", values)])
+    app.processEvents()
+    add_time = time.perf_counter() - start
+    print(f"{args.series} series x {samples_per_series} samples, add data: {add_time:.2f} s")
+
+    duration = t[-1]
+    step_times = []
+    for _ in range(args.steps):
+        width = duration * 10 ** rng.uniform(-5, 0)
+        x_min = rng.uniform(0, duration - width)
+        start = time.perf_counter()
+        plot_item.setXRange(x_min, x_min + width, padding=0)
+        widget.repaint()
+        app.processEvents()
+        step_times.append(time.perf_counter() - start)
+
+    step_times = np.array(step_times) * 1000
+    print(
+        f"pan/zoom step: mean {step_times.mean():.1f} ms  p50 {np.percentile(step_times, 50):.1f} ms  "
+        f"max {step_times.max():.1f} ms"
+    )
+    widget.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark slider driven playhead updates across many docked plots.
+
+Creates --plots docked plots with --series series each, then steps the time
+through the data and reports the time per step spent in the PlotWidget
+time-changed handler. With --slider the time is set on a TimestampSlider
+connected to the PlotWidget, otherwise the handler is called directly and the
+auto scroll logic uses the time range of the plotted data.
+
+Usage:
+    python benchmarks/bench_plot_scrub.py [--plots 40] [--series 4] [--steps 500] [--slider]
+"""
+
+import argparse
+import time
+
+import numpy as np
+from qtpy.QtWidgets import QApplication
+
+from director.plot_widget import PlotWidget
+from director.timestamp_slider import TimestampSlider
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--plots", type=int, default=40)
+    parser.add_argument("--series", type=int, default=4)
+    parser.add_argument("--samples", type=int, default=100_000, help="samples per series")
+    parser.add_argument("--steps", type=int, default=500)
+    parser.add_argument("--slider", action="store_true", help="drive updates from a TimestampSlider")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    plot_widget = PlotWidget()
+    widget = plot_widget.plot_widget
+    widget.resize(1600, 1200)
+
+    duration_s = args.samples * 0.001
+    t = np.arange(args.samples) * 0.001
+    rng = np.random.default_rng(0)
+    for i in range(args.plots):
+        plot_item = plot_widget.add_plot(title=f"plot {i}")
+        values = np.cumsum(rng.normal(size=(args.samples, args.series)), axis=0)
+        plot_widget.add_data_to_plot(plot_item, t, [("signal", values)])
+
+    slider = None
+    if args.slider:
+        slider = TimestampSlider(0.0, duration_s)
+        plot_widget.connect_time_slider(slider)
+
+    plot_widget.get_plots()[0].setXRange(0.0, duration_s / 20, padding=0)
+
+    step_times = []
+    for timestamp_s in np.linspace(0.0, duration_s, args.steps):
+        start = time.perf_counter()
+        if slider:
+            slider.set_time(timestamp_s)
+        else:
+            plot_widget._on_time_slider_changed(timestamp_s)
+        step_times.append(time.perf_counter() - start)
+
+    step_times = np.array(step_times) * 1000
+    print(
+        f"{args.plots} plots x {args.series} series, {args.steps} steps: mean {step_times.mean():.2f} ms  "
+        f"p95 {np.percentile(step_times, 95):.2f} ms  max {step_times.max():.2f} ms"
+    )
+    widget.close()
+
+
+if __name__ == "__main__":
+    main()
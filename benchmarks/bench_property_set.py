@@ -0,0 +1,197 @@
+"""Benchmark PropertySet construction time and memory.
+
+Creates many PropertySets and ObjectModelItems with a typical set of display
+properties and reports the construction time and the memory allocated per
+instance, as measured by tracemalloc. PropertySets are also built with
+BaselinePropertySet, a copy of the construction path of PropertySet before it
+used slots and shared default attributes, so both are reported side by side.
+Both use the current CallbackRegistry.
+
+Usage:
+    python benchmarks/bench_property_set.py [--count 20000]
+"""
+
+import argparse
+import gc
+import re
+import time
+import tracemalloc
+from collections import OrderedDict
+
+from director import callbacks
+from director.objectmodel import ObjectModelItem
+from director.propertyset import PropertyAttributes, PropertySet
+
+# ----------------------------------------------------------------------
+# Baseline implementation, copied from director.propertyset before slots
+# and shared default attributes. Only the construction path is kept.
+# ----------------------------------------------------------------------
+
+
+def baselineCleanPropertyName(s):
+    return re.sub(r"\W|^(?=\d)", "_", s).lower()
+
+
+class BaselinePropertyAttributes(object):
+    _FIELDS = PropertyAttributes._FIELDS
+
+    def __init__(self, **kwargs):
+        defaults = {
+            "decimals": 5,
+            "minimum": -1e4,
+            "maximum": 1e4,
+            "singleStep": 1,
+            "hidden": False,
+            "enumNames": None,
+            "readOnly": False,
+        }
+        defaults.update(kwargs)
+        for field in self._FIELDS:
+            setattr(self, field, defaults.get(field))
+
+
+def baselineFromQColor(propertyName, propertyValue):
+    from qtpy import QtGui
+
+    if isinstance(propertyValue, QtGui.QColor):
+        return [propertyValue.red() / 255.0, propertyValue.green() / 255.0, propertyValue.blue() / 255.0]
+    else:
+        return propertyValue
+
+
+class BaselinePropertySet(object):
+    PROPERTY_CHANGED_SIGNAL = "PROPERTY_CHANGED_SIGNAL"
+    PROPERTY_ADDED_SIGNAL = "PROPERTY_ADDED_SIGNAL"
+    PROPERTY_REMOVED_SIGNAL = "PROPERTY_REMOVED_SIGNAL"
+    PROPERTY_ATTRIBUTE_CHANGED_SIGNAL = "PROPERTY_ATTRIBUTE_CHANGED_SIGNAL"
+
+    def __init__(self):
+        self.callbacks = callbacks.CallbackRegistry(
+            [
+                self.PROPERTY_CHANGED_SIGNAL,
+                self.PROPERTY_ADDED_SIGNAL,
+                self.PROPERTY_REMOVED_SIGNAL,
+                self.PROPERTY_ATTRIBUTE_CHANGED_SIGNAL,
+            ]
+        )
+
+        self._properties = OrderedDict()
+        self._attributes = {}
+        self._alternateNames = {}
+
+    def addProperty(self, propertyName, propertyValue, attributes=None):
+        alternateName = baselineCleanPropertyName(propertyName)
+        if propertyName not in self._properties and alternateName in self._alternateNames:
+            raise ValueError(f"Adding this property would conflict with alternate name {alternateName}")
+        attrs = attributes if attributes is not None else BaselinePropertyAttributes()
+        value = baselineFromQColor(propertyName, propertyValue)
+        if hasattr(value, "tolist"):
+            value = value.tolist()
+        if isinstance(value, (list, tuple)):
+            value = tuple(value)
+        self._properties[propertyName] = value
+        self._attributes[propertyName] = attrs
+        self._alternateNames[alternateName] = propertyName
+        self.callbacks.process(self.PROPERTY_ADDED_SIGNAL, self, propertyName)
+
+    def getProperty(self, propertyName):
+        return self._properties[propertyName]
+
+    def setProperty(self, propertyName, propertyValue):
+        if propertyValue != self._properties[propertyName]:
+            self._properties[propertyName] = propertyValue
+            self.callbacks.process(self.PROPERTY_CHANGED_SIGNAL, self, propertyName)
+
+    def __getattribute__(self, name):
+        try:
+            return object.__getattribute__(self, name)
+        except AttributeError as exc:
+            alternateNames = object.__getattribute__(self, "_alternateNames")
+            if name in alternateNames:
+                return object.__getattribute__(self, "getProperty")(alternateNames[name])
+            else:
+                raise exc
+
+    def __setattr__(self, name, value):
+        if name.startswith("_") or name in ["callbacks", "_properties", "_attributes", "_alternateNames"]:
+            object.__setattr__(self, name, value)
+            return
+
+        try:
+            object.__getattribute__(self, name)
+            object.__setattr__(self, name, value)
+            return
+        except AttributeError:
+            try:
+                alternateNames = object.__getattribute__(self, "_alternateNames")
+                if name in alternateNames:
+                    propertyName = alternateNames[name]
+                    object.__getattribute__(self, "setProperty")(propertyName, value)
+                    return
+                else:
+                    raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+            except AttributeError:
+                object.__setattr__(self, name, value)
+
+
+def make_property_set(i, propertySetClass=PropertySet, attributesClass=PropertyAttributes):
+    properties = propertySetClass()
+    properties.addProperty("Name", f"marker {i}", attributes=attributesClass(hidden=True))
+    properties.addProperty("Visible", True)
+    properties.addProperty("Alpha", 1.0, attributes=attributesClass(decimals=2, minimum=0.0, maximum=1.0))
+    properties.addProperty("Color", [1.0, 1.0, 1.0])
+    properties.addProperty("Point Size", 2, attributes=attributesClass(minimum=1, maximum=20))
+    return properties
+
+
+def make_baseline_property_set(i):
+    return make_property_set(i, BaselinePropertySet, BaselinePropertyAttributes)
+
+
+def make_item(i):
+    item = ObjectModelItem(f"marker {i}")
+    item.addProperty("Visible", True)
+    item.addProperty("Alpha", 1.0, attributes=PropertyAttributes(decimals=2, minimum=0.0, maximum=1.0))
+    item.addProperty("Color", [1.0, 1.0, 1.0])
+    return item
+
+
+def measure(factory, count):
+    """Return (seconds, bytes) per instance for creating count instances."""
+    gc.collect()
+    t0 = time.perf_counter()
+    instances = [factory(i) for i in range(count)]
+    elapsed = time.perf_counter() - t0
+    del instances
+
+    gc.collect()
+    tracemalloc.start()
+    instances = [factory(i) for i in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return elapsed / count, size / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=20000, help="number of instances to create")
+    args = parser.parse_args()
+
+    print(f"{args.count} instances")
+    results = {}
+    for label, factory in (
+        ("baseline", make_baseline_property_set),
+        ("PropertySet", make_property_set),
+        ("ObjectModelItem", make_item),
+    ):
+        seconds, size = measure(factory, args.count)
+        results[label] = seconds, size
+        print(f"{label:16s} {seconds * 1e6:8.2f} us   {size / 1024:6.2f} KiB per instance")
+
+    (base_seconds, base_size), (seconds, size) = results["baseline"], results["PropertySet"]
+    print(f"PropertySet vs baseline: {base_seconds / seconds:.2f}x faster, {base_size / size:.2f}x less memory")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import time
 import types
 from weakref import ref
 
@@ -54,11 +55,20 @@ class CallbackRegistry:
         *signals* a sequence of signal names, or None if not providing
         any validation on connect.
         """
-        self.signals = set(signals) if signals is not None else None
+        # frozenset() returns a frozenset argument as is, so registries can share one
+        self.signals = frozenset(signals) if signals is not None else None
         # mapping from signal to a set of proxy objects for callbacks
         self.callbacks = dict()
         # proxy objects for callbacks (so we can use weak references)
         self._proxy_objs = dict()
+        # mapping from id(proxy) to proxy, used to disconnect without a scan
+        self._proxies_by_id = dict()
+        # mapping from signal to an immutable tuple of proxies to call, rebuilt
+        # lazily after a connect or disconnect changes the signal's callbacks
+        self._dispatch = dict()
+        # mapping from signal to [emission count, total seconds], or None when
+        # profiling is disabled
+        self._stats = None
 
     def __del__(self):
         # Just in case there are any lingering references
@@ -83,10 +93,12 @@ class CallbackRegistry:
                 raise ValueError("Unknown signal: %s" % sig)
             if sig not in self.callbacks:
                 self.callbacks[sig] = set()
-            if func not in self._proxy_objs:
-                self._proxy_objs[func] = self._BoundMethodProxy(func)
-            proxy = self._proxy_objs[func]
+            proxy = self._proxy_objs.get(func)
+            if proxy is None:
+                proxy = self._proxy_objs[func] = self._BoundMethodProxy(func)
+                self._proxies_by_id[id(proxy)] = proxy
             self.callbacks[sig].add(proxy)
+            self._dispatch.pop(sig, None)
             callback_ids.append((sig, id(proxy)))
         # return the id of the proxy object, not the function itself
         return callback_ids[0] if len(callback_ids) == 1 else callback_ids
@@ -97,22 +109,19 @@ class CallbackRegistry:
         """
         if not isinstance(callback_ids, list):
             callback_ids = [callback_ids]
-        for callback_id in callback_ids:
-            if isinstance(callback_id, tuple):
-                signal, proxy_id = callback_id
-            else:
-                # Assume it's a single signal callback id
-                signal, proxy_id = callback_id
-            if signal in self.callbacks:
-                for proxy in list(self.callbacks[signal]):
-                    if id(proxy) == proxy_id:
-                        self.callbacks[signal].discard(proxy)
-                        break
+        for signal, proxy_id in callback_ids:
+            proxies = self.callbacks.get(signal)
+            proxy = self._proxies_by_id.get(proxy_id)
+            if proxies is not None and proxy is not None:
+                proxies.discard(proxy)
+                self._dispatch.pop(signal, None)
 
     def disconnect_all(self):
         """Disconnect all callbacks registered in this registry."""
         self.callbacks.clear()
         self._proxy_objs.clear()
+        self._proxies_by_id.clear()
+        self._dispatch.clear()
 
     def process(self, signal, *args, **kwargs):
         """
@@ -121,17 +130,62 @@ class CallbackRegistry:
         All functions registered to receive this signal will be called
         with *args* and **kwargs*.
         """
-        if signal not in self.callbacks:
-            return
-        # don't iterate directly over the set in case callbacks disconnect
-        # during iteration
-        for proxy in list(self.callbacks[signal]):
-            # wrap in try/except so if a callback function throws we'll
-            # be able to remove the dead proxy
+        # the dispatch tuple is immutable, so callbacks may connect or
+        # disconnect during iteration
+        proxies = self._dispatch.get(signal)
+        if proxies is None:
+            if signal not in self.callbacks:
+                return
+            proxies = self._dispatch[signal] = tuple(self.callbacks[signal])
+
+        if self._stats is not None:
+            start_time = time.perf_counter()
+
+        dead = None
+        for proxy in proxies:
+            # catch ReferenceError so we'll be able to remove the dead proxy
             try:
                 proxy(*args, **kwargs)
             except ReferenceError:
+                dead = [proxy] if dead is None else dead + [proxy]
+
+        if dead is not None:
+            for proxy in dead:
                 self.callbacks[signal].discard(proxy)
+            self._dispatch.pop(signal, None)
+
+        if self._stats is not None:
+            stats = self._stats.setdefault(signal, [0, 0.0])
+            stats[0] += 1
+            stats[1] += time.perf_counter() - start_time
+
+    def set_profiling_enabled(self, enabled):
+        """
+        Enable or disable counting emissions and timing the callbacks of each
+        signal. Disabling profiling discards the collected statistics.
+        """
+        if enabled and self._stats is None:
+            self._stats = dict()
+        elif not enabled:
+            self._stats = None
+
+    def is_profiling_enabled(self):
+        return self._stats is not None
+
+    def get_signal_stats(self):
+        """
+        Return a dict mapping each emitted signal name to a dict with the
+        number of emissions and the total seconds spent in its callbacks.
+        """
+        if self._stats is None:
+            return {}
+        return {
+            signal: {"count": count, "total_time": total_time} for signal, (count, total_time) in self._stats.items()
+        }
+
+    def reset_signal_stats(self):
+        if self._stats is not None:
+            self._stats.clear()
 
     class _BoundMethodProxy(object):
         """
@@ -140,6 +194,8 @@ class CallbackRegistry:
         http://mindtrove.info/articles/python-weak-references/
         """
 
+        __slots__ = ("_obj", "_func", "_class", "__weakref__")
+
         def __init__(self, callback):
             if isinstance(callback, types.MethodType):
                 # callback is bound method
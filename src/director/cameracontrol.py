@@ -57,7 +57,7 @@ class Flyer(TimerCallback):
         t = (elapsed / float(self.flyTime)) if self.flyTime > 0 else 1.0
 
         self.interp.InterpolateCamera(t, self.view.camera())
-        self.view.render()
+        self.view.render(interactive=True)
 
         if t >= 1.0:
             return False
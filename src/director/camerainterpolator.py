@@ -138,7 +138,7 @@ class CameraInterpolator:
 
         result = transformUtils.frameInterpolate(self.pose1, self.pose2, t)
         setCameraTransform(self.view.camera(), result)
-        self.view.render()
+        self.view.render(interactive=True)
 
         if t >= 1.0:
             return False
@@ -303,7 +303,7 @@ class CameraInteractor(ViewEventFilter):
         def f(newFocal):
             self.view.camera().SetFocalPoint(newFocal[:3])
             self.view.camera().SetPosition(newFocal[:3] - lookVector * newFocal[3])
-            self.view.render()
+            self.view.render(interactive=True)
 
         focalPoint = np.array([*focalPoint, length])
         targetPosition = np.array([*targetPosition, length * (1 - self.zoom)])
@@ -1,9 +1,56 @@
 """FFMpegWriter class for encoding video from numpy RGB frames."""
 
+import collections
+import os
+import queue
+import shutil
 import subprocess
+import tempfile
+import threading
 
 import numpy as np
 
+# Output encoding options for each encoder profile, passed to ffmpeg after the input options.
+ENCODER_PROFILES = {
+    # High quality, slower than real time at 1080p60 on most machines
+    "quality": ["-vcodec", "libx264", "-preset", "slow", "-crf", "18", "-pix_fmt", "yuv420p"],
+    # Good quality at several times the speed of 'quality'
+    "fast": ["-vcodec", "libx264", "-preset", "veryfast", "-crf", "20", "-pix_fmt", "yuv420p"],
+    # Fastest software encoding, for keeping up with live capture
+    "realtime": [
+        "-vcodec",
+        "libx264",
+        "-preset",
+        "ultrafast",
+        "-tune",
+        "zerolatency",
+        "-crf",
+        "23",
+        "-pix_fmt",
+        "yuv420p",
+    ],
+    # Lossless intermediate for transcoding later, produces large files
+    "lossless": ["-vcodec", "libx264", "-preset", "ultrafast", "-qp", "0", "-pix_fmt", "yuv444p"],
+    # NVIDIA hardware encoder, requires an ffmpeg build with nvenc support
+    "nvenc": ["-vcodec", "h264_nvenc", "-preset", "p4", "-cq", "19", "-pix_fmt", "yuv420p"],
+}
+
+
+def _start_stderr_reader(process, max_lines=200):
+    """
+    Read the process's stderr on a daemon thread so ffmpeg never blocks on a full
+    pipe. Returns a deque that holds the last max_lines lines.
+    """
+    lines = collections.deque(maxlen=max_lines)
+
+    def read():
+        for line in process.stderr:
+            lines.append(line.decode("utf-8", errors="ignore").rstrip())
+
+    thread = threading.Thread(target=read, name="ffmpeg-stderr", daemon=True)
+    thread.start()
+    return lines, thread
+
 
 class FFMpegWriter:
     """Writer for encoding video files using ffmpeg from numpy RGB frames."""
@@ -18,6 +65,8 @@ class FFMpegWriter:
         preset: str = "slow",
         crf: int = 18,
         pix_fmt_output: str = "yuv420p",
+        flip_vertical: bool = False,
+        profile: str | None = None,
     ):
         """
         Initialize FFMpegWriter.
@@ -31,6 +80,10 @@ class FFMpegWriter:
             preset: Encoding preset (default: 'slow')
             crf: Constant Rate Factor, lower is higher quality (default: 18)
             pix_fmt_output: Output pixel format (default: 'yuv420p')
+            flip_vertical: Flip frames vertically in ffmpeg, so frames read back from
+                           OpenGL (bottom row first) can be written without a copy
+            profile: Name of an ENCODER_PROFILES entry. If given, replaces vcodec,
+                     preset, crf and pix_fmt_output (default: None)
         """
         self.filename = filename
         self.width = width
@@ -59,17 +112,17 @@ class FFMpegWriter:
             str(framerate),
             "-i",
             "-",  # Read from stdin
-            # Output encoding options
-            "-vcodec",
-            vcodec,
-            "-preset",
-            preset,
-            "-crf",
-            str(crf),
-            "-pix_fmt",
-            pix_fmt_output,
-            filename,
         ]
+        if flip_vertical:
+            cmd += ["-vf", "vflip"]
+        # Output encoding options
+        if profile is not None:
+            if profile not in ENCODER_PROFILES:
+                raise ValueError(f"Unknown encoder profile '{profile}', expected one of {list(ENCODER_PROFILES)}")
+            cmd += ENCODER_PROFILES[profile]
+        else:
+            cmd += ["-vcodec", vcodec, "-preset", preset, "-crf", str(crf), "-pix_fmt", pix_fmt_output]
+        cmd.append(filename)
 
         print("Starting ffmpeg process:", " ".join(cmd))
         # Start ffmpeg process
@@ -77,15 +130,21 @@ class FFMpegWriter:
             self.process = subprocess.Popen(
                 cmd,
                 stdin=subprocess.PIPE,
-                # stdout=subprocess.PIPE,
-                # stderr=subprocess.PIPE,
-                bufsize=0,  # Unbuffered for real-time streaming
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
             )
         except FileNotFoundError:
             raise RuntimeError("ffmpeg not found. Please install ffmpeg to use FFMpegWriter.")
         except Exception as e:
             raise RuntimeError(f"Failed to start ffmpeg process: {e}")
 
+        # ffmpeg writes progress to stderr, which would fill the pipe if nothing read it
+        self._stderr_lines, self._stderr_thread = _start_stderr_reader(self.process)
+
+    def stderr_output(self) -> str:
+        """Return the last lines ffmpeg wrote to stderr."""
+        return "\n".join(self._stderr_lines)
+
     def write_frame(self, frame: np.ndarray):
         """
         Write a single RGB frame to the video.
@@ -115,14 +174,15 @@ class FFMpegWriter:
         if not frame.flags["C_CONTIGUOUS"]:
             frame = np.ascontiguousarray(frame)
 
-        # Write frame to stdin
+        # Write frame to stdin. A frame is larger than the pipe's buffer, so the
+        # buffered writer passes the memoryview straight to the pipe without a copy.
         try:
-            self.process.stdin.write(frame.tobytes())
-            self.process.stdin.flush()
+            self.process.stdin.write(memoryview(frame).cast("B"))
         except BrokenPipeError:
             # Process may have terminated due to error
-            stderr_output = self.process.stderr.read().decode("utf-8", errors="ignore")
-            raise RuntimeError(f"FFMpeg process terminated unexpectedly. Error: {stderr_output}")
+            self.process.wait()
+            self._stderr_thread.join()
+            raise RuntimeError(f"FFMpeg process terminated unexpectedly. Error: {self.stderr_output()}")
         except Exception as e:
             raise RuntimeError(f"Error writing frame to ffmpeg: {e}")
 
@@ -142,11 +202,12 @@ class FFMpegWriter:
 
             # Wait for process to finish and get return code
             return_code = self.process.wait()
+            self._stderr_thread.join()
 
             if return_code != 0:
-                # Read stderr for error messages
-                stderr_output = self.process.stderr.read().decode("utf-8", errors="ignore")
-                raise RuntimeError(f"FFMpeg process exited with code {return_code}. Error output: {stderr_output}")
+                raise RuntimeError(
+                    f"FFMpeg process exited with code {return_code}. Error output: {self.stderr_output()}"
+                )
         except Exception as e:
             raise RuntimeError(f"Error closing FFMpegWriter: {e}")
         finally:
@@ -161,3 +222,257 @@ class FFMpegWriter:
         """Context manager exit - ensures close is called."""
         self.close()
         return False
+
+
+class ThreadedFrameWriter:
+    """
+    Write frames to a writer, such as FFMpegWriter, on a background thread.
+
+    write_frame() puts the frame on a bounded queue and returns immediately. A
+    worker thread takes frames off the queue and writes them. When the queue is
+    full, the "block" policy waits for space and the "drop" policy discards the
+    new frame. Frames are queued by reference, so the caller must not modify a
+    frame after passing it to write_frame().
+    """
+
+    POLICIES = ("block", "drop")
+
+    def __init__(self, writer, max_queue_size: int = 16, policy: str = "block"):
+        """
+        Initialize ThreadedFrameWriter and start its worker thread.
+
+        Args:
+            writer: Object with write_frame(frame) and close() methods
+            max_queue_size: Maximum number of frames waiting to be written (default: 16)
+            policy: 'block' or 'drop', what to do when the queue is full (default: 'block')
+        """
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown policy '{policy}', expected one of {self.POLICIES}")
+        self.writer = writer
+        self.policy = policy
+        self.frames_captured = 0
+        self.frames_encoded = 0
+        self.frames_dropped = 0
+        self._queue = queue.Queue(maxsize=max_queue_size)
+        self._error = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="ThreadedFrameWriter", daemon=True)
+        self._thread.start()
+
+    def write_frame(self, frame: np.ndarray):
+        """
+        Queue a frame to be written.
+
+        Raises:
+            RuntimeError: If the writer is closed or the worker thread failed
+        """
+        if self._closed:
+            raise RuntimeError("ThreadedFrameWriter is closed. Cannot write more frames.")
+        self._raise_error()
+
+        self.frames_captured += 1
+        if self.policy == "drop":
+            try:
+                self._queue.put_nowait(frame)
+            except queue.Full:
+                self.frames_dropped += 1
+        else:
+            self._queue.put(frame)
+
+    def get_stats(self):
+        """Return a dict with the frames captured, encoded and dropped, and the current queue depth."""
+        return {
+            "frames_captured": self.frames_captured,
+            "frames_encoded": self.frames_encoded,
+            "frames_dropped": self.frames_dropped,
+            "queue_depth": self._queue.qsize(),
+        }
+
+    def close(self):
+        """Write the remaining queued frames, stop the worker thread and close the writer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        try:
+            self.writer.close()
+        finally:
+            self._raise_error()
+
+    def _run(self):
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                return
+            if self._error is not None:
+                # keep draining so a blocked producer can make progress
+                continue
+            try:
+                self.writer.write_frame(frame)
+                self.frames_encoded += 1
+            except Exception as e:
+                self._error = e
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise RuntimeError(f"Error writing frame on background thread: {self._error}")
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - ensures close is called."""
+        self.close()
+        return False
+
+
+def _quote_concat_path(path: str) -> str:
+    """Quote a path for an ffmpeg concat list, where a ' inside quotes is written as '\\''."""
+    return "'" + path.replace("'", "'\\''") + "'"
+
+
+class SegmentedFFMpegWriter:
+    """
+    Encode a video as consecutive segments with several ffmpeg processes in
+    parallel, then concatenate the segments into the output file.
+
+    Every frames_per_segment frames start a new segment with its own ffmpeg
+    process, fed from a ThreadedFrameWriter. Up to num_segments segments encode
+    at the same time; when all are busy, write_frame() waits for the oldest one
+    to finish. This needs memory for up to num_segments * frames_per_segment
+    queued frames when the caller produces frames faster than ffmpeg encodes.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        width: int,
+        height: int,
+        framerate: float = 30.0,
+        num_segments: int = 4,
+        frames_per_segment: int = 120,
+        **writer_kwargs,
+    ):
+        """
+        Initialize SegmentedFFMpegWriter.
+
+        Args:
+            filename: Output video filename (e.g., 'output.mp4')
+            width: Video width in pixels
+            height: Video height in pixels
+            framerate: Frame rate in fps (default: 30.0)
+            num_segments: Maximum number of segments encoding at once (default: 4)
+            frames_per_segment: Number of frames in each segment (default: 120)
+            writer_kwargs: Additional FFMpegWriter arguments, such as profile or flip_vertical
+        """
+        self.filename = filename
+        self.width = width
+        self.height = height
+        self.framerate = framerate
+        self.num_segments = num_segments
+        self.frames_per_segment = frames_per_segment
+        self.writer_kwargs = writer_kwargs
+        self._closed = False
+
+        self._segment_dir = tempfile.mkdtemp(prefix="segments_", dir=os.path.dirname(os.path.abspath(filename)))
+        self._segment_filenames = []
+        self._current = None
+        self._current_frames = 0
+        # (closer thread, list to receive its exception) for segments still encoding
+        self._encoding = collections.deque()
+
+    def write_frame(self, frame: np.ndarray):
+        """Write a single RGB frame to the current segment."""
+        if self._closed:
+            raise RuntimeError("SegmentedFFMpegWriter is closed. Cannot write more frames.")
+
+        if self._current is None:
+            self._start_segment()
+        self._current.write_frame(frame)
+        self._current_frames += 1
+        if self._current_frames == self.frames_per_segment:
+            self._finish_segment()
+
+    def close(self):
+        """Finish encoding all segments and concatenate them into the output file."""
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            if self._current is not None:
+                self._finish_segment()
+            while self._encoding:
+                self._wait_for_oldest_segment()
+            if self._segment_filenames:
+                self._concatenate()
+        finally:
+            # On errors, let the remaining segment writers exit before removing the files they write
+            self._join_segments()
+            shutil.rmtree(self._segment_dir, ignore_errors=True)
+
+    def _join_segments(self):
+        """Close the current segment and wait for every segment still encoding, ignoring errors."""
+        if self._current is not None:
+            try:
+                self._current.close()
+            except Exception:
+                pass
+            self._current = None
+        while self._encoding:
+            thread, _ = self._encoding.popleft()
+            thread.join()
+
+    def _start_segment(self):
+        while len(self._encoding) >= self.num_segments:
+            self._wait_for_oldest_segment()
+
+        extension = os.path.splitext(self.filename)[1] or ".mp4"
+        segment_filename = os.path.join(self._segment_dir, f"segment_{len(self._segment_filenames):05d}{extension}")
+        self._segment_filenames.append(segment_filename)
+        writer = FFMpegWriter(segment_filename, self.width, self.height, self.framerate, **self.writer_kwargs)
+        self._current = ThreadedFrameWriter(writer, max_queue_size=self.frames_per_segment, policy="block")
+        self._current_frames = 0
+
+    def _finish_segment(self):
+        """Close the current segment on a background thread so the next one can start."""
+        segment, errors = self._current, []
+
+        def close():
+            try:
+                segment.close()
+            except Exception as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=close, name="SegmentedFFMpegWriter", daemon=True)
+        thread.start()
+        self._encoding.append((thread, errors))
+        self._current = None
+
+    def _wait_for_oldest_segment(self):
+        thread, errors = self._encoding.popleft()
+        thread.join()
+        if errors:
+            raise RuntimeError(f"Error encoding video segment: {errors[0]}")
+
+    def _concatenate(self):
+        list_filename = os.path.join(self._segment_dir, "segments.txt")
+        with open(list_filename, "w") as f:
+            for segment_filename in self._segment_filenames:
+                f.write(f"file {_quote_concat_path(segment_filename)}\n")
+
+        cmd = ["ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", list_filename, "-c", "copy", self.filename]
+        result = subprocess.run(cmd, stdin=subprocess.DEVNULL, capture_output=True)
+        if result.returncode != 0:
+            stderr_output = result.stderr.decode("utf-8", errors="ignore")
+            raise RuntimeError(f"FFMpeg concat exited with code {result.returncode}. Error output: {stderr_output}")
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - ensures close is called."""
+        self.close()
+        return False
@@ -0,0 +1,157 @@
+"""HeadlessView class implementing the Director view API with an offscreen render window."""
+
+import time
+
+from director import vtkAll as vtk
+from director.render_stats import RenderStats, countScene
+from director.viewbounds import resetCameraToBounds
+
+
+class HeadlessView:
+    """
+    Offscreen view that provides the subset of the VTKWidget API used by
+    visualization, screen_recorder.capture_screenshot and depthscanner.
+
+    The view owns a vtkRenderWindow with offscreen rendering enabled and does
+    not create any Qt objects, so it can be used in scripts without a Qt event
+    loop or a display. Whether VTK uses EGL, OSMesa or an X server for the
+    offscreen context depends on how VTK was built, for example the vtk-osmesa
+    wheel or the VTK_DEFAULT_OPENGL_WINDOW environment variable.
+
+    Without an event loop nothing services deferred renders, so render() only
+    records that the scene changed. Call forceRender() to draw a frame before
+    reading back the framebuffer, or renderIfNeeded() to skip the draw when
+    nothing requested a render since the last frame.
+    """
+
+    def __init__(self, width=1280, height=720):
+        self._render_window = vtk.vtkRenderWindow()
+        self._render_window.SetOffScreenRendering(1)
+        self._render_window.SetMultiSamples(0)
+        self._render_window.SetSize(width, height)
+
+        self._renderer = vtk.vtkRenderer()
+        self._renderer.GradientBackgroundOn()
+        self._renderer.SetBackground(25 / 255, 25 / 255, 30 / 255)
+        self._renderer.SetBackground2(45 / 255, 45 / 255, 55 / 255)
+        self._render_window.AddRenderer(self._renderer)
+
+        self._light_kit = vtk.vtkLightKit()
+        self._light_kit.SetKeyLightWarmth(0.5)
+        self._light_kit.SetFillLightWarmth(0.5)
+        self.setLightKitEnabled(True)
+
+        camera = self._renderer.GetActiveCamera()
+        camera.SetPosition(10.0, 10.0, 10.0)
+        camera.SetFocalPoint(0.0, 0.0, 0.0)
+        camera.SetViewUp(0.0, 0.0, 1.0)
+        self._renderer.ResetCamera()
+
+        self._custom_bounds = []
+        self._render_pending = False
+        self._frame_count = 0
+        self._start_time = time.perf_counter()
+
+        self._render_stats = RenderStats()
+        self._render_stats_enabled = False
+        self._render_window.AddObserver(vtk.vtkCommand.StartEvent, self._on_start_render)
+        self._render_window.AddObserver(vtk.vtkCommand.EndEvent, self._on_end_render)
+
+    def renderWindow(self):
+        """Return the offscreen VTK render window."""
+        return self._render_window
+
+    def renderer(self):
+        """Return the main renderer."""
+        return self._renderer
+
+    def backgroundRenderer(self):
+        """Return the background renderer (same as main renderer)."""
+        return self._renderer
+
+    def camera(self):
+        """Return the active camera."""
+        return self._renderer.GetActiveCamera()
+
+    def lightKit(self):
+        """Return the light kit."""
+        return self._light_kit
+
+    def setLightKitEnabled(self, enabled):
+        """Enable or disable the light kit."""
+        self._renderer.RemoveAllLights()
+        if enabled:
+            self._light_kit.AddLightsToRenderer(self._renderer)
+
+    def width(self):
+        return self._render_window.GetSize()[0]
+
+    def height(self):
+        return self._render_window.GetSize()[1]
+
+    def setSize(self, width, height):
+        """Set the size in pixels of the rendered images."""
+        self._render_window.SetSize(width, height)
+        self.render()
+
+    def isVisible(self):
+        """A headless view is never visible on screen."""
+        return False
+
+    def render(self, interactive=False):
+        """Record that the scene changed. The next renderIfNeeded() will draw a frame."""
+        self._render_pending = True
+
+    def hasPendingRender(self):
+        return self._render_pending
+
+    def renderIfNeeded(self):
+        """Render a frame if render() was called since the last frame. Returns True if it rendered."""
+        if not self._render_pending:
+            return False
+        self.forceRender()
+        return True
+
+    def forceRender(self):
+        """Render a frame immediately."""
+        self._render_pending = False
+        self._renderer.ResetCameraClippingRange()
+        self._render_window.Render()
+
+    def addCustomBounds(self, bounds):
+        """Add custom bounds for camera reset calculation."""
+        if len(bounds) == 6:
+            self._custom_bounds.append(list(bounds))
+
+    def resetCamera(self, viewDirection=None):
+        """Reset the camera to fit all actors, or the custom bounds if any were added."""
+        resetCameraToBounds(self, self._custom_bounds, viewDirection=viewDirection)
+        self.render()
+
+    def getAverageFramesPerSecond(self):
+        """Get the average frames per second since the view was created."""
+        elapsed = time.perf_counter() - self._start_time
+        return self._frame_count / elapsed if elapsed > 0 else 0.0
+
+    def setRenderStatsEnabled(self, enabled):
+        """Enable or disable collecting per-frame statistics in renderStats()."""
+        if enabled and not self._render_stats_enabled:
+            self._render_stats.clear()
+        self._render_stats_enabled = enabled
+
+    def renderStats(self):
+        """Return the RenderStats with the timing of recent frames."""
+        return self._render_stats
+
+    def close(self):
+        """Release the offscreen rendering context."""
+        self._render_window.Finalize()
+
+    def _on_start_render(self, obj, event):
+        if self._render_stats_enabled:
+            self._render_stats.startFrame()
+
+    def _on_end_render(self, obj, event):
+        self._frame_count += 1
+        if self._render_stats_enabled:
+            self._render_stats.endFrame(*countScene(self._renderer))
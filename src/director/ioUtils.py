@@ -6,10 +6,27 @@ import numpy as np
 
 import director.vtkAll as vtk
 import director.vtkNumpy as vnp
+from director import mesh_cache
 from director.shallowCopy import shallowCopy
 
 
-def readPolyData(filename, computeNormals=False):
+def readPolyData(filename, computeNormals=False, useCache=False):
+    """
+    Read a polydata file.
+
+    If useCache is True, the result is stored in and loaded from the persistent
+    mesh cache (see director.mesh_cache), so repeated reads of an unchanged file
+    skip parsing and normal generation. A MeshCache instance may also be passed.
+    """
+    if useCache:
+        cache = useCache if isinstance(useCache, mesh_cache.MeshCache) else mesh_cache.getDefaultCache()
+        if cache is not None:
+            return cache.getOrCreate(
+                filename,
+                lambda f: readPolyData(f, computeNormals=computeNormals),
+                options={"reader": "readPolyData", "computeNormals": bool(computeNormals)},
+            )
+
     ext = os.path.splitext(filename)[1].lower()
 
     readers = {
@@ -0,0 +1,343 @@
+"""Level of detail rendering for large point clouds.
+
+LodPointCloudItem sorts a point cloud into a voxel grid once, with the points of
+each voxel stored contiguously in random order, so any prefix of a voxel is a
+uniform subsample of it. Before each render the view's LodPointCloudManager culls
+voxels against the camera frustum and splits a global point budget across the
+visible voxels of all LOD items in proportion to their screen space size. The
+selected points are gathered into a preallocated buffer that is drawn by a regular
+PolyDataItem actor.
+"""
+
+import weakref
+from dataclasses import dataclass
+
+import numpy as np
+
+import director.applogic as app
+import director.objectmodel as om
+import director.vtkAll as vtk
+import director.vtkNumpy as vnp
+from director import visualization as vis
+
+DEFAULT_POINT_BUDGET = 2_000_000
+
+
+@dataclass
+class VoxelHierarchy:
+    """Points sorted into voxels, see buildVoxelHierarchy."""
+
+    order: np.ndarray  # Index into the original points, grouped by voxel
+    cellStarts: np.ndarray
+    cellCounts: np.ndarray
+    cellCenters: np.ndarray
+    cellRadius: float
+
+
+def buildVoxelHierarchy(points, pointsPerCell=4096, seed=0):
+    """
+    Sort points into a voxel grid sized for about pointsPerCell points per voxel.
+
+    This only uses numpy and does not touch VTK, so it can run in a background
+    thread for very large clouds.
+
+    Returns:
+        VoxelHierarchy
+    """
+    points = np.asarray(points)
+    numPoints = len(points)
+    if not numPoints:
+        empty = np.zeros(0, dtype=np.int64)
+        return VoxelHierarchy(empty, empty, empty, np.zeros((0, 3)), 0.0)
+
+    lower = points.min(axis=0).astype(np.float64)
+    extent = max(float((points.max(axis=0) - lower).max()), 1e-9)
+    resolution = max(1, int(np.ceil(np.cbrt(numPoints / pointsPerCell))))
+    cellSize = extent / resolution
+
+    ijk = np.minimum(((points - lower) / cellSize).astype(np.int64), resolution - 1)
+    keys = (ijk[:, 0] * resolution + ijk[:, 1]) * resolution + ijk[:, 2]
+
+    # Shuffle, then stable sort by voxel so points within a voxel are in random order
+    shuffle = np.random.default_rng(seed).permutation(numPoints)
+    order = shuffle[np.argsort(keys[shuffle], kind="stable")]
+
+    cellKeys, cellStarts, cellCounts = np.unique(keys[order], return_index=True, return_counts=True)
+    cellIjk = np.column_stack(
+        [cellKeys // (resolution * resolution), (cellKeys // resolution) % resolution, cellKeys % resolution]
+    )
+    cellCenters = lower + (cellIjk + 0.5) * cellSize
+    cellRadius = 0.5 * np.sqrt(3.0) * cellSize
+    return VoxelHierarchy(order, cellStarts.astype(np.int64), cellCounts.astype(np.int64), cellCenters, cellRadius)
+
+
+def allocatePointBudget(cellCounts, weights, budget):
+    """
+    Split a point budget across cells in proportion to their weights.
+
+    Each cell receives min(count, s * weight) points, where s is chosen so the
+    total is at most budget. Cells with zero weight receive no points.
+
+    Returns:
+        Integer array of points per cell
+    """
+    cellCounts = np.asarray(cellCounts, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float64)
+    visible = weights > 0
+    if cellCounts[visible].sum() <= budget:
+        return np.where(visible, cellCounts, 0)
+
+    # Water filling: cells saturate in order of count / weight
+    ratio = np.full(len(weights), np.inf)
+    ratio[visible] = cellCounts[visible] / weights[visible]
+    sortedIds = np.argsort(ratio)
+    sortedRatio = ratio[sortedIds]
+    saturatedCounts = np.concatenate([[0], np.cumsum(np.where(visible, cellCounts, 0)[sortedIds])])
+    remainingWeights = np.concatenate([np.cumsum(weights[sortedIds][::-1])[::-1], [0.0]])
+
+    # total(s) at s = sortedRatio[k], where cells before k are saturated
+    numVisible = int(visible.sum())
+    totals = saturatedCounts[:numVisible] + sortedRatio[:numVisible] * remainingWeights[:numVisible]
+    k = int(np.searchsorted(totals, budget))
+    scale = (budget - saturatedCounts[k]) / remainingWeights[k]
+
+    allocation = np.minimum(cellCounts, np.floor(scale * weights)).astype(np.int64)
+    return np.where(visible, allocation, 0)
+
+
+class LodPointCloudItem(vis.PolyDataItem):
+    def __init__(self, name, points, view, pointData=None, pointsPerCell=4096, hierarchy=None):
+        """
+        Args:
+            name: Item name
+            points: (N, 3) array of points
+            view: View to add the item to
+            pointData: Optional dict of point data arrays
+            pointsPerCell: Target voxel size used when building the hierarchy
+            hierarchy: Optional prebuilt VoxelHierarchy for points
+        """
+        hierarchy = hierarchy or buildVoxelHierarchy(points, pointsPerCell)
+        self.hierarchy = hierarchy
+        self.lodPoints = np.ascontiguousarray(np.asarray(points)[hierarchy.order], dtype=np.float32)
+        self.lodPointData = {
+            arrayName: np.ascontiguousarray(np.asarray(values)[hierarchy.order])
+            for arrayName, values in (pointData or {}).items()
+        }
+        self.numberOfSelectedPoints = 0
+
+        capacity = min(len(self.lodPoints), getLodManager(view).pointBudget) if view is not None else 0
+        self._allocateBuffers(capacity)
+        vis.PolyDataItem.__init__(self, name, self._outputPolyData, view)
+
+        # Color by the range of the full cloud, the selected subset changes with the camera
+        for arrayName, values in self.lodPointData.items():
+            if arrayName not in self.rangeMap and len(values):
+                self.setRangeMap(arrayName, (float(values.min()), float(values.max())))
+
+    def _allocateBuffers(self, capacity):
+        """Create the output polydata with buffers for capacity selected points."""
+        self._outputPoints = np.zeros((capacity, 3), dtype=np.float32)
+        self._outputPointData = {
+            arrayName: np.zeros((capacity,) + values.shape[1:], dtype=values.dtype)
+            for arrayName, values in self.lodPointData.items()
+        }
+        self._offsets = np.arange(capacity + 1, dtype=np.int64)
+        polyData = vnp.numpyToPolyData(self._outputPoints, self._outputPointData, createVertexCells=False, copy=False)
+        polyData.SetVerts(vtk.vtkCellArray())
+        self._outputPolyData = polyData
+
+    def getNumberOfSelectedPoints(self):
+        return self.numberOfSelectedPoints
+
+    def computeCellWeights(self, camera, viewportSize):
+        """
+        Return the screen space area of each voxel, or zero for voxels outside the view frustum.
+
+        Args:
+            camera: vtkCamera of the view
+            viewportSize: (width, height) in pixels
+        """
+        width, height = viewportSize
+        centers = self.hierarchy.cellCenters
+        radius = self.hierarchy.cellRadius
+        if not len(centers) or not width or not height:
+            return np.zeros(len(centers))
+
+        matrix = vtk.vtkMatrix4x4()
+        matrix.DeepCopy(self.actor.GetMatrix())
+        actorMatrix = np.array([[matrix.GetElement(r, c) for c in range(4)] for r in range(4)])
+        centers = centers @ actorMatrix[:3, :3].T + actorMatrix[:3, 3]
+
+        # Only the side planes are used, the near and far planes follow the clipping range,
+        # which is computed from the currently selected points
+        planes = [0.0] * 24
+        camera.GetFrustumPlanes(width / height, planes)
+        planes = np.array(planes).reshape(6, 4)[:4]
+        inside = np.all(centers @ planes[:, :3].T + planes[:, 3] >= -radius, axis=1)
+        inFront = (centers - np.array(camera.GetPosition())) @ np.array(camera.GetDirectionOfProjection()) >= -radius
+        inside &= inFront
+
+        if camera.GetParallelProjection():
+            pixelRadius = np.full(len(centers), radius * height / (2.0 * camera.GetParallelScale()))
+        else:
+            distance = np.linalg.norm(centers - np.array(camera.GetPosition()), axis=1)
+            focalLength = height / (2.0 * np.tan(np.radians(camera.GetViewAngle()) / 2.0))
+            pixelRadius = radius * focalLength / np.maximum(distance, radius)
+
+        return np.where(inside, pixelRadius**2, 0.0)
+
+    def setCellAllocation(self, allocation):
+        """Gather allocation[i] points from each voxel into the output buffers."""
+        hierarchy = self.hierarchy
+        selected = allocation > 0
+        counts = allocation[selected]
+        numPoints = int(counts.sum())
+        if numPoints > len(self._outputPoints):
+            activeScalars = self.polyData.GetPointData().GetScalars()
+            self._allocateBuffers(min(len(self.lodPoints), max(numPoints, 2 * len(self._outputPoints))))
+            self.polyData = self._outputPolyData
+            if activeScalars:
+                self.polyData.GetPointData().SetActiveScalars(activeScalars.GetName())
+            self.mapper.SetInputData(self.polyData)
+            self._updateObjectIndex()
+
+        # Point ids are the prefix of each selected voxel's contiguous range
+        starts = hierarchy.cellStarts[selected]
+        ids = np.repeat(starts - (np.cumsum(counts) - counts), counts) + np.arange(numPoints)
+        np.take(self.lodPoints, ids, axis=0, out=self._outputPoints[:numPoints])
+        for arrayName, values in self.lodPointData.items():
+            np.take(values, ids, axis=0, out=self._outputPointData[arrayName][:numPoints])
+
+        self.polyData.GetVerts().SetData(
+            vnp.getVtkFromNumpy(self._offsets[: numPoints + 1]),
+            vnp.getVtkFromNumpy(self._offsets[:numPoints]),
+        )
+        self.polyData.GetPoints().GetData().Modified()
+        self.polyData.GetPoints().Modified()
+        for i in range(self.polyData.GetPointData().GetNumberOfArrays()):
+            self.polyData.GetPointData().GetArray(i).Modified()
+        self.polyData.Modified()
+        self.numberOfSelectedPoints = numPoints
+
+    def getArrayNames(self):
+        return list(self.lodPointData.keys())
+
+    def addToView(self, view):
+        vis.PolyDataItem.addToView(self, view)
+        getLodManager(view).addItem(self)
+
+    def removeFromView(self, view):
+        getLodManager(view).removeItem(self)
+        vis.PolyDataItem.removeFromView(self, view)
+
+
+class LodPointCloudManager:
+    """Splits a point budget across the LOD point cloud items of a view before each render."""
+
+    def __init__(self, view, pointBudget=DEFAULT_POINT_BUDGET):
+        self.pointBudget = pointBudget
+        self.items = []
+        self._lastState = None
+        self._renderWindow = view.renderWindow()
+        self._observer = self._renderWindow.AddObserver("StartEvent", self._onStartRender)
+
+    def addItem(self, item):
+        if item not in self.items:
+            self.items.append(item)
+            self._lastState = None
+
+    def removeItem(self, item):
+        if item in self.items:
+            self.items.remove(item)
+            self._lastState = None
+
+    def setPointBudget(self, pointBudget):
+        self.pointBudget = pointBudget
+        self._lastState = None
+
+    def _getRenderer(self, item):
+        for renderer in self._renderWindow.GetRenderers():
+            if renderer.HasViewProp(item.actor):
+                return renderer
+        return None
+
+    def _getState(self, items):
+        """Return the inputs that determine the selection, used to skip unchanged renders."""
+        state = [self.pointBudget, self._renderWindow.GetSize()]
+        for item in items:
+            camera = self._getRenderer(item).GetActiveCamera()
+            state.append(
+                (
+                    id(item),
+                    item.actor.GetMTime(),
+                    camera.GetPosition(),
+                    camera.GetFocalPoint(),
+                    camera.GetViewUp(),
+                    camera.GetViewAngle(),
+                    camera.GetParallelProjection(),
+                    camera.GetParallelScale(),
+                )
+            )
+        return state
+
+    def updateSelection(self, force=False):
+        """Recompute the selected points of all visible items if the camera or items changed."""
+        items = [item for item in self.items if item.getProperty("Visible") and self._getRenderer(item)]
+        state = self._getState(items)
+        if state == self._lastState and not force:
+            return
+        self._lastState = state
+
+        weights = []
+        for item in items:
+            renderer = self._getRenderer(item)
+            weights.append(item.computeCellWeights(renderer.GetActiveCamera(), renderer.GetSize()))
+
+        if not items:
+            return
+
+        cellCounts = np.concatenate([item.hierarchy.cellCounts for item in items])
+        allocation = allocatePointBudget(cellCounts, np.concatenate(weights), self.pointBudget)
+        splits = np.cumsum([len(w) for w in weights])[:-1]
+        for item, itemAllocation in zip(items, np.split(allocation, splits)):
+            item.setCellAllocation(itemAllocation)
+
+    def _onStartRender(self, obj, event):
+        self.updateSelection()
+
+
+_lodManagers = weakref.WeakKeyDictionary()
+
+
+def getLodManager(view):
+    """Return the LodPointCloudManager for a view, creating it on first use."""
+    manager = _lodManagers.get(view)
+    if manager is None:
+        manager = LodPointCloudManager(view)
+        _lodManagers[view] = manager
+    return manager
+
+
+def setPointBudget(view, pointBudget):
+    """Set the total number of LOD points rendered per frame in a view."""
+    getLodManager(view).setPointBudget(pointBudget)
+    view.render()
+
+
+def showLodPointCloud(
+    points, name, pointData=None, colorByName=None, color=None, pointsPerCell=4096, view=None, parent="data"
+):
+    """Show a large point cloud with level of detail rendering."""
+    view = view or app.getCurrentRenderView()
+    assert view
+
+    item = LodPointCloudItem(name, points, view, pointData=pointData, pointsPerCell=pointsPerCell)
+    if om.isInitialized():
+        om.addToObjectModel(item, vis.getParentObj(parent))
+
+    if colorByName:
+        item.setProperty("Color By", colorByName)
+    else:
+        color = [1.0, 1.0, 1.0] if color is None else color
+        item.setProperty("Color", [float(c) for c in color])
+    return item
@@ -0,0 +1,323 @@
+"""Persistent on-disk cache for processed mesh files.
+
+Reading large STL/OBJ files and generating normals is slow. The MeshCache stores
+the processed vtkPolyData as raw numpy arrays in an uncompressed .npz file, keyed
+on the source file path, modification time, size and the processing options, so a
+warm start can skip both parsing and normal generation.
+
+The default cache directory is $DIRECTOR_MESH_CACHE_DIR if set, otherwise
+$XDG_CACHE_HOME/director/meshes (~/.cache/director/meshes). Set
+DIRECTOR_DISABLE_MESH_CACHE=1 to disable the default cache.
+
+Saving a new entry for a file removes the entries for older versions of the same
+file and options. The cache is also kept under a size limit, 1 GiB by default or
+$DIRECTOR_MESH_CACHE_MAX_MB megabytes, by removing the least recently used
+entries.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+import director.vtkAll as vtk
+import director.vtkNumpy as vnp
+
+# Bump when the stored layout changes so stale entries are ignored
+CACHE_FORMAT_VERSION = 2
+
+DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+
+_CELL_TYPES = ("verts", "lines", "polys", "strips")
+
+
+def polyDataToArrays(polyData):
+    """
+    Convert polydata to a dict of numpy arrays.
+
+    The dict holds the points, the cells, the numeric point, cell and field data
+    arrays, and the names of the active point and cell attributes such as the
+    normals, scalars and texture coordinates. Arrays without a name and
+    non-numeric arrays such as vtkStringArray are not stored.
+    """
+    arrays = {}
+    if polyData.GetPoints():
+        arrays["points"] = vnp.getNumpyFromVtk(polyData, "Points")
+    else:
+        arrays["points"] = np.zeros((0, 3))
+
+    for cellType in _CELL_TYPES:
+        cells = getattr(polyData, "Get" + cellType.capitalize())()
+        if cells and cells.GetNumberOfCells():
+            cells = cells.NewInstance()
+            cells.DeepCopy(getattr(polyData, "Get" + cellType.capitalize())())
+            cells.ConvertTo64BitStorage()
+            arrays[cellType + "/offsets"] = vnp.numpy_support.vtk_to_numpy(cells.GetOffsetsArray())
+            arrays[cellType + "/connectivity"] = vnp.numpy_support.vtk_to_numpy(cells.GetConnectivityArray())
+
+    activeAttributes = {}
+    for prefix, data in _getAttributeData(polyData):
+        for i in range(data.GetNumberOfArrays()):
+            array = data.GetArray(i)
+            if array is None or not array.GetName():
+                continue
+            arrays[prefix + "/" + array.GetName()] = vnp.numpy_support.vtk_to_numpy(array)
+        if prefix == "fielddata":
+            continue
+        activeAttributes[prefix] = {}
+        for attributeType in range(vtk.vtkDataSetAttributes.NUM_ATTRIBUTES):
+            array = data.GetAttribute(attributeType)
+            if array is not None and array.GetName():
+                attributeName = vtk.vtkDataSetAttributes.GetAttributeTypeAsString(attributeType)
+                activeAttributes[prefix][attributeName] = array.GetName()
+    arrays["active"] = np.array(json.dumps(activeAttributes))
+
+    return arrays
+
+
+def arraysToPolyData(arrays):
+    """Build a vtkPolyData from the dict of numpy arrays returned by polyDataToArrays."""
+    polyData = vtk.vtkPolyData()
+    polyData.SetPoints(vnp.getVtkPointsFromNumpy(np.ascontiguousarray(arrays["points"])))
+
+    for cellType in _CELL_TYPES:
+        if cellType + "/offsets" not in arrays:
+            continue
+        cells = vtk.vtkCellArray()
+        cells.SetData(
+            vnp.getVtkFromNumpy(np.ascontiguousarray(arrays[cellType + "/offsets"])),
+            vnp.getVtkFromNumpy(np.ascontiguousarray(arrays[cellType + "/connectivity"])),
+        )
+        getattr(polyData, "Set" + cellType.capitalize())(cells)
+
+    dataByPrefix = dict(_getAttributeData(polyData))
+    for key, value in arrays.items():
+        prefix, _, name = key.partition("/")
+        if prefix in dataByPrefix:
+            array = vnp.getVtkFromNumpy(np.ascontiguousarray(value))
+            array.SetName(name)
+            dataByPrefix[prefix].AddArray(array)
+
+    activeAttributes = json.loads(str(arrays["active"])) if "active" in arrays else {}
+    attributeTypes = {
+        vtk.vtkDataSetAttributes.GetAttributeTypeAsString(attributeType): attributeType
+        for attributeType in range(vtk.vtkDataSetAttributes.NUM_ATTRIBUTES)
+    }
+    for prefix, attributes in activeAttributes.items():
+        for attributeName, arrayName in attributes.items():
+            dataByPrefix[prefix].SetActiveAttribute(arrayName, attributeTypes[attributeName])
+
+    return polyData
+
+
+def _getAttributeData(polyData):
+    """Return the (key prefix, data) pairs for the point, cell and field data of polydata."""
+    return [
+        ("pointdata", polyData.GetPointData()),
+        ("celldata", polyData.GetCellData()),
+        ("fielddata", polyData.GetFieldData()),
+    ]
+
+
+def getDefaultCacheDir():
+    """Return the default mesh cache directory."""
+    cacheDir = os.environ.get("DIRECTOR_MESH_CACHE_DIR")
+    if cacheDir:
+        return cacheDir
+    cacheHome = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cacheHome, "director", "meshes")
+
+
+def getDefaultMaxSize():
+    """Return the default cache size limit in bytes."""
+    maxSizeMB = os.environ.get("DIRECTOR_MESH_CACHE_MAX_MB")
+    if maxSizeMB:
+        return int(float(maxSizeMB) * 1024 * 1024)
+    return DEFAULT_MAX_SIZE
+
+
+class MeshCache:
+    """
+    Content-keyed disk cache of processed vtkPolyData meshes.
+
+    Cache files are named <source key>-<cache key>.npz, where the source key
+    depends only on the file path and options. When an entry is saved, entries
+    with the same source key and a different cache key are removed, and the
+    least recently used entries are removed while the cache is larger than
+    maxSize bytes.
+    """
+
+    def __init__(self, cacheDir=None, maxSize=None):
+        self.cacheDir = cacheDir or getDefaultCacheDir()
+        self.maxSize = maxSize if maxSize is not None else getDefaultMaxSize()
+        self.hits = 0
+        self.misses = 0
+        # Meshes are loaded from a thread pool, see mujoco_model.preload_mesh_files
+        self._countLock = threading.Lock()
+
+    def getCacheKey(self, filename, options=None):
+        """
+        Return the cache key for a mesh file and processing options.
+
+        The key changes whenever the file path, modification time or size changes,
+        or when different processing options are requested.
+        """
+        filename = os.path.abspath(filename)
+        stat = os.stat(filename)
+        keyData = json.dumps(
+            [CACHE_FORMAT_VERSION, filename, stat.st_mtime_ns, stat.st_size, options or {}],
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha1(keyData.encode()).hexdigest()
+
+    def getSourceKey(self, filename, options=None):
+        """Return a key for the file path and processing options, independent of the file contents."""
+        keyData = json.dumps([os.path.abspath(filename), options or {}], sort_keys=True, default=str)
+        return hashlib.sha1(keyData.encode()).hexdigest()[:16]
+
+    def getCacheFile(self, filename, options=None):
+        return os.path.join(
+            self.cacheDir, self.getSourceKey(filename, options) + "-" + self.getCacheKey(filename, options) + ".npz"
+        )
+
+    def load(self, filename, options=None):
+        """Return the cached polydata for the file and options, or None on a cache miss."""
+        try:
+            cacheFile = self.getCacheFile(filename, options)
+        except OSError:
+            return None
+
+        if not os.path.isfile(cacheFile):
+            self._countLookup(hit=False)
+            return None
+
+        try:
+            with np.load(cacheFile, allow_pickle=False) as data:
+                polyData = arraysToPolyData({key: data[key] for key in data.files})
+        except Exception as e:
+            print(f"Warning: Ignoring unreadable mesh cache file {cacheFile}: {e}")
+            self._countLookup(hit=False)
+            return None
+
+        # The modification time of cache files orders them for least recently used removal
+        try:
+            os.utime(cacheFile)
+        except OSError:
+            pass
+        self._countLookup(hit=True)
+        return polyData
+
+    def _countLookup(self, hit):
+        with self._countLock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def save(self, filename, polyData, options=None):
+        """Store processed polydata for the file and options."""
+        try:
+            cacheFile = self.getCacheFile(filename, options)
+            os.makedirs(self.cacheDir, exist_ok=True)
+            arrays = polyDataToArrays(polyData)
+
+            # Write to a temporary file first so readers never see a partial file
+            fd, tmpFile = tempfile.mkstemp(dir=self.cacheDir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.savez(f, **arrays)
+                os.replace(tmpFile, cacheFile)
+            except BaseException:
+                os.remove(tmpFile)
+                raise
+
+            self._removeStaleEntries(cacheFile)
+            self.prune()
+        except Exception as e:
+            print(f"Warning: Failed to write mesh cache for {filename}: {e}")
+
+    def _getEntries(self):
+        """Return a list of (path, stat) for the cache files."""
+        entries = []
+        with os.scandir(self.cacheDir) as it:
+            for entry in it:
+                if entry.name.endswith(".npz"):
+                    try:
+                        entries.append((entry.path, entry.stat()))
+                    except OSError:
+                        pass
+        return entries
+
+    def _removeStaleEntries(self, cacheFile):
+        """Remove the entries for older versions of the source file of cacheFile."""
+        name = os.path.basename(cacheFile)
+        prefix = name.partition("-")[0] + "-"
+        for path, _ in self._getEntries():
+            otherName = os.path.basename(path)
+            if otherName != name and otherName.startswith(prefix):
+                _removeFile(path)
+
+    def prune(self, maxSize=None):
+        """Remove the least recently used cache files until the cache is at most maxSize bytes."""
+        maxSize = self.maxSize if maxSize is None else maxSize
+        if not os.path.isdir(self.cacheDir):
+            return
+        entries = self._getEntries()
+        totalSize = sum(stat.st_size for _, stat in entries)
+        if totalSize <= maxSize:
+            return
+        entries.sort(key=lambda entry: entry[1].st_mtime_ns)
+        for path, stat in entries:
+            if totalSize <= maxSize:
+                break
+            _removeFile(path)
+            totalSize -= stat.st_size
+
+    def getOrCreate(self, filename, func, options=None):
+        """
+        Return cached polydata for the file, or call func(filename) to create and cache it.
+
+        Args:
+            filename: Source mesh file
+            func: Function that reads and processes the file, returning vtkPolyData
+            options: JSON serializable dict describing the processing done by func
+        """
+        polyData = self.load(filename, options)
+        if polyData is None:
+            polyData = func(filename)
+            if polyData is not None and polyData.GetNumberOfPoints():
+                self.save(filename, polyData, options)
+        return polyData
+
+    def clear(self):
+        """Remove all cached mesh files."""
+        if not os.path.isdir(self.cacheDir):
+            return
+        for name in os.listdir(self.cacheDir):
+            if name.endswith(".npz"):
+                os.remove(os.path.join(self.cacheDir, name))
+
+
+def _removeFile(path):
+    # Another process may have removed it already
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+_defaultCache = None
+
+
+def getDefaultCache():
+    """Return the shared MeshCache, or None if disabled with DIRECTOR_DISABLE_MESH_CACHE."""
+    global _defaultCache
+    if os.environ.get("DIRECTOR_DISABLE_MESH_CACHE", "") not in ("", "0"):
+        return None
+    if _defaultCache is None:
+        _defaultCache = MeshCache()
+    return _defaultCache
@@ -174,7 +174,7 @@ class MouseLook:
         if self.forceRender:
             self.view.forceRender()
         elif self.requestRender:
-            self.view.render()
+            self.view.render(interactive=True)
 
     def _onTimer(self):
         """Timer callback for processing mouse-look."""
@@ -4,8 +4,10 @@ This module provides utilities to load MuJoCo MJCF XML files, perform forward
 kinematics, and visualize the model geometry in Director using PolyDataItem objects.
 """
 
+import concurrent.futures
 import copy
 import math
+import multiprocessing
 import os
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
@@ -16,9 +18,11 @@ import numpy as np
 from scipy.spatial.transform import Rotation
 
 import director.vtkAll as vtk
-from director import filterUtils, ioUtils, transformUtils
+import director.vtkNumpy as vnp
+from director import callbacks, filterUtils, ioUtils, mesh_cache, transformUtils
 from director import objectmodel as om
 from director import visualization as vis
+from director.find_timestamp_index import find_timestamp_index
 
 
 class MuJoCoMeshResolver:
@@ -40,13 +44,15 @@ class MuJoCoMeshResolver:
         self.mesh_name_to_file = {}
         self.mesh_name_to_material = {}  # Map mesh names to their material names
         self.geom_name_to_element = {}
+        self.geom_name_to_transform = {}  # Precomputed parent_T_geom matrices
         self.material_name_to_rgba = {}
         self.angle_unit = "radian"  # Default MuJoCo angle unit
         self.euler_seq = "xyz"  # Default MuJoCo euler sequence
 
     def add_xml_path(self, xml_path: str):
-        for path in self.find_all_xml_includes(xml_path):
-            self._parse_xml(path)
+        for path, root in self._iter_xml_trees(xml_path):
+            self._parse_xml_root(path, root)
+        self._update_geom_transforms()
 
     def find_all_xml_includes(self, xml_path: str):
         """
@@ -61,63 +67,61 @@ class MuJoCoMeshResolver:
         Returns:
             List of all XML file paths (the root file plus all includes)
         """
+        return [path for path, _ in self._iter_xml_trees(xml_path)]
+
+    def _iter_xml_trees(self, xml_path: str):
+        """
+        Yield (path, root element) for the XML file and all included files.
+
+        Each file is parsed once. Files are yielded depth first in include order, and
+        the includes of a file are only visited after the caller has processed it.
+        """
         visited = set()
-        all_xml_paths = []
 
-        def _find_includes_recursive(current_xml_path: str):
-            """Recursive helper to find all includes."""
+        def _iter_recursive(current_xml_path: str):
             # Normalize the path to handle absolute paths and resolve symlinks
             current_xml_path = os.path.abspath(os.path.normpath(current_xml_path))
 
             # Avoid infinite loops from circular includes
             if current_xml_path in visited:
                 return
-
-            # Mark as visited and add to results
             visited.add(current_xml_path)
-            all_xml_paths.append(current_xml_path)
 
-            # Parse the XML file
             try:
-                xml_dir = os.path.dirname(current_xml_path)
-                tree = ET.parse(current_xml_path)
-                root = tree.getroot()
-
-                # Find all <include> elements
-                for include_elem in root.findall(".//include"):
-                    file_attr = include_elem.get("file")
-                    if not file_attr:
-                        continue
-
-                    # Resolve the include path
-                    if os.path.isabs(file_attr):
-                        include_path = os.path.normpath(file_attr)
-                    else:
-                        # Resolve relative to the current XML file's directory
-                        include_path = os.path.join(xml_dir, file_attr)
-                        include_path = os.path.normpath(include_path)
-
-                    # Recursively process the included file
-                    if os.path.exists(include_path):
-                        _find_includes_recursive(include_path)
-                    else:
-                        print(f"Warning: Include file not found: {include_path} (referenced from {current_xml_path})")
+                root = ET.parse(current_xml_path).getroot()
             except ET.ParseError as e:
                 print(f"Warning: Failed to parse XML file {current_xml_path}: {e}")
+                return
             except Exception as e:
                 print(f"Warning: Error processing XML file {current_xml_path}: {e}")
+                return
+
+            yield current_xml_path, root
+
+            xml_dir = os.path.dirname(current_xml_path)
+            for include_elem in root.iter("include"):
+                file_attr = include_elem.get("file")
+                if not file_attr:
+                    continue
 
-        # Start recursion from the root XML file
-        _find_includes_recursive(xml_path)
+                # Resolve the include path relative to the current XML file's directory
+                if os.path.isabs(file_attr):
+                    include_path = os.path.normpath(file_attr)
+                else:
+                    include_path = os.path.normpath(os.path.join(xml_dir, file_attr))
+
+                # Recursively process the included file
+                if os.path.exists(include_path):
+                    yield from _iter_recursive(include_path)
+                else:
+                    print(f"Warning: Include file not found: {include_path} (referenced from {current_xml_path})")
 
-        return all_xml_paths
+        yield from _iter_recursive(xml_path)
 
-    def _parse_xml(self, xml_path: str):
-        """Parse the MJCF XML file to extract mesh definitions and geom elements."""
+    def _parse_xml_root(self, xml_path: str, root):
+        """Extract mesh definitions and geom elements from a parsed MJCF XML file."""
         try:
             xml_dir = os.path.dirname(xml_path)
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
 
             # Find the <compiler> tag and check for meshdir and angle attributes
             compiler = root.find("compiler")
@@ -215,9 +219,7 @@ class MuJoCoMeshResolver:
         """
         Get the transform from parent body to geom as a 4x4 matrix.
 
-        The transform is built from the pos and either euler or quat attributes of the geom element.
-        The euler angles are interpreted according to the compiler angle and eulerseq settings.
-        Quaternions are parsed as "w x y z" format (MuJoCo standard).
+        Transforms are precomputed when the XML is parsed; see _compute_geom_transform.
 
         Args:
             geom_name: Name of the geom as defined in the MJCF XML
@@ -228,10 +230,43 @@ class MuJoCoMeshResolver:
         Raises:
             ValueError: If both euler and quat attributes are specified
         """
+        transform = self.geom_name_to_transform.get(geom_name)
+        if transform is not None:
+            return transform.copy()
+
+        # Invalid geoms are not precomputed, compute again to raise the error
         geom_elem = self.geom_name_to_element.get(geom_name)
         if geom_elem is None:
             return None
+        return self._compute_geom_transform(geom_name, geom_elem)
+
+    def _update_geom_transforms(self):
+        """Precompute parent_T_geom transforms for all named geoms."""
+        self.geom_name_to_transform = {}
+        for geom_name, geom_elem in self.geom_name_to_element.items():
+            try:
+                self.geom_name_to_transform[geom_name] = self._compute_geom_transform(geom_name, geom_elem)
+            except ValueError:
+                pass
+
+    def _compute_geom_transform(self, geom_name: str, geom_elem) -> np.ndarray:
+        """
+        Compute the transform from parent body to geom as a 4x4 matrix.
+
+        The transform is built from the pos and either euler or quat attributes of the geom element.
+        The euler angles are interpreted according to the compiler angle and eulerseq settings.
+        Quaternions are parsed as "w x y z" format (MuJoCo standard).
+
+        Args:
+            geom_name: Name of the geom as defined in the MJCF XML
+            geom_elem: The geom XML element
+
+        Returns:
+            4x4 numpy array representing parent_T_geom transform
 
+        Raises:
+            ValueError: If both euler and quat attributes are specified
+        """
         # Get pos attribute (default to "0 0 0")
         pos_str = geom_elem.get("pos", "0 0 0")
         pos_values = [float(x) for x in pos_str.split()]
@@ -425,19 +460,43 @@ def print_body_geom_tree(model, body_to_geom):
     print_body_recursive(0)
 
 
-def forward_kinematics(model, data, qpos):
+def get_body_poses(data, out=None):
+    """
+    Get the world pose of every body from the current MuJoCo data.
+
+    Args:
+        data: MuJoCo data object with up to date kinematics (xpos, xmat)
+        out: Optional (nbody, 4, 4) array to fill in place
+
+    Returns:
+        numpy array of shape (nbody, 4, 4) with one 4x4 transformation matrix per body
+    """
+    nbody = data.xpos.shape[0]
+    if out is None:
+        out = np.zeros((nbody, 4, 4))
+    out[:, :3, :3] = data.xmat.reshape(nbody, 3, 3)
+    out[:, :3, 3] = data.xpos
+    out[:, 3, :3] = 0.0
+    out[:, 3, 3] = 1.0
+    return out
+
+
+def forward_kinematics(model, data, qpos, body_names=None, kinematics_only=False):
     """
     Perform forward kinematics to compute body poses.
 
     Args:
         model: MuJoCo model object
-        qpos: Joint positions (optional, defaults to model default qpos)
+        data: MuJoCo data object used for the computation
+        qpos: Joint positions
+        body_names: Optional list of body names indexed by body id. Pass a precomputed
+                    list to avoid looking up the names on every call.
+        kinematics_only: If True, run mj_kinematics instead of mj_forward. This is faster
+                         and computes the same body poses, but leaves the rest of data
+                         (sites, contacts, dynamics) stale.
 
     Returns:
         dict: Mapping from body name to 4x4 transformation matrix (numpy array)
-
-    Raises:
-        ImportError: If scipy is not available
     """
 
     # Set joint positions
@@ -446,26 +505,74 @@ def forward_kinematics(model, data, qpos):
     data.qpos[:] = qpos
 
     # Forward kinematics
-    mujoco.mj_forward(model, data)
+    if kinematics_only:
+        mujoco.mj_kinematics(model, data)
+    else:
+        mujoco.mj_forward(model, data)
+
+    if body_names is None:
+        body_names = [get_body_name(model, body_id) for body_id in range(model.nbody)]
 
     # Build mapping of body name to 4x4 matrix
-    body_poses = {}
+    return dict(zip(body_names, get_body_poses(data)))
 
-    for body_id in range(model.nbody):
-        body_name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_BODY, body_id)
-        body_name = body_name or f"body_{body_id}"
 
-        # Get position and quaternion from MuJoCo
-        pos = data.xpos[body_id]
-        rot_matrix = data.xmat[body_id].reshape(3, 3)
+def compute_trajectory_body_poses(model, data, qpos_array, out=None):
+    """
+    Compute body poses for every configuration in a qpos time series.
+
+    Args:
+        model: MuJoCo model object
+        data: MuJoCo data object used as scratch space for the computation
+        qpos_array: numpy array of shape (T, model.nq)
+        out: Optional (T, nbody, 4, 4) array to fill in place
+
+    Returns:
+        numpy array of shape (T, nbody, 4, 4), float32 unless `out` is given
+    """
+    qpos_array = np.asarray(qpos_array)
+    if qpos_array.ndim != 2 or qpos_array.shape[1] != model.nq:
+        raise ValueError(f"qpos_array must have shape (T, {model.nq}), got {qpos_array.shape}")
+
+    if out is None:
+        out = np.zeros((len(qpos_array), model.nbody, 4, 4), dtype=np.float32)
+    for i, qpos in enumerate(qpos_array):
+        data.qpos[:] = qpos
+        mujoco.mj_kinematics(model, data)
+        get_body_poses(data, out[i])
+    return out
+
+
+# Per-process state for trajectory workers, each worker owns one MjData
+_worker_model = None
+_worker_data = None
+
+
+def _init_trajectory_worker(model):
+    global _worker_model, _worker_data
+    _worker_model = model
+    _worker_data = mujoco.MjData(model)
+
+
+def _compute_trajectory_chunk(qpos_chunk):
+    return compute_trajectory_body_poses(_worker_model, _worker_data, qpos_chunk)
 
-        transform_matrix = np.eye(4)
-        transform_matrix[:3, :3] = rot_matrix
-        transform_matrix[:3, 3] = pos
 
-        body_poses[body_name] = transform_matrix
+@dataclass
+class KinematicsTrajectory:
+    """Body poses precomputed for a time series of joint configurations."""
+
+    timestamps: np.ndarray
+    body_poses: np.ndarray  # (T, nbody, 4, 4) float32, indexed by sample then body id
+    body_names: list[str]
 
-    return body_poses
+    def get_index(self, timestamp: float) -> int:
+        """Return the index of the latest sample at or before `timestamp`."""
+        return find_timestamp_index(self.timestamps, timestamp)
+
+    def get_body_poses(self, timestamp: float) -> np.ndarray:
+        """Return the (nbody, 4, 4) body poses for the sample at or before `timestamp`."""
+        return self.body_poses[self.get_index(timestamp)]
 
 
 def get_geom_pose_in_body(model, geom_id):
@@ -495,6 +602,44 @@ def get_geom_pose_in_body(model, geom_id):
     return transform_matrix
 
 
+def mj_mesh_vertex_normals(model, mesh_id, faces):
+    """
+    Build per-vertex normals for a MuJoCo mesh from mesh_normal.
+
+    MuJoCo stores normals per face corner (mesh_facenormal indexes mesh_normal),
+    so each corner normal is scattered onto its vertex and the result is normalized.
+
+    Args:
+        model: MuJoCo model object
+        mesh_id: Mesh ID
+        faces: (n, 3) array of mesh-local vertex indices for the mesh faces
+
+    Returns:
+        numpy array of shape (vertex_count, 3) with float32 normals, or None if the
+        mesh has no normals
+    """
+    normal_count = model.mesh_normalnum[mesh_id]
+    if not normal_count:
+        return None
+
+    normal_start = model.mesh_normaladr[mesh_id]
+    mesh_normals = model.mesh_normal[normal_start : normal_start + normal_count]
+
+    face_start = model.mesh_faceadr[mesh_id]
+    face_normals = model.mesh_facenormal[face_start : face_start + len(faces)]
+
+    vertex_ids = faces.reshape(-1)
+    corner_normals = mesh_normals[face_normals.reshape(-1)]
+    vertex_count = model.mesh_vertnum[mesh_id]
+    normals = np.column_stack(
+        [np.bincount(vertex_ids, weights=corner_normals[:, i], minlength=vertex_count) for i in range(3)]
+    ).astype(np.float32)
+    lengths = np.linalg.norm(normals, axis=1)
+    lengths[lengths == 0.0] = 1.0
+    normals /= lengths[:, np.newaxis]
+    return normals
+
+
 def mj_mesh_to_vtk_polydata(model, mesh_id):
     """
     Convert MuJoCo mesh data to vtkPolyData.
@@ -510,8 +655,6 @@ def mj_mesh_to_vtk_polydata(model, mesh_id):
         return None
 
     try:
-        import director.vtkNumpy as vnp
-
         # Get mesh vertex and face data from MuJoCo
         vert_start = model.mesh_vertadr[mesh_id]
         vert_count = model.mesh_vertnum[mesh_id]
@@ -523,22 +666,19 @@ def mj_mesh_to_vtk_polydata(model, mesh_id):
 
         # MuJoCo uses (vertex_count, 3) array for vertices
         # Convert to vtkPolyData using vtkNumpy
-        polyData = vnp.numpyToPolyData(vertices)
+        polyData = vnp.numpyToPolyData(vertices, createVertexCells=False)
 
         # Add faces if available
-        if face_count > 0 and len(faces.shape) == 2:
-            # MuJoCo faces are (n, 3) arrays with vertex indices
-            # Convert to VTK cell array format
-            cells = vtk.vtkCellArray()
-            for face in faces:
-                # Handle both int and uint types
-                if len(face) == 3:
-                    triangle = vtk.vtkTriangle()
-                    triangle.GetPointIds().SetId(0, int(face[0]))
-                    triangle.GetPointIds().SetId(1, int(face[1]))
-                    triangle.GetPointIds().SetId(2, int(face[2]))
-                    cells.InsertNextCell(triangle)
-            polyData.SetPolys(cells)
+        if face_count > 0 and faces.ndim == 2 and faces.shape[1] == 3:
+            # MuJoCo faces are (n, 3) arrays with mesh-local vertex indices,
+            # so the connectivity can be handed to VTK without a per-face loop
+            polyData.SetPolys(vnp.getVtkCellArrayFromNumpy(faces))
+
+            normals = mj_mesh_vertex_normals(model, mesh_id, faces)
+            if normals is not None:
+                vtkNormals = vnp.getVtkFromNumpy(normals)
+                vtkNormals.SetName("Normals")
+                polyData.GetPointData().SetNormals(vtkNormals)
 
         return polyData
     except Exception as e:
@@ -611,6 +751,90 @@ def create_primitive_geom(model, geom_id):
 _mesh_file_cache: dict[str, vtk.vtkPolyData] = {}
 
 
+def read_mesh_file(mesh_file):
+    """
+    Read a mesh file and compute point normals if the file does not provide them.
+
+    This is the uncached loader used by load_geom_mesh; its output is what gets
+    stored in the persistent mesh cache.
+    """
+    print("loading mesh file", mesh_file)
+    polyData = ioUtils.readPolyData(mesh_file)
+    if polyData.GetNumberOfPoints() and not polyData.GetPointData().GetNormals():
+        polyData = filterUtils.computeNormals(polyData)
+    return polyData
+
+
+def _load_mesh_file(mesh_file):
+    """
+    Read a mesh file through the persistent mesh cache.
+
+    Unlike ioUtils.readPolyData, which only caches with useCache=True, MuJoCo
+    model meshes use the default on-disk cache (~/.cache/director/meshes, size
+    limited, see director.mesh_cache) unless DIRECTOR_DISABLE_MESH_CACHE=1 is set.
+    """
+    cache = mesh_cache.getDefaultCache()
+    if cache is not None:
+        return cache.getOrCreate(mesh_file, read_mesh_file, options={"reader": "read_mesh_file"})
+    return read_mesh_file(mesh_file)
+
+
+def get_geom_mesh_file(model, geom_id, mesh_resolver):
+    """Return the resolved mesh file for a mesh geom, or None."""
+    if model.geom_type[geom_id] != mujoco.mjtGeom.mjGEOM_MESH:
+        return None
+    mesh_id = model.geom_dataid[geom_id]
+    if mesh_id < 0 or mesh_id >= model.nmesh:
+        return None
+    mesh_name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_MESH, mesh_id)
+    if not mesh_name:
+        return None
+    return mesh_resolver.resolve_mesh_file(mesh_name)
+
+
+def preload_mesh_files(mesh_files, num_workers=4, progress_callback=None):
+    """
+    Read mesh files concurrently and store them in the mesh file cache.
+
+    File reading, parsing and normal generation run on a thread pool. Results are
+    stored from the calling thread, so load_geom_mesh can then create the
+    visualization items on the main thread without touching the disk.
+
+    Args:
+        mesh_files: Iterable of mesh file paths, duplicates are loaded once
+        num_workers: Number of loader threads
+        progress_callback: Optional function called as
+            progress_callback(mesh_file, num_loaded, num_total) after each file
+    """
+    mesh_files = [
+        mesh_file
+        for mesh_file in dict.fromkeys(mesh_files)
+        if mesh_file and mesh_file not in _mesh_file_cache and os.path.exists(mesh_file)
+    ]
+    if not mesh_files:
+        return
+
+    num_total = len(mesh_files)
+    if num_workers <= 1 or num_total == 1:
+        for num_loaded, mesh_file in enumerate(mesh_files, start=1):
+            _mesh_file_cache[mesh_file] = _load_mesh_file(mesh_file)
+            if progress_callback:
+                progress_callback(mesh_file, num_loaded, num_total)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(num_workers, num_total)) as executor:
+        futures = {executor.submit(_load_mesh_file, mesh_file): mesh_file for mesh_file in mesh_files}
+        for num_loaded, future in enumerate(concurrent.futures.as_completed(futures), start=1):
+            mesh_file = futures[future]
+            try:
+                _mesh_file_cache[mesh_file] = future.result()
+            except Exception as e:
+                # Leave it to load_geom_mesh to retry and report the error
+                print(f"Warning: Failed to load mesh file {mesh_file}: {e}")
+            if progress_callback:
+                progress_callback(mesh_file, num_loaded, num_total)
+
+
 def load_geom_mesh(model, geom_id, mesh_resolver):
     """
     Load mesh geometry for a geom.
@@ -627,7 +851,8 @@ def load_geom_mesh(model, geom_id, mesh_resolver):
     Returns:
         vtkPolyData: Mesh geometry, or None if geom cannot be loaded
     """
-    geom_type = model.geom_type[geom_id]
+    # int() because list membership compares the mjtGeom members against a numpy integer
+    geom_type = int(model.geom_type[geom_id])
 
     # Handle primitive geoms
     if geom_type in [
@@ -661,15 +886,10 @@ def load_geom_mesh(model, geom_id, mesh_resolver):
 
             # Load mesh file
             if os.path.exists(mesh_file):
-                print("loading mesh file", mesh_file)
-                polyData = ioUtils.readPolyData(mesh_file)
+                polyData = _load_mesh_file(mesh_file)
                 if not polyData.GetNumberOfPoints():
                     print(f"Error: Mesh file {mesh_file} has no points")
 
-                # print("Loaded", polyData.GetNumberOfPoints(), "points")
-                # print("Loaded", polyData.GetNumberOfCells(), "cells")
-                if not polyData.GetPointData().GetNormals():
-                    polyData = filterUtils.computeNormals(polyData)
                 # Cache the result
                 _mesh_file_cache[mesh_file] = polyData
                 return polyData
@@ -689,7 +909,12 @@ def load_geom_mesh(model, geom_id, mesh_resolver):
 
 @dataclass
 class ShowOptions:
-    """Options for controlling how MuJoCo models are visualized."""
+    """
+    Options for controlling how MuJoCo models are visualized.
+
+    Mesh files are read through the persistent mesh cache by default, see
+    _load_mesh_file.
+    """
 
     ignore_group_ids: list[int] = field(default_factory=list)
     max_group_id: float = math.inf
@@ -698,10 +923,97 @@ class ShowOptions:
     ignore_scene_bodies: bool = False
     ignore_body_names: list[str] = field(default_factory=list)
     ignore_geom_names: list[str] = field(default_factory=list)
+    # Draw all geoms of a group folder with one MergedGeomsItem instead of one item per geom
+    merge_geoms: bool = False
+    # Number of threads used to read mesh files before creating items, 1 loads serially
+    mesh_load_workers: int = 4
     finalize_callback = None
 
 
-def visualize_mujoco_model(model_folder, model, body_to_geom, mesh_resolver, show_options: ShowOptions = None):
+def merge_geom_polydata(geoms):
+    """
+    Append rigid geoms into a single polydata for drawing with one actor.
+
+    Args:
+        geoms: List of (body_id, polyData, rgba) tuples, with polyData expressed in
+               the body frame. Geoms must be grouped by body id.
+
+    Returns:
+        vtkPolyData with point arrays "body_index" (int32) and "rgba" (uint8) and
+        point normals
+    """
+    inputs = []
+    for body_id, polyData, rgba in geoms:
+        if not polyData.GetPointData().GetNormals():
+            polyData = filterUtils.computeNormals(polyData)
+
+        # Keep only the geometry and normals so that all inputs share the same arrays
+        pd = vtk.vtkPolyData()
+        pd.SetPoints(polyData.GetPoints())
+        pd.SetVerts(polyData.GetVerts())
+        pd.SetLines(polyData.GetLines())
+        pd.SetPolys(polyData.GetPolys())
+        pd.SetStrips(polyData.GetStrips())
+        normals = vtk.vtkFloatArray()
+        normals.DeepCopy(polyData.GetPointData().GetNormals())
+        normals.SetName("Normals")
+        pd.GetPointData().SetNormals(normals)
+
+        numPoints = pd.GetNumberOfPoints()
+        vnp.addNumpyToVtk(pd, np.full(numPoints, body_id, dtype=np.int32), "body_index")
+        color = np.clip(np.round(np.asarray(rgba[:4], dtype=float) * 255), 0, 255).astype(np.uint8)
+        vnp.addNumpyToVtk(pd, np.tile(color, (numPoints, 1)), "rgba")
+        inputs.append(pd)
+
+    return filterUtils.appendPolyData(inputs)
+
+
+class MergedGeomsItem(vis.PolyDataItem):
+    """
+    Draws the rigid geoms of many bodies with a single actor.
+
+    The polydata is built by merge_geom_polydata(). Geom points are kept in their
+    body frames and setBodyPoses() writes the world space points and normals into
+    the shared buffers in place, one numpy transform per body.
+    """
+
+    def __init__(self, name, polyData, view):
+        vis.PolyDataItem.__init__(self, name, polyData, view)
+
+        body_index = vnp.getNumpyFromVtk(polyData, "body_index")
+        self.local_points = vnp.getNumpyFromVtk(polyData, "Points").copy()
+        self.local_normals = vnp.getNumpyFromVtk(polyData, "Normals").copy()
+
+        # Points are appended body by body, so each body owns contiguous ranges
+        boundaries = np.flatnonzero(np.diff(body_index)) + 1
+        starts = np.concatenate([[0], boundaries])
+        ends = np.concatenate([boundaries, [len(body_index)]])
+        self.body_ranges = [(int(body_index[start]), int(start), int(end)) for start, end in zip(starts, ends)]
+
+    def setBodyPoses(self, poses):
+        """
+        Move the geoms to the given body poses.
+
+        Args:
+            poses: numpy array of shape (nbody, 4, 4) with world_T_body for every body id
+        """
+        points = vnp.getNumpyFromVtk(self.polyData, "Points")
+        normals = vnp.getNumpyFromVtk(self.polyData, "Normals")
+        for body_id, start, end in self.body_ranges:
+            rot = poses[body_id, :3, :3]
+            points[start:end] = self.local_points[start:end] @ rot.T + poses[body_id, :3, 3]
+            normals[start:end] = self.local_normals[start:end] @ rot.T
+
+        self.polyData.GetPoints().Modified()
+        self.polyData.GetPointData().GetNormals().Modified()
+        self.polyData.Modified()
+        if self.getProperty("Visible"):
+            self._renderAllViews()
+
+
+def visualize_mujoco_model(
+    model_folder, model, body_to_geom, mesh_resolver, show_options: ShowOptions = None, progress_callback=None
+):
     """
     Visualize MuJoCo model geoms using PolyDataItem objects, organized by group in folders.
 
@@ -709,11 +1021,15 @@ def visualize_mujoco_model(model_folder, model, body_to_geom, mesh_resolver, sho
         model: MuJoCo model object
         body_to_geom: Dictionary mapping body IDs to geom IDs
         mesh_resolver: MuJoCoMeshResolver instance for resolving mesh file paths (optional)
+        progress_callback: Optional mesh loading progress function, see preload_mesh_files
 
     Returns:
         ObjectModelItem: Folder containing the model, robot, and body frames
     """
     geom_items = {}
+    merged_items = []
+    # Geoms to be merged, mapping group key to a list of (body_id, polyData, rgba)
+    merged_geoms = {}
     # Dictionary to cache group folders
     group_folders = {}
     # Create Robot folder for Group folders
@@ -746,19 +1062,41 @@ def visualize_mujoco_model(model_folder, model, body_to_geom, mesh_resolver, sho
         body_info = model.body(body_id)
         return body_info.mocapid.size > 0 and body_info.mocapid[0] >= 0
 
+    # Helper functions shared by mesh preloading and item creation, so that only shown geoms are loaded
+    def should_show_body(body_id):
+        """Check if a body and its geoms are shown with the show options."""
+        if show_options.ignore_scene_bodies and get_is_scene_body(body_id):
+            return False
+        if show_options.ignore_mocap_bodies and get_is_mocap_body(body_id):
+            return False
+        return get_body_name(model, body_id) not in show_options.ignore_body_names
+
+    def should_show_geom(geom_id):
+        """Check if a geom of a shown body is shown with the show options."""
+        geom_name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_GEOM, geom_id)
+        if geom_name and geom_name in show_options.ignore_geom_names:
+            return False
+        geom_group = int(model.geom_group[geom_id])
+        return geom_group not in show_options.ignore_group_ids and geom_group <= show_options.max_group_id
+
+    # Read all mesh files up front on a thread pool, items are created below on this thread
+    if mesh_resolver:
+        mesh_files = {}
+        for body_id, geom_ids in body_to_geom.items():
+            if not should_show_body(body_id):
+                continue
+            for geom_id in geom_ids:
+                if should_show_geom(geom_id):
+                    mesh_files[get_geom_mesh_file(model, geom_id, mesh_resolver)] = None
+        mesh_files.pop(None, None)
+        preload_mesh_files(list(mesh_files), show_options.mesh_load_workers, progress_callback)
+
     for body_id in range(model.nbody):
+        if not should_show_body(body_id):
+            continue
         is_scene_body = get_is_scene_body(body_id)
         is_mocap_body = get_is_mocap_body(body_id)
-        body_name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_BODY, body_id)
-        if not body_name:
-            body_name = f"body_{body_id}"
-
-        if is_scene_body and show_options.ignore_scene_bodies:
-            continue
-        if is_mocap_body and show_options.ignore_mocap_bodies:
-            continue
-        if body_name in show_options.ignore_body_names:
-            continue
+        body_name = get_body_name(model, body_id)
 
         frame_obj = vis.showFrame(vtk.vtkTransform(), body_name, parent=body_frame_folder)
         frame_obj.properties.scale = 0.1
@@ -767,12 +1105,10 @@ def visualize_mujoco_model(model_folder, model, body_to_geom, mesh_resolver, sho
         # Process geoms for this body
         if body_id in body_to_geom:
             for geom_id in body_to_geom[body_id]:
-                geom_name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_GEOM, geom_id)
-                if geom_name and geom_name in show_options.ignore_geom_names:
+                if not should_show_geom(geom_id):
                     continue
+                geom_name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_GEOM, geom_id)
                 geom_group = int(model.geom_group[geom_id])
-                if geom_group in show_options.ignore_group_ids or geom_group > show_options.max_group_id:
-                    continue
                 if not geom_name:
                     geom_name = f"geom_{geom_id}"
 
@@ -865,6 +1201,10 @@ def visualize_mujoco_model(model_folder, model, body_to_geom, mesh_resolver, sho
                 if geom_rgba is None:
                     geom_rgba = model.geom_rgba[geom_id]
 
+                if show_options.merge_geoms:
+                    merged_geoms.setdefault(group_key, []).append((body_id, geom_polydata, geom_rgba))
+                    continue
+
                 # Convert to Python list for compatibility
                 geom_color = [float(geom_rgba[i]) for i in range(3)]  # RGB components [0-1]
                 geom_alpha = float(geom_rgba[3])  # Alpha component [0-1]
@@ -886,6 +1226,26 @@ def visualize_mujoco_model(model_folder, model, body_to_geom, mesh_resolver, sho
 
                 geom_items[geom_id] = obj
 
+    if merged_geoms:
+        # Merged geom points are in body frames, so start them at the model's default pose
+        data = mujoco.MjData(model)
+        mujoco.mj_kinematics(model, data)
+        initial_poses = get_body_poses(data)
+
+    for group_key, geoms in merged_geoms.items():
+        obj = vis.showPolyData(
+            merge_geom_polydata(geoms),
+            "merged geoms",
+            parent=group_folders[group_key],
+            colorByName="rgba",
+            cls=MergedGeomsItem,
+        )
+        prop = obj.actor.GetProperty()
+        prop.SetSpecular(0.4)
+        prop.SetSpecularPower(40)
+        obj.setBodyPoses(initial_poses)
+        merged_items.append(obj)
+
     # Set visibility to false for Scene, mocap, and Group 3 folders
     for folder_key, folder_obj in group_folders.items():
         if folder_key in ["Scene", "mocap", "group_2", "group_3", "group_4", "group_5"]:
@@ -895,6 +1255,7 @@ def visualize_mujoco_model(model_folder, model, body_to_geom, mesh_resolver, sho
 
     body_frame_folder.properties.visible = False
     model_folder.geom_items = geom_items
+    model_folder.merged_items = merged_items
     if show_options.finalize_callback:
         show_options.finalize_callback(model_folder)
     return model_folder
@@ -964,15 +1325,31 @@ class MujocoRobotModel:
         self.model = mujoco.MjModel.from_xml_path(xml_path)
         self.data = mujoco.MjData(self.model)
         self.kin_cache = {}
+        self.trajectory = None
+        self.callbacks = callbacks.CallbackRegistry(["on_mesh_load_progress"])
         self.mesh_resolver = MuJoCoMeshResolver()
         self.mesh_resolver.add_xml_path(self.xml_path)
         self.body_to_geom = build_body_to_geom_mapping(self.model)
+        self._build_index_tables()
         self._create_joint_properties_item()
 
         self.default_show_options = ShowOptions()
         self.default_show_options.scene_body_names.extend(["table", "floor"])
         self.named_show_options = {}
 
+    def _build_index_tables(self):
+        """Precompute the name lookups used on every forward kinematics update."""
+        model = self.model
+        self.body_names = [get_body_name(model, body_id) for body_id in range(model.nbody)]
+        self.body_name_to_id = {body_name: body_id for body_id, body_name in enumerate(self.body_names)}
+
+        # Map joint name to (qpos address, joint type)
+        self.joint_qpos_index = {}
+        for joint_id in range(model.njnt):
+            joint_name = mujoco.mj_id2name(model, mujoco.mjtObj.mjOBJ_JOINT, joint_id)
+            if joint_name:
+                self.joint_qpos_index[joint_name] = (int(model.jnt_qposadr[joint_id]), int(model.jnt_type[joint_id]))
+
     def get_kinematics_cache(self, name):
         cache = self.kin_cache.get(name)
         if not cache:
@@ -993,12 +1370,7 @@ class MujocoRobotModel:
         Returns:
             List of body names
         """
-        body_names = []
-        for body_id in range(self.model.nbody):
-            body_name = mujoco.mj_id2name(self.model, mujoco.mjtObj.mjOBJ_BODY, body_id)
-            body_name = body_name or f"body_{body_id}"
-            body_names.append(body_name)
-        return body_names
+        return list(self.body_names)
 
     def get_joint_names(self) -> list[str]:
         """
@@ -1069,7 +1441,25 @@ class MujocoRobotModel:
 
     def _populate_model_folder(self, model_folder, show_options: ShowOptions = None):
         show_options = show_options or self.get_default_show_options()
-        visualize_mujoco_model(model_folder, self.model, self.body_to_geom, self.mesh_resolver, show_options)
+
+        def on_mesh_loaded(mesh_file, num_loaded, num_total):
+            self.callbacks.process("on_mesh_load_progress", mesh_file, num_loaded, num_total)
+
+        visualize_mujoco_model(
+            model_folder, self.model, self.body_to_geom, self.mesh_resolver, show_options, on_mesh_loaded
+        )
+
+    def connect_on_mesh_load_progress(self, callback):
+        """
+        Connect a callback to be called as mesh files are loaded while populating a model folder.
+
+        Args:
+            callback: Function that takes (mesh_file, num_loaded, num_total) as arguments
+
+        Returns:
+            Callback ID for disconnection
+        """
+        return self.callbacks.connect("on_mesh_load_progress", callback)
 
     def show_model(self, name_or_folder=None):
         """
@@ -1091,18 +1481,33 @@ class MujocoRobotModel:
         """
         model_folder = self.get_model_folder(name_or_folder)
 
+        poses = self.compute_body_poses(q_dict, world_T_base)
+
+        # Apply body poses to geom items
+        self._update_body_frames(poses, model_folder)
+        return dict(zip(self.body_names, poses))
+
+    def q_dict_to_qpos(self, q_dict: dict[str, float]) -> np.ndarray:
+        """
+        Build a full qpos vector from a dictionary of joint positions.
+
+        Args:
+            q_dict: Dictionary mapping joint names to joint positions. Joints that are
+                    not specified are set to zero.
+
+        Returns:
+            numpy array of length model.nq
+        """
         q = np.zeros(self.model.nq)
 
         # Fill in specified joint positions
         for joint_name, joint_value in q_dict.items():
-            joint_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_JOINT, joint_name)
-            if joint_id < 0:
+            index = self.joint_qpos_index.get(joint_name)
+            if index is None:
                 print(f"Warning: Joint '{joint_name}' not found in model")
                 continue
 
-            # Get qpos address for this joint
-            qpos_addr = self.model.jnt_qposadr[joint_id]
-            joint_type = self.model.jnt_type[joint_id]
+            qpos_addr, joint_type = index
 
             # Handle different joint types
             if joint_type == mujoco.mjtJoint.mjJNT_FREE:
@@ -1121,29 +1526,102 @@ class MujocoRobotModel:
                 # Hinge or slide joint has 1 DOF
                 q[qpos_addr] = float(joint_value)
 
+        return q
+
+    def compute_body_poses(
+        self, q_dict: dict[str, float], world_T_base: np.ndarray | None = None, kinematics_only: bool = False
+    ) -> np.ndarray:
+        """
+        Compute world_T_body for every body without updating any visualization.
+
+        Args:
+            q_dict: Dictionary mapping joint names to joint positions.
+            world_T_base: Optional 4x4 numpy array representing world_T_base transform.
+            kinematics_only: If True, update self.data with mj_kinematics instead of
+                             mj_forward, see forward_kinematics.
+
+        Returns:
+            numpy array of shape (nbody, 4, 4), indexed by body id (see body_names)
+        """
         # Handle world_T_base transform
-        if world_T_base is None:
-            world_T_base = np.eye(4)
-        else:
+        if world_T_base is not None:
             # Validate shape
             if world_T_base.shape != (4, 4):
                 raise ValueError(f"world_T_base must be a 4x4 matrix, got shape {world_T_base.shape}")
 
-        # Perform forward kinematics (returns base_T_body transforms)
-        base_T_body_poses = forward_kinematics(self.model, self.data, q)
+        self.data.qpos[:] = self.q_dict_to_qpos(q_dict)
+        if kinematics_only:
+            mujoco.mj_kinematics(self.model, self.data)
+        else:
+            mujoco.mj_forward(self.model, self.data)
+
+        # Perform forward kinematics (base_T_body transforms)
+        poses = get_body_poses(self.data)
 
         # Transform base_T_body to world_T_body by multiplying with world_T_base
-        body_poses = {}
-        for body_name, base_T_body in base_T_body_poses.items():
-            world_T_body = world_T_base @ base_T_body
-            body_poses[body_name] = world_T_body
+        if world_T_base is not None:
+            poses = np.matmul(world_T_base, poses)
+        return poses
 
-        # Apply body poses to geom items
-        self._update_body_frames(body_poses, model_folder)
-        return body_poses
+    def precompute_trajectory(self, timestamps, qpos_array, num_workers: int = 1) -> KinematicsTrajectory:
+        """
+        Compute body poses for an entire qpos time series at once.
+
+        The result is stored in self.trajectory and can be displayed while scrubbing
+        with show_trajectory_pose() without running forward kinematics again.
 
-    def _update_body_frames(self, body_poses, model_folder):
-        vtk_frames = {body_name: mj_matrix_to_vtk_transform(body_pose) for body_name, body_pose in body_poses.items()}
+        Args:
+            timestamps: Sorted array of T sample timestamps in seconds
+            qpos_array: numpy array of shape (T, model.nq)
+            num_workers: Number of worker processes. With more than one worker the
+                         series is split into chunks and each worker uses its own MjData.
+
+        Returns:
+            KinematicsTrajectory holding a (T, nbody, 4, 4) float32 pose array
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        qpos_array = np.asarray(qpos_array, dtype=np.float64)
+        if len(timestamps) != len(qpos_array):
+            raise ValueError(f"got {len(timestamps)} timestamps for {len(qpos_array)} qpos samples")
+
+        if num_workers > 1 and len(qpos_array) > num_workers:
+            chunks = np.array_split(qpos_array, num_workers)
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_trajectory_worker,
+                initargs=(self.model,),
+            ) as executor:
+                body_poses = np.concatenate(list(executor.map(_compute_trajectory_chunk, chunks)))
+        else:
+            data = mujoco.MjData(self.model)
+            body_poses = compute_trajectory_body_poses(self.model, data, qpos_array)
+
+        self.trajectory = KinematicsTrajectory(timestamps, body_poses, self.body_names)
+        return self.trajectory
+
+    def show_trajectory_pose(self, timestamp: float, world_T_base: np.ndarray | None = None, name_or_folder=None):
+        """
+        Update the model pose from the trajectory computed by precompute_trajectory().
+
+        Args:
+            timestamp: Time in seconds, the latest sample at or before this time is shown
+            world_T_base: Optional 4x4 numpy array representing world_T_base transform.
+        """
+        if self.trajectory is None:
+            raise ValueError("No trajectory available, call precompute_trajectory() first")
+
+        model_folder = self.get_model_folder(name_or_folder)
+        poses = self.trajectory.get_body_poses(timestamp).astype(np.float64)
+        if world_T_base is not None:
+            poses = np.matmul(world_T_base, poses)
+        self._update_body_frames(poses, model_folder)
+        return dict(zip(self.body_names, poses))
+
+    def _update_body_frames(self, poses, model_folder):
+        vtk_frames = {
+            body_name: mj_matrix_to_vtk_transform(body_pose) for body_name, body_pose in zip(self.body_names, poses)
+        }
         # update geom frames
         for geom_item in model_folder.geom_items.values():
             # if the item has been removed then skip it
@@ -1153,6 +1631,11 @@ class MujocoRobotModel:
             world_T_body = vtk_frames[geom_item.body_name]
             geom_item.getChildFrame().copyFrame(world_T_body)
 
+        # update merged geoms
+        for merged_item in getattr(model_folder, "merged_items", []):
+            if merged_item._tree:
+                merged_item.setBodyPoses(poses)
+
         # update body frames
         body_frame_folder = model_folder.findChild("Body Frames")
         if body_frame_folder:
@@ -1173,10 +1656,8 @@ class MujocoRobotModel:
         # Get initial joint positions from qpos0
         initial_qpos = {}
         for joint_name in joint_names:
-            joint_id = mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_JOINT, joint_name)
-            if joint_id >= 0:
-                qpos_addr = self.model.jnt_qposadr[joint_id]
-                initial_qpos[joint_name] = float(self.model.qpos0[qpos_addr])
+            qpos_addr, _ = self.joint_qpos_index[joint_name]
+            initial_qpos[joint_name] = float(self.model.qpos0[qpos_addr])
 
         # Add properties for each joint
         for joint_name in joint_names:
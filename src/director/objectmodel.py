@@ -5,6 +5,8 @@ It provides a tree-based structure where items can have properties and children.
 The :class:`ObjectModelItem` is the base class for all items in the tree.
 """
 
+import contextlib
+import weakref
 from collections import defaultdict
 
 from qtpy import QtCore, QtGui, QtWidgets
@@ -21,6 +23,25 @@ from director.qtutils import EventFilterDelegate
 qtutils.installPyQtPatch()
 
 
+class ObjectModelItemModel(QtGui.QStandardItemModel):
+    """
+    Item model that exposes model resets for batched updates.
+
+    Signals are blocked between beginBatchReset() and endBatchReset(), so the
+    row and data change signals of the changes in between are not emitted and
+    listeners such as the sort proxy only see modelAboutToBeReset and modelReset,
+    as the reset contract requires.
+    """
+
+    def beginBatchReset(self):
+        self.beginResetModel()
+        self.blockSignals(True)
+
+    def endBatchReset(self):
+        self.blockSignals(False)
+        self.endResetModel()
+
+
 class ObjectModelSortFilterProxyModel(QSortFilterProxyModel):
     """Proxy model that includes children when a parent matches the filter."""
 
@@ -56,6 +77,48 @@ class ObjectModelSortFilterProxyModel(QSortFilterProxyModel):
         return False
 
 
+class WeakIdentityMap:
+    """
+    Map from objects to values, holding the keys by weak reference.
+
+    Keys are compared by identity, so this also works for VTK data objects,
+    whose Python wrappers define __eq__ and are not hashable.
+    """
+
+    def __init__(self):
+        self._data = {}
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key, default=None):
+        entry = self._data.get(id(key))
+        if entry is not None and entry[0]() is key:
+            return entry[1]
+        return default
+
+    def setdefault(self, key, value):
+        entry = self._data.get(id(key))
+        if entry is not None and entry[0]() is key:
+            return entry[1]
+
+        keyId = id(key)
+
+        def onKeyDeleted(keyRef):
+            if self._data.get(keyId, (None,))[0] is keyRef:
+                del self._data[keyId]
+
+        self._data[keyId] = (weakref.ref(key, onKeyDeleted), value)
+        return value
+
+    def pop(self, key, default=None):
+        entry = self._data.get(id(key))
+        if entry is not None and entry[0]() is key:
+            del self._data[id(key)]
+            return entry[1]
+        return default
+
+
 class ObjectModelItem:
     REMOVED_FROM_OBJECT_MODEL = "REMOVED_FROM_OBJECT_MODEL"
 
@@ -73,6 +136,7 @@ class ObjectModelItem:
         self.callbacks = callbacks.CallbackRegistry([self.REMOVED_FROM_OBJECT_MODEL])
         self.properties = properties or PropertySet()
         self.properties.connectPropertyChanged(self._onPropertyChanged)
+        self.properties.connectPropertiesChanged(self._onPropertiesChanged)
         self.properties.connectPropertyAdded(self._onPropertyAdded)
         self.properties.connectPropertyAttributeChanged(self._onPropertyAttributeChanged)
 
@@ -120,6 +184,10 @@ class ObjectModelItem:
         if self._tree is not None:
             self._tree._onPropertyValueChanged(self, propertyName)
 
+    def _onPropertiesChanged(self, propertySet, propertyNames):
+        """Called once after _onPropertyChanged has been called for each of propertyNames."""
+        pass
+
     def _onPropertyAdded(self, propertySet, propertyName):
         pass
 
@@ -132,6 +200,19 @@ class ObjectModelItem:
     def hasActor(self, actor):
         return False
 
+    def getActors(self):
+        """Return the props that resolve to this item in ObjectModelTree.findObjectByProp."""
+        return []
+
+    def getDataSets(self):
+        """Return the datasets that resolve to this item in ObjectModelTree.findObjectByDataSet."""
+        return []
+
+    def _updateObjectIndex(self):
+        """Refresh this item's entries in the tree's actor and dataset indexes."""
+        if self._tree is not None:
+            self._tree._updateObjectIndex(self)
+
     def getActionNames(self):
         actions = []
         if not self.getPropertyAttribute("Name", "readOnly"):
@@ -228,7 +309,21 @@ class ObjectModelTree:
         self._itemToObject = {}
         self._itemToName = {}
         self._nameToItems = defaultdict(set)
+        # Hierarchy indexes with None as the root parent, so parent, children and
+        # child name lookups do not go through Qt items or scan name buckets
+        self._objectToParent = {}
+        self._objectToChildren = {None: {}}
+        self._childrenByName = {None: {}}
+        self._objectToPath = {}
+        # Reverse indexes for resolving picked props and datasets to objects
+        self._propToObject = WeakIdentityMap()
+        self._dataSetToObject = WeakIdentityMap()
+        self._objectToIndexKeys = {}
         self._blockSignals = False
+        self._batchDepth = 0
+        self._batchAddedObjects = []
+        self._batchExpandedObjects = []
+        self._batchSelectedObject = None
         self.actions = []
         self.callbacks = callbacks.CallbackRegistry(
             [
@@ -249,13 +344,10 @@ class ObjectModelTree:
         return self._propertiesPanel
 
     def getObjectParent(self, obj):
-        item = self._getItemForObject(obj)
-        if item.parent():
-            return self._getObjectForItem(item.parent())
+        return self._objectToParent[obj]
 
     def getObjectChildren(self, obj):
-        item = self._getItemForObject(obj)
-        return [self._getObjectForItem(item.child(i, 0)) for i in range(item.rowCount())]
+        return list(self._objectToChildren[obj])
 
     def getTopLevelObjects(self):
         return [
@@ -300,12 +392,21 @@ class ObjectModelTree:
         return self._itemToObject[item]
 
     def getObjectPath(self, obj):
-        items = [self._getItemForObject(obj)]
-        parent = items[0].parent()
-        while parent:
-            items.append(parent)
-            parent = parent.parent()
-        return tuple(self._itemToName[item] for item in reversed(items))
+        path = self._objectToPath.get(obj)
+        if path is None:
+            parent = self._objectToParent[obj]
+            parentPath = self.getObjectPath(parent) if parent is not None else ()
+            path = parentPath + (self._itemToName[self._getItemForObject(obj)],)
+            self._objectToPath[obj] = path
+        return path
+
+    def _invalidateObjectPaths(self, obj):
+        """Drop the cached paths of obj and its descendants."""
+        if self._objectToPath.pop(obj, None) is None:
+            # Paths are cached parent first, so uncached objects have no cached descendants
+            return
+        for child in self._objectToChildren[obj]:
+            self._invalidateObjectPaths(child)
 
     def findObjectByName(self, name, parent=None):
         if parent:
@@ -341,16 +442,48 @@ class ObjectModelTree:
                 return None
         return obj
 
+    def findObjectByProp(self, prop):
+        return self._propToObject.get(prop) if prop is not None else None
+
+    def findObjectByDataSet(self, dataSet):
+        return self._dataSetToObject.get(dataSet) if dataSet is not None else None
+
+    def _updateObjectIndex(self, obj):
+        self._removeObjectIndex(obj)
+        actors = list(obj.getActors())
+        dataSets = list(obj.getDataSets())
+        for actor in actors:
+            self._propToObject.setdefault(actor, obj)
+        for dataSet in dataSets:
+            self._dataSetToObject.setdefault(dataSet, obj)
+        self._objectToIndexKeys[obj] = (actors, dataSets)
+
+    def _removeObjectIndex(self, obj):
+        actors, dataSets = self._objectToIndexKeys.pop(obj, ((), ()))
+        for actor in actors:
+            if self._propToObject.get(actor) is obj:
+                self._propToObject.pop(actor)
+        for dataSet in dataSets:
+            if self._dataSetToObject.get(dataSet) is obj:
+                self._dataSetToObject.pop(dataSet)
+
     def findChildByName(self, parent, name):
-        parentItem = self._getItemForObject(parent) if parent else None
-        for item in self._nameToItems[name]:
-            if item.parent() == parentItem:
-                return self._getObjectForItem(item)
+        children = self._childrenByName[parent or None].get(name)
+        return children[0] if children else None
 
     def findTopLevelObjectByName(self, name):
-        for item in self._nameToItems[name]:
-            if item.parent() is None:
-                return self._getObjectForItem(item)
+        return self.findChildByName(None, name)
+
+    def _addChildName(self, parent, obj, name):
+        # Lists keep insertion order, so the first child added with a name is found first
+        self._childrenByName[parent].setdefault(name, []).append(obj)
+
+    def _removeChildName(self, parent, obj, name):
+        siblings = self._childrenByName[parent]
+        children = siblings[name]
+        children.remove(obj)
+        if not children:
+            del siblings[name]
 
     def _onTreeSelectionChanged(self, selected=None, deselected=None):
         panel = self.getPropertiesPanel()
@@ -383,6 +516,10 @@ class ObjectModelTree:
         name = obj.getProperty("Name")
         self._itemToName[item] = name
         self._nameToItems[name].add(item)
+        parent = self._objectToParent[obj]
+        self._removeChildName(parent, obj, oldName)
+        self._addChildName(parent, obj, name)
+        self._invalidateObjectPaths(obj)
         item.setText(name)
 
     def _onPropertyValueChanged(self, obj, propertyName):
@@ -412,9 +549,16 @@ class ObjectModelTree:
         obj.callbacks.process(obj.REMOVED_FROM_OBJECT_MODEL, self, obj)
         obj.onRemoveFromObjectModel()
         obj._tree = None
+        self._removeObjectIndex(obj)
 
         name = self._itemToName.pop(item)
         self._nameToItems[name].remove(item)
+        parent = self._objectToParent.pop(obj)
+        self._removeChildName(parent, obj, name)
+        del self._objectToChildren[parent][obj]
+        del self._objectToChildren[obj]
+        del self._childrenByName[obj]
+        self._objectToPath.pop(obj, None)
         del self._itemToObject[item]
         del self._objectToItem[obj]
 
@@ -440,22 +584,95 @@ class ObjectModelTree:
         visItem.setEditable(False)
 
         obj._tree = self
+        self._updateObjectIndex(obj)
 
         self._objectToItem[obj] = item
         self._itemToObject[item] = obj
         self._itemToName[item] = objName
         self._nameToItems[objName].add(item)
+        parentObj = parentObj or None
+        self._objectToParent[obj] = parentObj
+        self._objectToChildren[parentObj][obj] = None
+        self._objectToChildren[obj] = {}
+        self._childrenByName[obj] = {}
+        self._addChildName(parentObj, obj, objName)
 
         if parentItem is None:
             self.itemModel.appendRow([item, visItem])
-            self.treeView.expand(self.sortModel.mapFromSource(item.index()))
+            if self._batchDepth:
+                self._batchExpandedObjects.append(obj)
+            else:
+                self.treeView.expand(self.sortModel.mapFromSource(item.index()))
         else:
             parentItem.appendRow([item, visItem])
 
         # Update visibility icon if the object has a Visible property
         self.updateVisIcon(obj)
 
-        self.callbacks.process(self.OBJECT_ADDED, self, obj)
+        if self._batchDepth:
+            self._batchAddedObjects.append(obj)
+        else:
+            self.callbacks.process(self.OBJECT_ADDED, self, obj)
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Context manager for adding, removing and renaming many objects at once.
+
+        Objects are added, removed and renamed in the tree immediately, so lookups
+        such as findChild work inside the batch. The whole batch runs inside one
+        reset of the item model with its signals blocked, so no row or data change
+        signals are emitted for the individual changes and the sort proxy and tree
+        view rebuild once when the outermost batch exits. Top level expansion and
+        OBJECT_ADDED are deferred until then, expansion and selection are
+        restored, and OBJECT_ADDED is processed for the objects that are still in
+        the tree.
+        """
+        if self.itemModel is None:
+            yield
+            return
+
+        self._batchDepth += 1
+        if self._batchDepth == 1:
+            self._beginBatch()
+        try:
+            yield
+        finally:
+            self._batchDepth -= 1
+            if self._batchDepth == 0:
+                self._endBatch()
+
+    def _beginBatch(self):
+        self._batchSelectedObject = self.getSelectedObject()
+        self._batchExpandedObjects = [
+            obj
+            for obj, item in self._objectToItem.items()
+            if item.hasChildren() and self.treeView.isExpanded(self.sortModel.mapFromSource(item.index()))
+        ]
+        self._batchAddedObjects = []
+        self.itemModel.beginBatchReset()
+
+    def _endBatch(self):
+        self.itemModel.endBatchReset()
+
+        for obj in self._batchExpandedObjects:
+            if obj._tree is self:
+                self.expand(obj)
+        if self._batchSelectedObject is not None:
+            if self._batchSelectedObject._tree is self:
+                item = self._getItemForObject(self._batchSelectedObject)
+                self.treeView.setCurrentIndex(self.sortModel.mapFromSource(item.index()))
+            else:
+                # The reset clears the selection without notifying, update the properties panel
+                self._onTreeSelectionChanged()
+
+        addedObjects = self._batchAddedObjects
+        self._batchAddedObjects = []
+        self._batchExpandedObjects = []
+        self._batchSelectedObject = None
+        for obj in addedObjects:
+            if obj._tree is self:
+                self.callbacks.process(self.OBJECT_ADDED, self, obj)
 
     def collapse(self, obj):
         item = self._getItemForObject(obj)
@@ -578,7 +795,7 @@ class ObjectModelTree:
     def init(self, treeView=None, propertiesPanel=None):
         treeView = treeView or QtWidgets.QTreeView()
 
-        itemModel = QtGui.QStandardItemModel()
+        itemModel = ObjectModelItemModel()
         itemModel.setColumnCount(2)
         itemModel.setHeaderData(0, QtCore.Qt.Horizontal, "Name")
         itemModel.setHeaderData(1, QtCore.Qt.Horizontal, Icons.getIcon(Icons.Eye), QtCore.Qt.DecorationRole)
@@ -675,10 +892,22 @@ def findTopLevelObjectByName(name):
     return _t.findTopLevelObjectByName(name)
 
 
+def findObjectByProp(prop):
+    return _t.findObjectByProp(prop)
+
+
+def findObjectByDataSet(dataSet):
+    return _t.findObjectByDataSet(dataSet)
+
+
 def removeFromObjectModel(obj):
     _t.removeFromObjectModel(obj)
 
 
+def batch():
+    return _t.batch()
+
+
 def addToObjectModel(obj, parentObj=None):
     _t.addToObjectModel(obj, parentObj)
 
@@ -0,0 +1,115 @@
+"""Deterministic offline rendering of TimestampSlider playback to video."""
+
+import math
+
+import numpy as np
+
+from director.ffmpeg_writer import FFMpegWriter, ThreadedFrameWriter
+from director.screen_recorder import capture_screenshot
+
+
+class OfflineVideoRenderer:
+    """
+    Step a TimestampSlider through a time range at an exact output frame rate and
+    pass one rendered frame per step to a writer.
+
+    Each step sets the slider time, which runs every on_time_changed handler
+    synchronously, then forces a render of the view and reads back the frame.
+    No Qt timer is involved, so the output does not depend on how fast the
+    machine renders, and the loop runs as fast as the hardware allows. The view
+    can be a VTKWidget or a HeadlessView.
+
+    Frames are passed to the writer bottom row first, as returned by
+    capture_screenshot(view, flip=False). Create an FFMpegWriter with
+    flip_vertical=True to write them, as render_slider_to_video() does.
+    """
+
+    def __init__(self, slider, view, framerate=60.0, start_time=None, end_time=None):
+        """
+        Args:
+            slider: TimestampSlider to step through time
+            view: view to render and capture, e.g. VTKWidget or HeadlessView
+            framerate: output frames per second
+            start_time: first absolute timestamp in seconds, defaults to the slider's minimum
+            end_time: last absolute timestamp in seconds, defaults to the slider's maximum
+        """
+        min_timestamp, max_timestamp = slider.get_time_range()
+        self.slider = slider
+        self.view = view
+        self.framerate = framerate
+        self.start_time = min_timestamp if start_time is None else start_time
+        self.end_time = max_timestamp if end_time is None else end_time
+        if self.end_time < self.start_time:
+            raise ValueError(f"end_time {self.end_time} is before start_time {self.start_time}")
+
+    def frame_times(self):
+        """Return the absolute timestamp of every output frame."""
+        # small tolerance so an end time on an exact frame boundary is included
+        num_frames = int(math.floor((self.end_time - self.start_time) * self.framerate + 1e-6)) + 1
+        return self.start_time + np.arange(num_frames) / self.framerate
+
+    def frame_size(self):
+        """Return the (width, height) of output frames, rounded down to even numbers for ffmpeg."""
+        width, height = self.view.renderWindow().GetSize()
+        return width - width % 2, height - height % 2
+
+    def render_frame(self, timestamp_s):
+        """Set the slider to timestamp_s, render the view and return the frame."""
+        self.slider.set_time(timestamp_s)
+        self.view.forceRender()
+        frame = capture_screenshot(self.view, flip=False)
+        width, height = self.frame_size()
+        if frame.shape[:2] != (height, width):
+            frame = np.ascontiguousarray(frame[:height, :width])
+        return frame
+
+    def run(self, writer, progress_callback=None):
+        """
+        Render every frame and write it with writer.write_frame(). The writer is
+        not closed. The slider is paused during rendering and restored to its
+        previous time afterwards.
+
+        Args:
+            writer: object with a write_frame(frame) method
+            progress_callback: optional function called with (frame_index, num_frames) after each frame
+
+        Returns:
+            The number of frames written.
+        """
+        self.slider.slider.pause()
+        previous_time = self.slider.get_time()
+        times = self.frame_times()
+        try:
+            for i, timestamp_s in enumerate(times):
+                writer.write_frame(self.render_frame(float(timestamp_s)))
+                if progress_callback is not None:
+                    progress_callback(i, len(times))
+        finally:
+            self.slider.set_time(previous_time)
+        return len(times)
+
+
+def render_slider_to_video(
+    slider,
+    view,
+    filename,
+    framerate=60.0,
+    start_time=None,
+    end_time=None,
+    profile="quality",
+    progress_callback=None,
+):
+    """
+    Render slider playback in view to a video file with an OfflineVideoRenderer.
+
+    Frames are encoded by ffmpeg on a background thread, so reading back the
+    next frame overlaps with encoding the previous one.
+
+    Returns:
+        The number of frames written.
+    """
+    renderer = OfflineVideoRenderer(slider, view, framerate=framerate, start_time=start_time, end_time=end_time)
+    width, height = renderer.frame_size()
+    ffmpeg_writer = FFMpegWriter(filename, width, height, framerate=framerate, flip_vertical=True, profile=profile)
+    with ThreadedFrameWriter(ffmpeg_writer, policy="block") as writer:
+        return renderer.run(writer, progress_callback=progress_callback)
@@ -0,0 +1,186 @@
+"""Level of detail rendering for long time series plots.
+
+MinMaxPyramid precomputes, once per series, the minimum and maximum value of
+every bucket of samples at a series of bucket sizes, each a fixed factor larger
+than the last. LodPlotDataItem draws a series from the pyramid: when the visible
+x range or the plot width changes it selects the finest level whose envelope
+fits the pixel budget, and passes only the buckets in and around the visible
+range to setData(). Drawing cost then depends on the plot width in pixels
+rather than on the number of samples.
+"""
+
+import numpy as np
+import pyqtgraph as pg
+
+DEFAULT_FACTOR = 8
+DEFAULT_MIN_SAMPLES = 65536
+
+
+class MinMaxPyramid:
+    """
+    Min/max envelopes of a time series at bucket sizes factor, factor**2, ...
+
+    Level 0 is the raw data. Level k stores the minimum and maximum of each
+    bucket of factor**k consecutive samples and is drawn as two points per
+    bucket, so a level covers the same peaks as the raw data with 2 / factor**k
+    as many points. Levels are built down to about 2048 buckets and use about
+    2 / (factor - 1) times the memory of the raw values. Series with at most
+    min_samples samples, or whose x values are not sorted, have no levels and
+    are always drawn in full.
+    """
+
+    def __init__(self, x, y, factor=DEFAULT_FACTOR, min_samples=DEFAULT_MIN_SAMPLES):
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        self.factor = factor
+        self.levels: list[tuple[np.ndarray, np.ndarray]] = []
+
+        n = len(self.x)
+        self._sorted = n > 0 and bool(np.all(self.x[1:] >= self.x[:-1]))
+        if self._sorted and n > min_samples:
+            self._build_levels()
+
+        self.x_range = self._compute_x_range()
+        self.y_range = self._compute_y_range()
+
+    def _build_levels(self):
+        mins = maxs = self.y
+        while len(mins) > 2048:
+            starts = np.arange(0, len(mins), self.factor)
+            # fmin/fmax ignore NaN gaps unless a whole bucket is NaN
+            mins = np.fmin.reduceat(mins, starts)
+            maxs = np.fmax.reduceat(maxs, starts)
+            self.levels.append((mins, maxs))
+
+    def _compute_x_range(self):
+        if not len(self.x):
+            return None
+        if self._sorted:
+            return float(self.x[0]), float(self.x[-1])
+        return _finite_range(self.x)
+
+    def _compute_y_range(self):
+        if self.levels:
+            mins, maxs = self.levels[-1]
+            low, high = _finite_range(mins), _finite_range(maxs)
+            if low is None or high is None:
+                return None
+            return low[0], high[1]
+        return _finite_range(self.y)
+
+    def __len__(self):
+        return len(self.x)
+
+    def num_levels(self):
+        """Return the number of levels, including the raw data."""
+        return len(self.levels) + 1
+
+    def bucket_size(self, level):
+        return self.factor**level
+
+    def num_buckets(self, level):
+        return len(self.levels[level - 1][0]) if level else len(self.x)
+
+    def sample_range(self, x_min, x_max):
+        """Return (start, stop) indices of the samples in [x_min, x_max], plus one on each side."""
+        n = len(self.x)
+        if not self._sorted:
+            return 0, n
+        start = max(int(np.searchsorted(self.x, x_min, side="left")) - 1, 0)
+        stop = min(int(np.searchsorted(self.x, x_max, side="right")) + 1, n)
+        return start, max(start, stop)
+
+    def select(self, x_min, x_max, max_points, current=None):
+        """
+        Return (level, start, stop) covering [x_min, x_max] in at most about
+        max_points points, as bucket indices into the level. The range extends
+        one visible width past each side so small pans can reuse it: if current,
+        a previous selection, is at the same level and still covers the range,
+        it is returned unchanged.
+        """
+        if not self.levels:
+            return 0, 0, len(self.x)
+        start, stop = self.sample_range(x_min, x_max)
+        count = stop - start
+        level = 0
+        while level < len(self.levels) and self._points(level, count) > max_points:
+            level += 1
+        if current is not None and current[0] == level and self._covers(current, start, stop):
+            return current
+        bucket = self.bucket_size(level)
+        start = max(start - count, 0) // bucket
+        stop = min(-(-(stop + count) // bucket), self.num_buckets(level))
+        return level, start, stop
+
+    def _points(self, level, count):
+        return count if level == 0 else 2 * count / self.bucket_size(level)
+
+    def covers(self, selection, x_min, x_max):
+        """Return True if selection, from select(), contains every sample in [x_min, x_max]."""
+        if not self.levels:
+            return True
+        return self._covers(selection, *self.sample_range(x_min, x_max))
+
+    def _covers(self, selection, sample_start, sample_stop):
+        level, start, stop = selection
+        bucket = self.bucket_size(level)
+        return start * bucket <= sample_start and min(stop * bucket, len(self.x)) >= sample_stop
+
+    def get_data(self, level, start, stop):
+        """Return (x, y) arrays to draw buckets [start, stop) of level."""
+        if level == 0:
+            return self.x[start:stop], self.y[start:stop]
+        bucket = self.bucket_size(level)
+        mins, maxs = self.levels[level - 1]
+        x = np.repeat(self.x[start * bucket : stop * bucket : bucket], 2)
+        y = np.empty(len(x), dtype=np.result_type(mins, maxs))
+        y[0::2] = mins[start:stop]
+        y[1::2] = maxs[start:stop]
+        return x, y
+
+
+def _finite_range(values):
+    values = values[np.isfinite(values)]
+    if not len(values):
+        return None
+    return float(values.min()), float(values.max())
+
+
+class LodPlotDataItem(pg.PlotDataItem):
+    """
+    PlotDataItem that draws a MinMaxPyramid at the level of detail matching the
+    plot's current x range and pixel width. Call update_lod() when the view
+    range or size changes. dataBounds() reports the bounds of the full series,
+    so auto range is not limited to the part that is currently drawn.
+    """
+
+    # points drawn per pixel of plot width, two per bucket at coarse levels
+    points_per_pixel = 8
+
+    def __init__(self, x, y, **kwargs):
+        lod = MinMaxPyramid(x, y)
+        level = lod.num_levels() - 1
+        selection = (level, 0, lod.num_buckets(level))
+        super().__init__(*lod.get_data(*selection), **kwargs)
+        self.lod = lod
+        self._selection = selection
+
+    def lod_level(self):
+        """Return the pyramid level currently drawn, 0 for the raw data."""
+        return self._selection[0]
+
+    def update_lod(self, x_min, x_max, width_pixels):
+        """Draw the level and range matching the view. Returns True if the drawn data changed."""
+        max_points = max(int(width_pixels), 1) * self.points_per_pixel
+        selection = self.lod.select(x_min, x_max, max_points, current=self._selection)
+        if selection == self._selection:
+            return False
+        self._selection = selection
+        self.setData(*self.lod.get_data(*selection))
+        return True
+
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        if frac >= 1.0 and orthoRange is None:
+            bounds = self.lod.x_range if ax == 0 else self.lod.y_range
+            return bounds if bounds is not None else (None, None)
+        return super().dataBounds(ax, frac, orthoRange)
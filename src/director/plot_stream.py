@@ -0,0 +1,196 @@
+"""Live time series for PlotWidget.
+
+SampleBuffer stores the samples of one series in preallocated numpy arrays
+that grow by doubling, up to an optional maximum after which the oldest
+samples are overwritten. StreamingPlotDataItem appends samples to a buffer and
+passes them to setData() only when flushed, so a plot can receive samples at
+any rate and redraw at most once per frame.
+"""
+
+import numpy as np
+import pyqtgraph as pg
+
+
+class SampleBuffer:
+    """
+    Growable circular buffer of (t, value) samples.
+
+    The buffer starts with room for capacity samples and doubles its storage
+    when full. If max_samples is given, the storage stops growing at
+    max_samples and new samples overwrite the oldest ones. Every sample is
+    written twice, at its ring position and one capacity later, so the
+    retained samples are always a contiguous slice of the storage and
+    get_data() returns them without copying.
+
+    Timestamps are expected to be appended in increasing order. The time range
+    and the value range are kept up to date as samples are appended, without
+    scanning the stored samples. Once samples are overwritten, the value range
+    is kept as the min and max of fixed size blocks of the ring, so an append
+    only rescans the blocks it wrote to and y_range() reduces one value per
+    block.
+    """
+
+    def __init__(self, capacity=1024, max_samples=None, dtype=np.float64):
+        if max_samples is not None:
+            capacity = min(capacity, max_samples)
+        self.max_samples = max_samples
+        self._capacity = max(int(capacity), 1)
+        self._t = np.empty(2 * self._capacity, dtype=np.float64)
+        self._y = np.empty(2 * self._capacity, dtype=dtype)
+        self._head = 0
+        self._count = 0
+        self._y_min = np.nan
+        self._y_max = np.nan
+        self._y_range_stale = False
+        self._block_size = 1
+        self._block_min = None
+        self._block_max = None
+
+    def __len__(self):
+        return self._count
+
+    def capacity(self):
+        return self._capacity
+
+    def clear(self):
+        self._head = 0
+        self._count = 0
+        self._y_min = np.nan
+        self._y_max = np.nan
+        self._y_range_stale = False
+        self._block_min = None
+        self._block_max = None
+
+    def append(self, t, values):
+        """Append one sample, or arrays of timestamps and values with the same length."""
+        t = np.atleast_1d(np.asarray(t, dtype=np.float64))
+        values = np.atleast_1d(np.asarray(values, dtype=self._y.dtype))
+        if t.shape != values.shape or t.ndim != 1:
+            raise ValueError(f"timestamps {t.shape} and values {values.shape} must be 1D arrays of the same length")
+        n = len(t)
+        if not n:
+            return
+        if self.max_samples is not None and n > self.max_samples:
+            t = t[-self.max_samples :]
+            values = values[-self.max_samples :]
+            n = self.max_samples
+
+        self._reserve(self._count + n)
+        capacity = self._capacity
+        start = (self._head + self._count) % capacity
+        first = min(n, capacity - start)
+        for storage, data in ((self._t, t), (self._y, values)):
+            storage[start : start + first] = data[:first]
+            storage[start + capacity : start + capacity + first] = data[:first]
+            storage[: n - first] = data[first:]
+            storage[capacity : capacity + n - first] = data[first:]
+
+        overwritten = max(self._count + n - capacity, 0)
+        self._head = (self._head + overwritten) % capacity
+        self._count = min(self._count + n, capacity)
+        if overwritten:
+            # the ring is full, so every ring position holds a retained sample
+            self._update_blocks(start, n)
+            self._y_range_stale = True
+        elif not self._y_range_stale:
+            # fmin/fmax ignore NaN, including the initial NaN of an empty buffer
+            self._y_min = np.fmin(self._y_min, np.fmin.reduce(values))
+            self._y_max = np.fmax(self._y_max, np.fmax.reduce(values))
+
+    def _reserve(self, count):
+        if count <= self._capacity or self._capacity == self.max_samples:
+            return
+        capacity = max(2 * self._capacity, count)
+        if self.max_samples is not None:
+            capacity = min(capacity, self.max_samples)
+        t, y = self.get_data()
+        self._t = np.empty(2 * capacity, dtype=self._t.dtype)
+        self._y = np.empty(2 * capacity, dtype=self._y.dtype)
+        for storage, data in ((self._t, t), (self._y, y)):
+            storage[: len(data)] = data
+            storage[capacity : capacity + len(data)] = data
+        self._head = 0
+        self._capacity = capacity
+        self._block_min = None
+        self._block_max = None
+
+    def _update_blocks(self, start, n):
+        """Recompute the min and max of the ring blocks that n samples written at start fall into."""
+        capacity = self._capacity
+        y = self._y[:capacity]
+        if self._block_min is None:
+            self._block_size = max(int(np.sqrt(capacity)), 1)
+            num_blocks = -(-capacity // self._block_size)
+            blocks = np.full(num_blocks * self._block_size, np.nan, dtype=y.dtype)
+            blocks[:capacity] = y
+            blocks = blocks.reshape(num_blocks, self._block_size)
+            self._block_min = np.fmin.reduce(blocks, axis=1)
+            self._block_max = np.fmax.reduce(blocks, axis=1)
+            return
+        block_size = self._block_size
+        end = start + n
+        # the written ring positions are [start, end), wrapping past the end of the ring
+        blocks = set(range(start // block_size, (min(end, capacity) - 1) // block_size + 1))
+        if end > capacity:
+            blocks.update(range((end - capacity - 1) // block_size + 1))
+        for block in blocks:
+            block_values = y[block * block_size : (block + 1) * block_size]
+            self._block_min[block] = np.fmin.reduce(block_values)
+            self._block_max[block] = np.fmax.reduce(block_values)
+
+    def get_data(self):
+        """Return (t, values) views of the retained samples, oldest first."""
+        end = self._head + self._count
+        return self._t[self._head : end], self._y[self._head : end]
+
+    def x_range(self):
+        """Return (first, last) timestamp, or None if the buffer is empty."""
+        if not self._count:
+            return None
+        return float(self._t[self._head]), float(self._t[self._head + self._count - 1])
+
+    def y_range(self):
+        """Return (min, max) of the retained values ignoring NaN, or None if there are none."""
+        if self._y_range_stale:
+            self._y_min = np.fmin.reduce(self._block_min)
+            self._y_max = np.fmax.reduce(self._block_max)
+            self._y_range_stale = False
+        if not self._count or np.isnan(self._y_min):
+            return None
+        return float(self._y_min), float(self._y_max)
+
+
+class StreamingPlotDataItem(pg.PlotDataItem):
+    """
+    PlotDataItem backed by a SampleBuffer. append() only stores samples, and
+    flush() passes the new contents to setData(). dataBounds() reports the
+    buffer's bounds without scanning the drawn data.
+    """
+
+    def __init__(self, max_samples=None, **kwargs):
+        super().__init__(**kwargs)
+        self.buffer = SampleBuffer(max_samples=max_samples)
+        self._dirty = False
+
+    def append(self, t, values):
+        self.buffer.append(t, values)
+        self._dirty = True
+
+    def is_dirty(self):
+        return self._dirty
+
+    def flush(self):
+        """Draw the samples appended since the last flush. Returns True if the drawn data changed."""
+        if not self._dirty:
+            return False
+        self._dirty = False
+        t, values = self.buffer.get_data()
+        # copy because later appends overwrite the storage that the curve would draw from
+        self.setData(t.copy(), values.copy())
+        return True
+
+    def dataBounds(self, ax, frac=1.0, orthoRange=None):
+        if frac >= 1.0 and orthoRange is None:
+            bounds = self.buffer.x_range() if ax == 0 else self.buffer.y_range()
+            return bounds if bounds is not None else (None, None)
+        return super().dataBounds(ax, frac, orthoRange)
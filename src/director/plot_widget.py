@@ -9,6 +9,8 @@ from pyqtgraph.dockarea.Dock import DockLabel
 from qtpy import QtWidgets
 
 import director.objectmodel as om
+from director.plot_lod import LodPlotDataItem
+from director.plot_stream import StreamingPlotDataItem
 
 
 @dataclass
@@ -20,6 +22,8 @@ class PlotEntry:
     legend: pg.LegendItem | None = None
     object_item: "PlotObjItem | None" = None
     series_items: "dict[pg.PlotDataItem, PlotSeriesItem]" = field(default_factory=dict)
+    # (min, max) time offset of the plot's series, None until computed after a data change
+    time_range: tuple[float, float] | None = None
 
 
 class DirectorPlotWidget(pg.PlotWidget):
@@ -172,6 +176,13 @@ class PlotWidget(QtCore.QObject):
         self._selected_plot: pg.PlotItem | None = None
         self.object_model = None
         self._plots_removing_from_om = set()
+        self.scroll_window_s = None
+        # Appends to live series are drawn together when this timer fires, about once per frame
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(16)
+        self._flush_timer.timeout.connect(self.flush_samples)
+        self._data_time_range: tuple[float, float] | None = None
 
         # Apply custom styling patch
         DockLabel.updateStyle = updateStylePatched
@@ -243,6 +254,8 @@ class PlotWidget(QtCore.QObject):
 
         plot_item = plot_widget.getPlotItem()
         view_box.setPlotItem(plot_item)
+        view_box.sigXRangeChanged.connect(lambda: self._update_series_lod(plot_item))
+        view_box.sigResized.connect(lambda: self._update_series_lod(plot_item))
 
         dock.label.sigClicked.connect(lambda label, ev: self._on_plot_clicked(plot_item))
 
@@ -313,6 +326,9 @@ class PlotWidget(QtCore.QObject):
             if series in entry.line_series:
                 to_remove = [series]
 
+        if to_remove:
+            self._invalidate_time_range(entry)
+
         for item in to_remove:
             plot_item.removeItem(item)
             entry.line_series.remove(item)
@@ -364,6 +380,7 @@ class PlotWidget(QtCore.QObject):
 
         self._plots.remove(plot_item)
         del self._plot_entries[plot_item]
+        self._data_time_range = None
         del self._plot_docks[plot_item]
 
         # Handle X-Link
@@ -402,7 +419,8 @@ class PlotWidget(QtCore.QObject):
                 column_name = label if values.shape[1] == 1 else f"{label}[{column}]"
                 pen = self._pen_for_index(color_index)
                 color_index += 1
-                line_series = plot_item.plot(time_offsets_s, values[:, column], name=column_name, pen=pen)
+                line_series = LodPlotDataItem(time_offsets_s, values[:, column], name=column_name, pen=pen)
+                plot_item.addItem(line_series)
                 entry.line_series.append(line_series)
 
                 if self.object_model and entry.object_item:
@@ -410,6 +428,85 @@ class PlotWidget(QtCore.QObject):
                     entry.series_items[line_series] = series_item
                     self.object_model.addToObjectModel(series_item, parentObj=entry.object_item)
 
+        self._invalidate_time_range(entry)
+        self._update_series_lod(plot_item)
+
+    def _update_series_lod(self, plot_item: pg.PlotItem) -> None:
+        """Draw each series at the level of detail matching the plot's x range and pixel width."""
+        entry = self._plot_entries.get(plot_item)
+        if entry is None:
+            return
+        view_box = plot_item.getViewBox()
+        x_min, x_max = view_box.viewRange()[0]
+        width_pixels = view_box.width()
+        for series in entry.line_series:
+            if isinstance(series, LodPlotDataItem):
+                series.update_lod(x_min, x_max, width_pixels)
+
+    def append_samples(
+        self,
+        plot_item: pg.PlotItem,
+        series_name: str,
+        timestamps_s: float | np.ndarray,
+        values: float | np.ndarray,
+        max_samples: int | None = None,
+    ) -> StreamingPlotDataItem:
+        """
+        Append samples to a live series, creating it the first time series_name is used.
+
+        Timestamps are absolute like in add_data_to_plot and must increase. The
+        series is redrawn at most once per frame: appends start a 16 ms single
+        shot timer, and every append before it fires is drawn with one setData().
+        max_samples limits the number of samples kept for a new series,
+        dropping the oldest, and is ignored for an existing series.
+        """
+        entry = self._plot_entries[plot_item]
+        series = next((item for item in entry.line_series if item.name() == series_name), None)
+        if series is None:
+            series = StreamingPlotDataItem(
+                max_samples=max_samples, name=series_name, pen=self._pen_for_index(len(entry.line_series))
+            )
+            plot_item.addItem(series)
+            entry.line_series.append(series)
+
+            if self.object_model and entry.object_item:
+                series_item = PlotSeriesItem(self, plot_item, series, series_name)
+                entry.series_items[series] = series_item
+                self.object_model.addToObjectModel(series_item, parentObj=entry.object_item)
+        elif not isinstance(series, StreamingPlotDataItem):
+            raise ValueError(f"plot_widget: series {series_name!r} was not created by append_samples")
+
+        series.append(np.asarray(timestamps_s, dtype=float) - self.start_time_s, values)
+        self._invalidate_time_range(entry)
+
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+        return series
+
+    def set_scroll_window(self, width_s: float | None) -> None:
+        """
+        Keep the x range at the last width_s seconds of the live series as samples
+        are appended, or stop scrolling if width_s is None.
+        """
+        self.scroll_window_s = width_s
+        self.flush_samples()
+
+    def flush_samples(self) -> None:
+        """Draw the samples appended to live series since the last flush."""
+        self._flush_timer.stop()
+
+        latest_s = None
+        for entry in self._plot_entries.values():
+            for series in entry.line_series:
+                if isinstance(series, StreamingPlotDataItem):
+                    series.flush()
+                    x_range = series.buffer.x_range()
+                    if x_range is not None and (latest_s is None or x_range[1] > latest_s):
+                        latest_s = x_range[1]
+
+        if self.scroll_window_s and latest_s is not None and self._x_link_source is not None:
+            self._x_link_source.setXRange(latest_s - self.scroll_window_s, latest_s, padding=0)
+
     def add_horizontal_lines(
         self,
         plot_item: pg.PlotItem,
@@ -467,19 +564,36 @@ class PlotWidget(QtCore.QObject):
         finally:
             self.plot_widget.setUpdatesEnabled(True)
 
-    def _get_data_time_range(self) -> tuple[float, float]:
-        """Compute the min and max time offset from all plotted data."""
-        all_min = float("inf")
-        all_max = float("-inf")
-        for entry in self._plot_entries.values():
+    def _invalidate_time_range(self, entry: PlotEntry) -> None:
+        """Clear the cached time ranges after the series of a plot changed."""
+        entry.time_range = None
+        self._data_time_range = None
+
+    @staticmethod
+    def _get_plot_time_range(entry: PlotEntry) -> tuple[float, float]:
+        """Return the min and max time offset of a plot's series, (inf, -inf) if it has no data."""
+        if entry.time_range is None:
+            all_min = float("inf")
+            all_max = float("-inf")
             for series in entry.line_series:
-                x_data, _ = series.getData()
-                if x_data is not None and len(x_data) > 0:
-                    all_min = min(all_min, x_data[0])
-                    all_max = max(all_max, x_data[-1])
-        if all_min == float("inf"):
-            return 0.0, 0.0
-        return all_min, all_max
+                x_min, x_max = series.dataBounds(0)
+                if x_min is not None:
+                    all_min = min(all_min, x_min)
+                    all_max = max(all_max, x_max)
+            entry.time_range = (all_min, all_max)
+        return entry.time_range
+
+    def _get_data_time_range(self) -> tuple[float, float]:
+        """
+        Return the min and max time offset from all plotted data. The result is
+        cached until data is added to or removed from a plot.
+        """
+        if self._data_time_range is None:
+            ranges = [self._get_plot_time_range(entry) for entry in self._plot_entries.values()]
+            all_min = min((r[0] for r in ranges), default=float("inf"))
+            all_max = max((r[1] for r in ranges), default=float("-inf"))
+            self._data_time_range = (0.0, 0.0) if all_min == float("inf") else (all_min, all_max)
+        return self._data_time_range
 
     def _update_vlines(self, time_offset_s):
         if not self._plots:
@@ -518,35 +632,19 @@ class PlotWidget(QtCore.QObject):
                 else:
                     self.auto_scroll = True
 
-        if not self._suspend_auto_scroll and (time_offset_s < x_min or time_offset_s > x_max):
+        scroll = not self._suspend_auto_scroll and width > 0
+        if scroll and (time_offset_s < x_min or time_offset_s > x_max):
             self._x_link_source.setXRange(time_offset_s - width / 2, time_offset_s + width / 2, padding=0)
+            x_min, x_max = view_box.viewRange()[0]
+            fraction = (current_vline_pos - x_min) / width
 
-        pre_positions = {}
-
-        # Note, the rest of the logic here computes info and updates each plot item.
-        # But the plot items have linked X axes so it really only needs to be done for one.
-        if self.auto_scroll and not self._suspend_auto_scroll:
-            for plot_item in self._plots:
-                entry = self._plot_entries.get(plot_item)
-                if entry is None or entry.vline is None:
-                    continue
-                view_box = plot_item.getViewBox()
-                x_min, x_max = view_box.viewRange()[0]
-                width = x_max - x_min
-                if width <= 0:
-                    continue
-                relative = entry.vline.pos().x()
-                fraction = (relative - x_min) / width
-                pre_positions[plot_item] = (fraction, width)
-
-        for plot_item in self._plots:
-            entry = self._plot_entries.get(plot_item)
-            if entry is None or entry.vline is None:
-                continue
-            entry.vline.setPos(time_offset_s)
-            if self.auto_scroll and not self._suspend_auto_scroll and plot_item in pre_positions:
-                fraction, width = pre_positions[plot_item]
-                self._scroll_to_timestamp(plot_item, time_offset_s, fraction, width)
+        for entry in self._plot_entries.values():
+            if entry.vline is not None:
+                entry.vline.setPos(time_offset_s)
+
+        # The plot items have linked X axes, so scrolling the link source scrolls every plot.
+        if self.auto_scroll and scroll:
+            self._scroll_to_timestamp(self._x_link_source, time_offset_s, fraction, width)
         self._suspend_auto_scroll = False
 
     @staticmethod
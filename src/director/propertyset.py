@@ -1,11 +1,15 @@
+import contextlib
 import copy
+import functools
 import re
+import sys
 from collections import OrderedDict
 from typing import Any, Dict
 
 from director import callbacks
 
 
+@functools.lru_cache(maxsize=4096)
 def cleanPropertyName(s):
     """
     Generate a valid python property name by replacing all non-alphanumeric characters with underscores and adding an initial underscore if the first character is a digit
@@ -14,7 +18,12 @@ def cleanPropertyName(s):
 
 
 class PropertyAttributes(object):
-    """Property attributes for controlling how properties are displayed/edited."""
+    """
+    Property attributes for controlling how properties are displayed/edited.
+
+    Default values are class attributes shared by all instances. An instance only
+    stores the attributes that are passed to the constructor or assigned later.
+    """
 
     _FIELDS = (
         "decimals",
@@ -26,19 +35,18 @@ class PropertyAttributes(object):
         "readOnly",
     )
 
+    decimals = 5
+    minimum = -1e4
+    maximum = 1e4
+    singleStep = 1
+    hidden = False
+    enumNames = None
+    readOnly = False
+
     def __init__(self, **kwargs):
-        defaults = {
-            "decimals": 5,
-            "minimum": -1e4,
-            "maximum": 1e4,
-            "singleStep": 1,
-            "hidden": False,
-            "enumNames": None,
-            "readOnly": False,
-        }
-        defaults.update(kwargs)
-        for field in self._FIELDS:
-            setattr(self, field, defaults.get(field))
+        for field, value in kwargs.items():
+            if field in self._FIELDS:
+                setattr(self, field, value)
 
     def __getitem__(self, key):
         """Allow dict-like access."""
@@ -60,9 +68,9 @@ class PropertyAttributes(object):
 
 def fromQColor(propertyName, propertyValue):
     """Convert QColor to list if needed."""
-    from qtpy import QtGui
-
-    if isinstance(propertyValue, QtGui.QColor):
+    # A QColor can only exist if QtGui has been imported
+    QtGui = sys.modules.get("qtpy.QtGui")
+    if QtGui is not None and isinstance(propertyValue, QtGui.QColor):
         return [propertyValue.red() / 255.0, propertyValue.green() / 255.0, propertyValue.blue() / 255.0]
     else:
         return propertyValue
@@ -70,23 +78,42 @@ def fromQColor(propertyName, propertyValue):
 
 class PropertySet(object):
     PROPERTY_CHANGED_SIGNAL = "PROPERTY_CHANGED_SIGNAL"
+    PROPERTIES_CHANGED_SIGNAL = "PROPERTIES_CHANGED_SIGNAL"
     PROPERTY_ADDED_SIGNAL = "PROPERTY_ADDED_SIGNAL"
     PROPERTY_REMOVED_SIGNAL = "PROPERTY_REMOVED_SIGNAL"
     PROPERTY_ATTRIBUTE_CHANGED_SIGNAL = "PROPERTY_ATTRIBUTE_CHANGED_SIGNAL"
 
+    _SIGNALS = frozenset(
+        [
+            PROPERTY_CHANGED_SIGNAL,
+            PROPERTIES_CHANGED_SIGNAL,
+            PROPERTY_ADDED_SIGNAL,
+            PROPERTY_REMOVED_SIGNAL,
+            PROPERTY_ATTRIBUTE_CHANGED_SIGNAL,
+        ]
+    )
+
+    # Slots keep PropertySet small for models with many thousands of items. The
+    # __dict__ slot is only allocated if an attribute that is not a property is set.
+    __slots__ = (
+        "callbacks",
+        "_properties",
+        "_attributes",
+        "_alternateNames",
+        "_batchDepth",
+        "_batchPreviousValues",
+        "__dict__",
+        "__weakref__",
+    )
+
     def __init__(self):
-        self.callbacks = callbacks.CallbackRegistry(
-            [
-                self.PROPERTY_CHANGED_SIGNAL,
-                self.PROPERTY_ADDED_SIGNAL,
-                self.PROPERTY_REMOVED_SIGNAL,
-                self.PROPERTY_ATTRIBUTE_CHANGED_SIGNAL,
-            ]
-        )
+        self.callbacks = callbacks.CallbackRegistry(self._SIGNALS)
 
-        self._properties = OrderedDict()
+        self._properties = {}
         self._attributes = {}
         self._alternateNames = {}
+        self._batchDepth = 0
+        self._batchPreviousValues = None
 
     def propertyNames(self):
         return list(self._properties.keys())
@@ -107,6 +134,18 @@ class PropertySet(object):
 
         return self.connectPropertyChanged(onPropertyChanged)
 
+    def connectPropertiesChanged(self, func):
+        """
+        Connect func(propertySet, propertyNames) to be called once per group of changes.
+
+        propertyNames is a tuple with the name of a single setProperty call, or all
+        the properties changed inside a batch_update.
+        """
+        return self.callbacks.connect(self.PROPERTIES_CHANGED_SIGNAL, func)
+
+    def disconnectPropertiesChanged(self, callbackId):
+        self.callbacks.disconnect(callbackId)
+
     def connectPropertyAdded(self, func):
         return self.callbacks.connect(self.PROPERTY_ADDED_SIGNAL, func)
 
@@ -166,7 +205,7 @@ class PropertySet(object):
         inds.remove(currentIndex)
         inds.insert(newIndex, currentIndex)
         items = list(self._properties.items())
-        self._properties = OrderedDict([items[i] for i in inds])
+        self._properties = dict([items[i] for i in inds])
 
     def setProperty(self, propertyName, propertyValue):
         previousValue = self._properties[propertyName]
@@ -178,7 +217,48 @@ class PropertySet(object):
             return
 
         self._properties[propertyName] = propertyValue
+        if self._batchDepth:
+            self._batchPreviousValues.setdefault(propertyName, previousValue)
+            return
         self.callbacks.process(self.PROPERTY_CHANGED_SIGNAL, self, propertyName)
+        self.callbacks.process(self.PROPERTIES_CHANGED_SIGNAL, self, (propertyName,))
+
+    @contextlib.contextmanager
+    def batch_update(self):
+        """
+        Context manager that coalesces property change notifications.
+
+        Values set inside the batch are stored immediately, but no signals are
+        emitted until the outermost batch exits. Then PROPERTY_CHANGED_SIGNAL is
+        emitted once for each property whose value differs from its value before
+        the batch, followed by a single PROPERTIES_CHANGED_SIGNAL with all of
+        their names.
+        """
+        if self._batchDepth == 0:
+            self._batchPreviousValues = {}
+        self._batchDepth += 1
+        try:
+            yield self
+        finally:
+            self._batchDepth -= 1
+            if self._batchDepth == 0:
+                self._flushBatch()
+
+    def isBatchUpdating(self):
+        return self._batchDepth > 0
+
+    def _flushBatch(self):
+        previousValues = self._batchPreviousValues
+        self._batchPreviousValues = None
+        changedNames = tuple(
+            name
+            for name, previousValue in previousValues.items()
+            if name in self._properties and self._properties[name] != previousValue
+        )
+        for name in changedNames:
+            self.callbacks.process(self.PROPERTY_CHANGED_SIGNAL, self, name)
+        if changedNames:
+            self.callbacks.process(self.PROPERTIES_CHANGED_SIGNAL, self, changedNames)
 
     def getPropertyAttribute(self, propertyName, propertyAttribute):
         attributes = self._attributes[propertyName]
@@ -190,47 +270,29 @@ class PropertySet(object):
             attributes[propertyAttribute] = value
             self.callbacks.process(self.PROPERTY_ATTRIBUTE_CHANGED_SIGNAL, self, propertyName, propertyAttribute)
 
-    def __getattribute__(self, name):
+    def __getattr__(self, name):
+        """Allow getting properties via alternate names."""
+        # Only called when normal attribute lookup fails
         try:
-            return object.__getattribute__(self, name)
-        except AttributeError as exc:
             alternateNames = object.__getattribute__(self, "_alternateNames")
-            if name in alternateNames:
-                return object.__getattribute__(self, "getProperty")(alternateNames[name])
-            else:
-                raise exc
+        except AttributeError:
+            alternateNames = {}
+        if name in alternateNames:
+            return self.getProperty(alternateNames[name])
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     def __setattr__(self, name, value):
         """Allow setting properties via alternate names."""
-        # First, check if this is a real attribute (one that exists or is being initialized)
-        # We need to check this carefully to avoid infinite recursion
-
-        # Check if this is a protected/private attribute or an internal attribute
-        if name.startswith("_") or name in ["callbacks", "_properties", "_attributes", "_alternateNames"]:
+        if name.startswith("_") or name == "callbacks":
             object.__setattr__(self, name, value)
             return
 
-        # Try to get the attribute - if it exists, set it normally
-        try:
-            # If we can get it, it's a real attribute
-            object.__getattribute__(self, name)
+        propertyName = self._alternateNames.get(name)
+        if propertyName is None:
+            # Not a property, set a plain attribute
             object.__setattr__(self, name, value)
             return
-        except AttributeError:
-            # Attribute doesn't exist, check if it's an alternate property name
-            try:
-                alternateNames = object.__getattribute__(self, "_alternateNames")
-                if name in alternateNames:
-                    # Found as alternate name, set the property
-                    propertyName = alternateNames[name]
-                    object.__getattribute__(self, "setProperty")(propertyName, value)
-                    return
-                else:
-                    # Not found, raise AttributeError
-                    raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
-            except AttributeError:
-                # _alternateNames doesn't exist yet (during __init__), just set normally
-                object.__setattr__(self, name, value)
+        self.setProperty(propertyName, value)
 
     # ------------------------------------------------------------------
     # Serialization helpers
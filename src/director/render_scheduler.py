@@ -0,0 +1,178 @@
+"""Central scheduler that coalesces and rate limits render requests across views."""
+
+import math
+import time
+import weakref
+
+from qtpy.QtCore import QTimer
+
+
+class _ViewState:
+    """Render bookkeeping for one view registered with a RenderScheduler."""
+
+    __slots__ = (
+        "timer",
+        "pending",
+        "interactivePending",
+        "interacting",
+        "lastRequestTime",
+        "lastRenderTime",
+        "requested",
+        "serviced",
+        "skipped",
+    )
+
+    def __init__(self, timer):
+        self.timer = timer
+        self.pending = False
+        self.interactivePending = False
+        self.interacting = False
+        self.lastRequestTime = 0.0
+        self.lastRenderTime = 0.0
+        self.requested = 0
+        self.serviced = 0
+        self.skipped = 0
+
+
+class RenderScheduler:
+    """
+    Coalesce render requests for a set of views and cap each view's render rate.
+
+    A view calls requestRender() instead of rendering directly. The first request
+    schedules a render on a single shot timer, no sooner than 1 / maxFps seconds
+    after the view's previous frame. Requests that arrive while a render is
+    already scheduled are dropped and counted as skipped. A scheduled render is
+    also skipped if the view rendered by other means after the last request, for
+    example when the interactor renders during camera motion.
+
+    Interactive requests, such as camera animation, bypass the frame rate cap and
+    render on the next event loop iteration. While the user is dragging the
+    camera in a view, data driven requests for that view wait a full frame
+    interval so the interactor's own renders take priority.
+    """
+
+    def __init__(self, maxFps=60.0):
+        self._maxFps = maxFps
+        # weak keys so a view that is never closed can still be garbage collected
+        self._views = weakref.WeakKeyDictionary()
+
+    def setMaxFps(self, maxFps):
+        """Set the maximum renders per second per view, or None to disable the cap."""
+        self._maxFps = maxFps
+
+    def maxFps(self):
+        return self._maxFps
+
+    def registerView(self, view):
+        """
+        Start scheduling renders for view. The view must provide forceRender()
+        and call notifyRendered() whenever it starts rendering a frame.
+        """
+        if view in self._views:
+            return
+        timer = QTimer(view)
+        timer.setSingleShot(True)
+        viewRef = weakref.ref(view)
+        timer.timeout.connect(lambda: self._onTimer(viewRef()))
+        self._views[view] = _ViewState(timer)
+
+    def unregisterView(self, view):
+        state = self._views.pop(view, None)
+        if state is not None:
+            state.timer.stop()
+
+    def isRegistered(self, view):
+        return view in self._views
+
+    def requestRender(self, view, interactive=False):
+        """Request a render of view. Redundant requests are coalesced."""
+        state = self._views[view]
+        state.requested += 1
+        state.lastRequestTime = time.perf_counter()
+
+        if state.pending:
+            if interactive and not state.interactivePending:
+                # promote the scheduled render ahead of the frame rate cap
+                state.interactivePending = True
+                state.timer.start(0)
+            state.skipped += 1
+            return
+
+        state.pending = True
+        state.interactivePending = interactive
+        state.timer.start(self._delayMs(state, interactive))
+
+    def hasPendingRender(self, view):
+        state = self._views.get(view)
+        return state is not None and state.pending
+
+    def cancelPendingRender(self, view):
+        """Cancel a scheduled render, for example because the view is rendering now."""
+        state = self._views.get(view)
+        if state is not None and state.pending:
+            state.pending = False
+            state.interactivePending = False
+            state.timer.stop()
+
+    def notifyRendered(self, view):
+        """Record that view rendered a frame, whatever triggered the render."""
+        state = self._views.get(view)
+        if state is not None:
+            state.lastRenderTime = time.perf_counter()
+
+    def setInteracting(self, view, interacting):
+        """Mark whether the user is currently moving the camera in view."""
+        state = self._views.get(view)
+        if state is not None:
+            state.interacting = interacting
+
+    def getStats(self, view=None):
+        """
+        Return a dict with the number of requested, serviced and skipped renders
+        for view, or summed over all registered views if view is None.
+        """
+        states = [self._views[view]] if view is not None else list(self._views.values())
+        return {
+            "requested": sum(state.requested for state in states),
+            "serviced": sum(state.serviced for state in states),
+            "skipped": sum(state.skipped for state in states),
+        }
+
+    def resetStats(self):
+        for state in self._views.values():
+            state.requested = 0
+            state.serviced = 0
+            state.skipped = 0
+
+    def _delayMs(self, state, interactive):
+        if interactive or not self._maxFps:
+            return 0
+        interval = 1.0 / self._maxFps
+        if state.interacting:
+            return int(math.ceil(interval * 1000))
+        remaining = state.lastRenderTime + interval - time.perf_counter()
+        return max(0, int(math.ceil(remaining * 1000)))
+
+    def _onTimer(self, view):
+        state = self._views.get(view) if view is not None else None
+        if state is None or not state.pending:
+            return
+        state.pending = False
+        state.interactivePending = False
+        if state.lastRenderTime >= state.lastRequestTime:
+            # the view already rendered everything that was requested
+            state.skipped += 1
+            return
+        state.serviced += 1
+        view.forceRender()
+
+
+_defaultScheduler = None
+
+
+def getDefaultRenderScheduler():
+    """Return the RenderScheduler shared by all views."""
+    global _defaultScheduler
+    if _defaultScheduler is None:
+        _defaultScheduler = RenderScheduler()
+    return _defaultScheduler
@@ -0,0 +1,147 @@
+"""Per-frame render timing statistics for a view."""
+
+import collections
+import time
+
+import numpy as np
+
+import director.vtkAll as vtk
+import director.vtkNumpy as vnp
+
+# Total seconds spent in Python update callbacks, such as TimerCallback ticks,
+# since the process started. Views sample it once per frame.
+_totalUpdateTime = 0.0
+
+
+def addUpdateTime(seconds):
+    """Record time spent in a Python update callback outside of rendering."""
+    global _totalUpdateTime
+    _totalUpdateTime += seconds
+
+
+def getTotalUpdateTime():
+    """Return the total seconds recorded with addUpdateTime()."""
+    return _totalUpdateTime
+
+
+def countTriangles(cellArray):
+    """
+    Return the number of triangles drawn for a vtkCellArray of polygons or
+    triangle strips, npts - 2 for each cell.
+    """
+    if cellArray is None or not cellArray.GetNumberOfCells():
+        return 0
+    cellSizes = np.diff(vnp.numpy_support.vtk_to_numpy(cellArray.GetOffsetsArray()))
+    return int(np.maximum(cellSizes - 2, 0).sum())
+
+
+def countScene(renderer):
+    """Return the number of visible actors of a renderer and the triangles and points of their inputs."""
+    actors = triangles = points = 0
+    for actor in renderer.GetActors():
+        if not actor.GetVisibility():
+            continue
+        actors += 1
+        mapper = actor.GetMapper()
+        dataset = mapper.GetInput() if mapper else None
+        if isinstance(dataset, vtk.vtkPolyData):
+            triangles += countTriangles(dataset.GetPolys()) + countTriangles(dataset.GetStrips())
+            points += dataset.GetNumberOfPoints()
+    return actors, triangles, points
+
+
+FrameStats = collections.namedtuple(
+    "FrameStats", ["startTime", "renderTime", "updateTime", "actors", "triangles", "points"]
+)
+
+
+class RenderStats:
+    """
+    Collect timing and scene size for the most recent frames rendered by a view.
+
+    The view calls startFrame() and endFrame() around every render. Each frame
+    records the render duration, the Python update time since the previous
+    frame, and the number of visible actors and the triangles and points of
+    their inputs.
+    """
+
+    def __init__(self, maxFrames=1000):
+        self.frames = collections.deque(maxlen=maxFrames)
+        self._startTime = None
+        self._lastUpdateTotal = getTotalUpdateTime()
+
+    def clear(self):
+        self.frames.clear()
+        self._startTime = None
+        self._lastUpdateTotal = getTotalUpdateTime()
+
+    def startFrame(self):
+        self._startTime = time.perf_counter()
+
+    def endFrame(self, actors=0, triangles=0, points=0):
+        if self._startTime is None:
+            return
+        endTime = time.perf_counter()
+        updateTotal = getTotalUpdateTime()
+        self.frames.append(
+            FrameStats(
+                self._startTime,
+                endTime - self._startTime,
+                updateTotal - self._lastUpdateTotal,
+                actors,
+                triangles,
+                points,
+            )
+        )
+        self._lastUpdateTotal = updateTotal
+        self._startTime = None
+
+    def lastFrame(self):
+        return self.frames[-1] if self.frames else None
+
+    def getRenderTimes(self):
+        """Return the render durations of the recorded frames in seconds."""
+        return np.array([frame.renderTime for frame in self.frames])
+
+    def getPercentiles(self, percentiles=(50, 95, 99)):
+        """Return a dict mapping each percentile to the render time in seconds."""
+        renderTimes = self.getRenderTimes()
+        if not len(renderTimes):
+            return {p: 0.0 for p in percentiles}
+        return dict(zip(percentiles, np.percentile(renderTimes, percentiles).tolist()))
+
+    def getHistogram(self, bins=20):
+        """Return (counts, binEdges) of the recorded render times in seconds."""
+        return np.histogram(self.getRenderTimes(), bins=bins)
+
+    def getSummary(self):
+        """Return a dict summarizing the recorded frames."""
+        last = self.lastFrame()
+        percentiles = self.getPercentiles()
+        return {
+            "frames": len(self.frames),
+            "p50": percentiles[50],
+            "p95": percentiles[95],
+            "p99": percentiles[99],
+            "update_time": last.updateTime if last else 0.0,
+            "actors": last.actors if last else 0,
+            "triangles": last.triangles if last else 0,
+            "points": last.points if last else 0,
+        }
+
+    def formatSummary(self):
+        """Return the summary as text for an on-screen overlay."""
+        summary = self.getSummary()
+        return (
+            "render p50 {:.1f} ms  p95 {:.1f} ms  p99 {:.1f} ms\n"
+            "update {:.1f} ms\n"
+            "actors {:d}  triangles {:d}  points {:d}".format(
+                summary["p50"] * 1000,
+                summary["p95"] * 1000,
+                summary["p99"] * 1000,
+                summary["update_time"] * 1000,
+                summary["actors"],
+                summary["triangles"],
+                summary["points"],
+            )
+        )
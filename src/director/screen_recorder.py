@@ -6,21 +6,25 @@ import subprocess
 import sys
 from pathlib import Path
 
+import numpy as np
 import qtpy.QtCore as QtCore
 import qtpy.QtGui as QtGui
 import qtpy.QtWidgets as QtWidgets
 
 from director import vtkAll as vtk
 from director import vtkNumpy as vnp
-from director.ffmpeg_writer import FFMpegWriter
+from director.ffmpeg_writer import ENCODER_PROFILES, FFMpegWriter, ThreadedFrameWriter
 from director.timercallback import TimerCallback
 
 
-def capture_screenshot(view):
+def capture_screenshot(view, flip=True):
     """Capture a screenshot from the view and return as numpy array.
 
     Args:
         view: VTKWidget instance to capture from
+        flip: If True, return the top row first. If False, return OpenGL's
+              bottom-up row order as a contiguous array that shares the
+              VTK image's memory.
 
     Returns:
         numpy array of shape (height, width, 3) with uint8 RGB data
@@ -35,7 +39,7 @@ def capture_screenshot(view):
     grabber.Update()
 
     vtk_image = grabber.GetOutput()
-    numpy_image = vnp.getNumpyImageFromVtk(vtk_image)
+    numpy_image = vnp.getNumpyImageFromVtk(vtk_image, flip=flip)
     return numpy_image
 
 
@@ -55,8 +59,18 @@ class ScreenRecorder:
         self.view = view
         self.framerate = 30.0
 
+        # Frames are encoded on a background thread. When the encoder falls behind
+        # by frame_queue_size frames, the 'block' policy waits and 'drop' skips frames.
+        self.frame_queue_size = 16
+        self.frame_queue_policy = "block"
+
+        # Name of an ffmpeg_writer.ENCODER_PROFILES entry. 'fast' keeps up with
+        # 1080p60 capture on typical machines, unlike the writer's slow default.
+        self.encoder_profile = "fast"
+
         self.writer = None
         self.is_recording = False
+        self.last_recording_stats = None
         self.recording_width = None
         self.recording_height = None
         self.locked_by_recorder = False
@@ -173,6 +187,22 @@ class ScreenRecorder:
 
         self.capture_mode = "timer"
 
+        # Encoder profile submenu
+        encoder_menu = self.context_menu.addMenu("Encoder")
+        self.encoder_group = QtGui.QActionGroup(encoder_menu)
+        self.encoder_group.setExclusive(True)
+        for profile in ENCODER_PROFILES:
+            action = QtWidgets.QAction(profile.capitalize(), encoder_menu)
+            action.setCheckable(True)
+            action.setChecked(profile == self.encoder_profile)
+            action.triggered.connect(lambda checked, profile=profile: self._set_encoder_profile(profile))
+            self.encoder_group.addAction(action)
+            encoder_menu.addAction(action)
+
+    def _set_encoder_profile(self, profile: str):
+        """Set the ffmpeg encoder profile used for new recordings."""
+        self.encoder_profile = profile
+
     def _set_capture_mode(self, mode: str):
         """Set the capture mode ('timer' or 'playback')."""
         self.capture_mode = mode
@@ -291,8 +321,18 @@ class ScreenRecorder:
 
         try:
             # Create FFMpegWriter
-            self.writer = FFMpegWriter(
-                filename=self.current_filename, width=width, height=height, framerate=self.framerate
+            # The writer receives frames bottom row first, as read back from OpenGL,
+            # and ffmpeg flips them. write_frame() flips top-down frames to match.
+            ffmpeg_writer = FFMpegWriter(
+                filename=self.current_filename,
+                width=width,
+                height=height,
+                framerate=self.framerate,
+                flip_vertical=True,
+                profile=self.encoder_profile,
+            )
+            self.writer = ThreadedFrameWriter(
+                ffmpeg_writer, max_queue_size=self.frame_queue_size, policy=self.frame_queue_policy
             )
         except Exception as e:
             # If creation failed, cleanup
@@ -333,7 +373,7 @@ class ScreenRecorder:
         # Stop timer immediately
         self.capture_timer.stop()
 
-        # Close the writer
+        # Close the writer, waiting for queued frames to be encoded
         try:
             self.writer.close()
         except Exception as e:
@@ -343,6 +383,7 @@ class ScreenRecorder:
             error_dialog.setText(f"Error closing video file:\n{str(e)}")
             error_dialog.exec()
 
+        self.last_recording_stats = self.writer.get_stats()
         self.writer = None
         self.is_recording = False
 
@@ -469,6 +510,15 @@ class ScreenRecorder:
             elif sys.platform == "win32":
                 os.startfile(str(videos_dir))
 
+    def get_recording_stats(self):
+        """Return frames captured, encoded and dropped, and the queue depth.
+
+        Returns the stats of the current recording, or of the last one if not recording.
+        """
+        if self.writer is not None:
+            return self.writer.get_stats()
+        return self.last_recording_stats
+
     def get_widget(self):
         """Get the record button widget for adding to toolbar."""
         return self.record_button
@@ -500,10 +550,10 @@ class ScreenRecorder:
             return
 
         try:
-            # Capture screenshot
-            frame = capture_screenshot(self.view)
+            # Capture screenshot without flipping, the writer flips in ffmpeg
+            frame = capture_screenshot(self.view, flip=False)
             # Write frame
-            self.write_frame(frame)
+            self._write_raw_frame(frame)
         except Exception as e:
             # Stop recording on error
             self.record_button.setChecked(False)
@@ -518,7 +568,18 @@ class ScreenRecorder:
         Write a frame to the current recording (if recording).
 
         Args:
-            frame: numpy array of shape (height, width, 3) with uint8 RGB data
+            frame: numpy array of shape (height, width, 3) with uint8 RGB data,
+                   top row first as returned by capture_screenshot(view)
+        """
+        if self.is_recording and self.writer is not None:
+            # copy into bottom-up order, which also detaches the queued frame from the caller's array
+            self._write_raw_frame(np.ascontiguousarray(frame[::-1]))
+
+    def _write_raw_frame(self, frame):
+        """
+        Queue a frame that is bottom row first, as returned by
+        capture_screenshot(view, flip=False). The frame is encoded on a
+        background thread, so it must not be modified afterwards.
         """
         if self.is_recording and self.writer is not None:
             try:
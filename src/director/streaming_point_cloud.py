@@ -0,0 +1,179 @@
+"""Point cloud item for live sensor streams.
+
+StreamingPointCloudItem owns a preallocated point and scalar buffer. Each new frame
+is written into the buffer in place and the VTK arrays are marked Modified, so
+streaming does not allocate new VTK arrays or update object model properties the
+way vis.updatePolyData does. The vertex cells are only rebuilt when the number of
+points in a slot changes. The buffer is a ring of numFrames slots, which keeps
+the last N frames visible for accumulation views, with a "frame age" array that
+can be used to color older frames.
+"""
+
+import numpy as np
+
+import director.applogic as app
+import director.vtkAll as vtk
+import director.vtkNumpy as vnp
+from director import objectmodel as om
+from director import visualization as vis
+
+
+class StreamingPointCloudItem(vis.PolyDataItem):
+    FRAME_AGE_ARRAY = "frame age"
+
+    def __init__(self, name, view, maxPointsPerFrame, numFrames=1, scalarNames=()):
+        """
+        Args:
+            name: Item name
+            view: View to add the item to
+            maxPointsPerFrame: Capacity of each ring slot
+            numFrames: Number of frames kept in the ring
+            scalarNames: Names of float32 point data arrays written with each frame
+        """
+        if maxPointsPerFrame <= 0 or numFrames <= 0:
+            raise ValueError("maxPointsPerFrame and numFrames must be positive")
+
+        self.maxPointsPerFrame = maxPointsPerFrame
+        self.numFrames = numFrames
+        self.frameCount = 0
+        self.frameSizes = np.zeros(numFrames, dtype=np.int64)
+
+        capacity = maxPointsPerFrame * numFrames
+        self.points = np.zeros((capacity, 3), dtype=np.float32)
+        self.scalars = {scalarName: np.zeros(capacity, dtype=np.float32) for scalarName in scalarNames}
+        pointData = dict(self.scalars)
+        if numFrames > 1:
+            self.frameAge = np.zeros(capacity, dtype=np.float32)
+            pointData[self.FRAME_AGE_ARRAY] = self.frameAge
+        else:
+            self.frameAge = None
+
+        # Vertex cell connectivity is rewritten in place, the offsets are a fixed arange
+        self._pointIds = np.arange(capacity, dtype=np.int64)
+        self._connectivity = np.zeros(capacity, dtype=np.int64)
+        self._offsets = np.arange(capacity + 1, dtype=np.int64)
+        # Frame sizes the vertex cells were built for
+        self._vertsFrameSizes = None
+
+        polyData = vnp.numpyToPolyData(self.points, pointData, createVertexCells=False, copy=False)
+        self._vtkArrays = [polyData.GetPoints(), polyData.GetPoints().GetData()]
+        self._vtkArrays += [polyData.GetPointData().GetArray(arrayName) for arrayName in pointData]
+        self._verts = vtk.vtkCellArray()
+        polyData.SetVerts(self._verts)
+        self._updateVerts()
+
+        vis.PolyDataItem.__init__(self, name, polyData, view)
+        if self.frameAge is not None:
+            self.setRangeMap(self.FRAME_AGE_ARRAY, (0, numFrames - 1))
+
+    def getNumberOfPoints(self):
+        """Return the number of points currently shown."""
+        return int(self.frameSizes.sum())
+
+    def addFrame(self, points, scalars=None):
+        """
+        Write a new frame into the ring buffer, replacing the oldest frame.
+
+        Args:
+            points: (N, 3) array with N <= maxPointsPerFrame
+            scalars: Optional dict mapping scalar names to (N,) arrays
+        """
+        points = np.asarray(points)
+        numPoints = len(points)
+        if numPoints > self.maxPointsPerFrame:
+            raise ValueError(f"Frame has {numPoints} points, capacity is {self.maxPointsPerFrame}")
+
+        slot = self.frameCount % self.numFrames
+        start = slot * self.maxPointsPerFrame
+        self.points[start : start + numPoints] = points
+        for scalarName, values in (scalars or {}).items():
+            self.scalars[scalarName][start : start + numPoints] = values
+
+        self.frameSizes[slot] = numPoints
+        self.frameCount += 1
+        self._updateVerts()
+        self._updateFrameAge()
+        self._markModified()
+
+    def clear(self):
+        """Remove all frames."""
+        self.frameSizes[:] = 0
+        self.frameCount = 0
+        self._updateVerts()
+        self._markModified()
+
+    def _iterFrameSlots(self):
+        """Yield (slot, age) for the stored frames from oldest to newest."""
+        numStored = min(self.frameCount, self.numFrames)
+        for age in range(numStored - 1, -1, -1):
+            yield (self.frameCount - 1 - age) % self.numFrames, age
+
+    def _updateVerts(self):
+        """Rebuild the vertex cells if the frame sizes changed since they were built."""
+        if self._vertsFrameSizes is not None and np.array_equal(self.frameSizes, self._vertsFrameSizes):
+            return
+        self._vertsFrameSizes = self.frameSizes.copy()
+
+        # Cells are in slot order so that they only depend on the frame sizes
+        numPoints = 0
+        for slot, size in enumerate(self.frameSizes):
+            start = slot * self.maxPointsPerFrame
+            self._connectivity[numPoints : numPoints + size] = self._pointIds[start : start + size]
+            numPoints += size
+
+        # Wrap prefixes of the preallocated arrays, this does not copy
+        self._verts.SetData(
+            vnp.getVtkFromNumpy(self._offsets[: numPoints + 1]),
+            vnp.getVtkFromNumpy(self._connectivity[:numPoints]),
+        )
+
+    def _updateFrameAge(self):
+        if self.frameAge is None:
+            return
+        for slot, age in self._iterFrameSlots():
+            start = slot * self.maxPointsPerFrame
+            self.frameAge[start : start + self.frameSizes[slot]] = age
+
+    def _markModified(self):
+        for vtkArray in self._vtkArrays:
+            vtkArray.Modified()
+        self.polyData.Modified()
+        if self.getProperty("Visible"):
+            self._renderAllViews()
+
+
+def showStreamingPointCloud(
+    name,
+    maxPointsPerFrame,
+    numFrames=1,
+    scalarNames=(),
+    scalarRanges=None,
+    colorByName=None,
+    color=None,
+    view=None,
+    parent="data",
+):
+    """
+    Create a StreamingPointCloudItem and add it to the view and object model.
+
+    Args:
+        scalarRanges: Optional dict of fixed color ranges for the scalar arrays. Ranges
+            are not recomputed from streamed data, so they should be given for any
+            array used with colorByName.
+    """
+    view = view or app.getCurrentRenderView()
+    assert view
+
+    item = StreamingPointCloudItem(name, view, maxPointsPerFrame, numFrames, scalarNames)
+    for scalarName, scalarRange in (scalarRanges or {}).items():
+        item.setRangeMap(scalarName, scalarRange)
+
+    if om.isInitialized():
+        om.addToObjectModel(item, vis.getParentObj(parent))
+
+    if colorByName:
+        item.setProperty("Color By", colorByName)
+    else:
+        color = [1.0, 1.0, 1.0] if color is None else color
+        item.setProperty("Color", [float(c) for c in color])
+    return item
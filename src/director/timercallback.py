@@ -4,6 +4,8 @@ import time
 
 from qtpy import QtCore
 
+from director import render_stats
+
 
 class TimerCallback(object):
     """Timer callback class for periodic execution at a target FPS."""
@@ -94,6 +96,8 @@ class TimerCallback(object):
         except Exception:
             self.stop()
             raise
+        finally:
+            render_stats.addUpdateTime(time.time() - self.tickTime)
 
         if result is not False:
             self.lastTickTime = self.tickTime
@@ -2,6 +2,8 @@
 
 import numpy as np
 
+import director.vtkAll as vtk
+
 
 def getVisibleActors(view):
     """Get list of visible actors in the view."""
@@ -74,3 +76,47 @@ def computeViewBoundsSoloGrid(view, gridObj):
         return np.array(bounds)
     else:
         return computeViewBoundsNoGrid(view, gridObj)
+
+
+def resetCameraToBounds(view, customBounds=(), gridObj=None, viewDirection=None):
+    """
+    Reset the camera of a view to fit the visible actors.
+
+    Parameters:
+    -----------
+    view : VTKWidget or HeadlessView
+        The view whose camera is reset
+    customBounds : list
+        6-element bounds used instead of the actors when the view has no grid,
+        or when only the grid is showing
+    gridObj : object
+        Grid object with an actor attribute, excluded from the bounds
+    viewDirection : array
+        If given, the camera looks along this direction
+    """
+    renderer = view.renderer()
+    if viewDirection is not None:
+        camera = renderer.GetActiveCamera()
+        camera.SetPosition([0, 0, 0])
+        camera.SetFocalPoint(viewDirection)
+
+    bounds = None
+    if gridObj is not None:
+        bounds = computeViewBoundsNoGrid(view, gridObj)
+        # the bounds are uninitialized when only the grid is showing
+        if len(bounds) != 6 or all(abs(b) < 1e-9 for b in bounds) or not vtk.vtkMath.AreBoundsInitialized(bounds):
+            bounds = None
+
+    if bounds is None and customBounds:
+        bbox = vtk.vtkBoundingBox()
+        for customBound in customBounds:
+            bbox.AddBounds([float(b) for b in customBound])
+        if bbox.IsValid():
+            bounds = [0.0] * 6
+            bbox.GetBounds(bounds)
+
+    if bounds is not None:
+        renderer.ResetCamera([float(b) for b in bounds])
+    else:
+        renderer.ResetCamera()
+    renderer.ResetCameraClippingRange()
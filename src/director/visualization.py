@@ -238,9 +238,16 @@ class PolyDataItem(om.ObjectModelItem):
     def hasActor(self, actor):
         return actor == self.actor
 
+    def getActors(self):
+        return [self.actor]
+
+    def getDataSets(self):
+        return [self.polyData]
+
     def setPolyData(self, polyData):
         self.polyData = polyData
         self.mapper.SetInputData(polyData)
+        self._updateObjectIndex()
 
         self._updateSurfaceProperty()
         self._updateColorByProperty()
@@ -316,6 +323,7 @@ class PolyDataItem(om.ObjectModelItem):
         renderer.AddActor(self.actor)
         if self.shadowActor:
             renderer.AddActor(self.shadowActor)
+        self._updateObjectIndex()
 
         if hasattr(view, "render"):
             view.render()
@@ -372,6 +380,8 @@ class PolyDataItem(om.ObjectModelItem):
                     bar = self.scalarBarWidget.GetScalarBarActor()
                     bar.SetLookupTable(lut)
 
+    def _onPropertiesChanged(self, propertySet, propertyNames):
+        om.ObjectModelItem._onPropertiesChanged(self, propertySet, propertyNames)
         self._renderAllViews()
 
     def setScalarRange(self, rangeMin, rangeMax):
@@ -646,6 +656,12 @@ class Image2DItem(om.ObjectModelItem):
         """Check if this item uses the given actor."""
         return actor == self.actor
 
+    def getActors(self):
+        return [self.actor]
+
+    def getDataSets(self):
+        return [self.image]
+
     def setImage(self, image):
         """Update the image displayed by this item.
 
@@ -654,6 +670,7 @@ class Image2DItem(om.ObjectModelItem):
         """
         self.image = image
         self.actor.SetImage(image)
+        self._updateObjectIndex()
 
         # Also set the image on the texture, otherwise
         # the texture input won't update until the next
@@ -678,6 +695,7 @@ class Image2DItem(om.ObjectModelItem):
         self._updatePositionCoordinates(view)
 
         renderer.AddActor(self.actor)
+        self._updateObjectIndex()
         view.render()
 
     def _getHeightForWidth(self, image, width):
@@ -1046,6 +1064,7 @@ class FrameItem(PolyDataItem):
                 scale = self.getProperty("Scale")
                 # Set callback to trigger FrameModified signal when transform changes
                 self.frameWidget = FrameWidget(view, self.transform, scale=scale)
+                self._updateObjectIndex()
             # Ensure widget is enabled and visible (regardless of whether it was just created)
             self.frameWidget.setEnabled(True)
             self.frameWidget.view.render()
@@ -1075,6 +1094,15 @@ class FrameItem(PolyDataItem):
             has_actor = actor in self.frameWidget.getActors()
         return has_actor or PolyDataItem.hasActor(self, actor)
 
+    def getActors(self):
+        actors = PolyDataItem.getActors(self)
+        if self.frameWidget:
+            actors += list(self.frameWidget.getActors())
+        return actors
+
+    def getDataSets(self):
+        return [self.transform]
+
     def addToView(self, view):
         """Add frame item to a view."""
         PolyDataItem.addToView(self, view)
@@ -1086,6 +1114,7 @@ class FrameItem(PolyDataItem):
         if self.frameWidget:
             self.frameWidget.cleanup()
             self.frameWidget = None
+            self._updateObjectIndex()
         PolyDataItem.removeFromView(self, view)
 
     def onRemoveFromObjectModel(self):
@@ -1133,19 +1162,23 @@ def showPolyData(
     if om.isInitialized():
         om.addToObjectModel(item, getParentObj(parent))
 
-    item.setProperty("Visible", visible)
-    item.setProperty("Alpha", alpha)
-
     if colorByName and colorByName not in item.getArrayNames():
         print("showPolyData(colorByName=%s): array not found" % colorByName)
         colorByName = None
 
+    with item.properties.batch_update():
+        item.setProperty("Visible", visible)
+        item.setProperty("Alpha", alpha)
+        if colorByName:
+            item.setProperty("Color By", colorByName)
+        else:
+            color = [1.0, 1.0, 1.0] if color is None else color
+            item.setProperty("Color", [float(c) for c in color])
+
+    # After the batch, so the Color By handler does not reset colorByRange
     if colorByName:
-        item.setProperty("Color By", colorByName)
         item.colorBy(colorByName, colorByRange)
     else:
-        color = [1.0, 1.0, 1.0] if color is None else color
-        item.setProperty("Color", [float(c) for c in color])
         item.colorBy(None)
 
     return item
@@ -1358,20 +1391,14 @@ def getObjectByDataSet(dataSet):
     """Find an object that has the given dataset."""
     if not dataSet:
         return None
-    for obj in om.getObjects():
-        if obj.hasDataSet(dataSet):
-            return obj
-    return None
+    return om.findObjectByDataSet(dataSet)
 
 
 def getObjectByProp(prop):
     """Find an object that has the given prop (actor)."""
     if not prop:
         return None
-    for obj in om.getObjects():
-        if obj.hasActor(prop):
-            return obj
-    return None
+    return om.findObjectByProp(prop)
 
 
 def findPickedObject(displayPoint, view):
@@ -1668,8 +1695,15 @@ class TextItem(om.ObjectModelItem):
 
         self.views.append(view)
         view.renderer().AddActor(self.actor)
+        self._updateObjectIndex()
         view.render()
 
+    def hasActor(self, actor):
+        return actor == self.actor
+
+    def getActors(self):
+        return [self.actor]
+
     def _renderAllViews(self):
         for view in self.views:
             view.render()
@@ -4,27 +4,36 @@ import numpy as np
 from vtk.util import numpy_support
 
 import director.vtkAll as vtk
-from director.shallowCopy import shallowCopy
 
 
-def numpyToPolyData(pts, pointData=None, createVertexCells=True):
-    """Convert numpy points to VTK PolyData."""
+def numpyToPolyData(pts, pointData=None, createVertexCells=True, copy=True):
+    """
+    Convert numpy points to VTK PolyData.
+
+    With copy=False the points and point data arrays are wrapped without copying
+    when they are C contiguous, so the polydata shares memory with the caller's
+    arrays. The arrays are kept alive for the lifetime of the VTK arrays.
+    """
     pd = vtk.vtkPolyData()
-    pd.SetPoints(getVtkPointsFromNumpy(pts.copy()))
+    pts = pts.copy() if copy else np.ascontiguousarray(pts)
+    pd.SetPoints(getVtkPointsFromNumpy(pts))
 
     if pointData is not None:
         for key, value in list(pointData.items()):
-            addNumpyToVtk(pd, value.copy(), key)
+            value = value.copy() if copy else np.ascontiguousarray(value)
+            addNumpyToVtk(pd, value, key)
 
     if createVertexCells:
-        f = vtk.vtkVertexGlyphFilter()
-        f.SetInputData(pd)
-        f.Update()
-        pd = shallowCopy(f.GetOutput())
+        pd.SetVerts(getVtkVertexCells(pd.GetNumberOfPoints()))
 
     return pd
 
 
+def getVtkVertexCells(numberOfPoints):
+    """Return a vtkCellArray with one vertex cell per point."""
+    return getVtkCellArrayFromNumpy(np.arange(numberOfPoints, dtype=np.int64).reshape(-1, 1))
+
+
 def numpyToImageData(img, flip=True, vtktype=None):
     """Convert numpy image to VTK ImageData."""
     if flip:
@@ -81,6 +90,18 @@ def getVtkPointsFromNumpy(numpyArray):
     return points
 
 
+def getVtkCellArrayFromNumpy(cells):
+    """Convert an (N, K) numpy array of point ids to a vtkCellArray of N cells with K points each."""
+    cells = np.asarray(cells)
+    assert cells.ndim == 2
+    numCells, cellSize = cells.shape
+    connectivity = np.ascontiguousarray(cells.reshape(-1), dtype=np.int64)
+    offsets = np.arange(0, (numCells + 1) * cellSize, cellSize, dtype=np.int64)
+    cellArray = vtk.vtkCellArray()
+    cellArray.SetData(getVtkFromNumpy(offsets), getVtkFromNumpy(connectivity))
+    return cellArray
+
+
 def getVtkPolyDataFromNumpyPoints(points):
     """Convert numpy points to VTK PolyData."""
     return numpyToPolyData(points)
@@ -4,9 +4,12 @@ import time
 
 import numpy as np
 import vtk
-from qtpy.QtCore import QTimer
 from qtpy.QtWidgets import QVBoxLayout, QWidget
 
+from director.render_scheduler import getDefaultRenderScheduler
+from director.render_stats import RenderStats, countScene
+from director.viewbounds import resetCameraToBounds
+
 
 class FPSCounter:
     """Exponential moving average FPS counter."""
@@ -102,16 +105,29 @@ class VTKWidget(QWidget):
         # Custom bounds for camera reset
         self._custom_bounds = []
 
-        # Render pending flag
-        self._render_pending = False
+        # Per-frame render statistics, collected when enabled
+        self._render_stats = RenderStats()
+        self._render_stats_enabled = False
+        self._render_stats_overlay = None
+        self._render_stats_overlay_time = 0.0
+
+        # Render requests are coalesced and rate limited by the shared scheduler
+        self._render_scheduler = getDefaultRenderScheduler()
+        self._render_scheduler.registerView(self)
 
-        # Setup render timer
-        self._render_timer = QTimer(self)
-        self._render_timer.setSingleShot(True)
-        self._render_timer.timeout.connect(self._on_render_timer)
+        # Connect render events to update FPS counter and the scheduler
+        self._render_observer_tags = [
+            self._render_window.AddObserver(vtk.vtkCommand.StartEvent, self._on_start_render),
+            self._render_window.AddObserver(vtk.vtkCommand.EndEvent, self._on_end_render),
+        ]
 
-        # Connect render events to update FPS counter
-        self._render_window.AddObserver(vtk.vtkCommand.EndEvent, self._on_end_render)
+        # Track mouse drags so camera interaction takes priority over data renders
+        interactor = self._render_window.GetInteractor()
+        self._interactor_observer_tags = []
+        for event in ("LeftButtonPressEvent", "MiddleButtonPressEvent", "RightButtonPressEvent"):
+            self._interactor_observer_tags.append(interactor.AddObserver(event, self._on_interaction_start))
+        for event in ("LeftButtonReleaseEvent", "MiddleButtonReleaseEvent", "RightButtonReleaseEvent"):
+            self._interactor_observer_tags.append(interactor.AddObserver(event, self._on_interaction_end))
 
         # Initialize VTK interactor
         # self._vtk_widget.Initialize()
@@ -238,16 +254,23 @@ class VTKWidget(QWidget):
         """Return the orientation marker widget."""
         return self._orientation_widget
 
-    def render(self):
-        """Request a render (queued, will render on next timer tick)."""
-        if not self._render_pending:
-            self._render_pending = True
-            self._render_timer.start()
+    def render(self, interactive=False):
+        """Request a render (queued and coalesced by the render scheduler).
+
+        Args:
+            interactive: If True, render on the next event loop iteration regardless of
+                         the scheduler's frame rate cap. Use this for camera motion.
+        """
+        if self._render_scheduler.isRegistered(self):
+            self._render_scheduler.requestRender(self, interactive=interactive)
+
+    def renderScheduler(self):
+        """Return the RenderScheduler that services render() requests for this view."""
+        return self._render_scheduler
 
     def forceRender(self):
         """Force an immediate render."""
-        self._render_pending = False
-        self._render_timer.stop()
+        self._render_scheduler.cancelPendingRender(self)
         self._renderer.ResetCameraClippingRange()
         self._render_window.Render()
 
@@ -314,51 +337,39 @@ class VTKWidget(QWidget):
 
     def resetCamera(self, viewDirection=None):
         """Reset the camera to fit all actors, excluding the grid if present."""
-
-        if viewDirection is not None:
-            camera = self.camera()
-            camera.SetPosition([0, 0, 0])
-            camera.SetFocalPoint(viewDirection)
-            # camera.SetViewUp([0,0,1])
-
-        # Try to compute bounds excluding grid
-        bounds = None
-        if hasattr(self, "_grid_obj") and self._grid_obj:
-            from director.viewbounds import computeViewBoundsNoGrid
-
-            bounds = computeViewBoundsNoGrid(self, self._grid_obj)
-            # Check if bounds are valid
-            if bounds is not None and len(bounds) == 6:
-                # Check if bounds are initialized (not all zeros)
-                if not all(abs(b) < 1e-9 for b in bounds):
-                    bounds_array = [float(b) for b in bounds]
-                    self._renderer.ResetCamera(bounds_array)
-                    self._renderer.ResetCameraClippingRange()
-                    return
-
-        # Fall back to custom bounds if available
-        if self._custom_bounds:
-            # Use vtkBoundingBox to combine all custom bounds
-            bbox = vtk.vtkBoundingBox()
-            for bounds in self._custom_bounds:
-                bounds_array = [float(b) for b in bounds]
-                bbox.AddBounds(bounds_array)
-
-            if bbox.IsValid():
-                result_bounds = [0.0] * 6
-                bbox.GetBounds(result_bounds)
-                self._renderer.ResetCamera(result_bounds)
-            else:
-                self._renderer.ResetCamera()
-        else:
-            self._renderer.ResetCamera()
-
+        resetCameraToBounds(self, self._custom_bounds, self._grid_obj, viewDirection)
         self.render()
 
     def getAverageFramesPerSecond(self):
         """Get the average frames per second."""
         return self._fps_counter.get_average_fps()
 
+    def setRenderStatsEnabled(self, enabled):
+        """Enable or disable collecting per-frame statistics in renderStats()."""
+        if enabled and not self._render_stats_enabled:
+            self._render_stats.clear()
+        self._render_stats_enabled = enabled
+
+    def isRenderStatsEnabled(self):
+        return self._render_stats_enabled
+
+    def renderStats(self):
+        """Return the RenderStats with the timing and scene size of recent frames."""
+        return self._render_stats
+
+    def setRenderStatsOverlayVisible(self, visible):
+        """Show or hide a text overlay with the render statistics. Showing it enables collection."""
+        if visible:
+            self.setRenderStatsEnabled(True)
+            if self._render_stats_overlay is None:
+                from director import visualization as vis
+
+                self._render_stats_overlay = vis.TextItem("render stats", view=self)
+                self._render_stats_overlay.setProperty("Font Size", 12)
+                self._render_stats_overlay.setProperty("Background Alpha", 0.5)
+        if self._render_stats_overlay is not None:
+            self._render_stats_overlay.setProperty("Visible", visible)
+
     def setLightKitEnabled(self, enabled):
         """Enable or disable the light kit."""
         self._renderer.RemoveAllLights()
@@ -428,32 +439,56 @@ class VTKWidget(QWidget):
         # Re-enable interactor
         interactor.Enable()
 
-    def _on_render_timer(self):
-        """Handle render timer timeout."""
-        if self._render_pending:
-            self.forceRender()
+    def _on_start_render(self, obj, event):
+        """Handle start render event to let the scheduler drop requests this frame covers."""
+        self._render_scheduler.notifyRendered(self)
+        if self._render_stats_enabled:
+            self._render_stats.startFrame()
+
+    def _on_interaction_start(self, obj, event):
+        self._render_scheduler.setInteracting(self, True)
+
+    def _on_interaction_end(self, obj, event):
+        self._render_scheduler.setInteracting(self, False)
 
     def _on_end_render(self, obj, event):
-        """Handle end render event to update FPS counter."""
+        """Handle end render event to update FPS counter and render stats."""
         self._fps_counter.update()
+        if self._render_stats_enabled:
+            self._render_stats.endFrame(*countScene(self._renderer))
+            self._update_render_stats_overlay()
+
+    def _update_render_stats_overlay(self):
+        overlay = self._render_stats_overlay
+        if overlay is None or not overlay.getProperty("Visible"):
+            return
+        # refresh at most twice a second, setting the Text property requests the
+        # render that draws the new text
+        now = time.time()
+        if now - self._render_stats_overlay_time < 0.5:
+            return
+        self._render_stats_overlay_time = now
+        overlay.setProperty("Text", self._render_stats.formatSummary())
 
     def closeEvent(self, event):
         """Handle widget close event with proper cleanup."""
-        # Stop render timer first
+        # Stop scheduled renders first
         print("VTKWidget.closeEvent", id(self))
-        if hasattr(self, "_render_timer"):
-            self._render_timer.stop()
-            try:
-                self._render_timer.timeout.disconnect(self._on_render_timer)
-            except (TypeError, RuntimeError):
-                pass
+        if hasattr(self, "_render_scheduler"):
+            self._render_scheduler.unregisterView(self)
 
-        # Remove observer for render events
+        # Remove observers for render and interaction events, by the tags returned from AddObserver
         if hasattr(self, "_render_window") and self._render_window:
             try:
-                self._render_window.RemoveObserver(self._on_end_render)
+                for tag in self._render_observer_tags:
+                    self._render_window.RemoveObserver(tag)
+                interactor = self._render_window.GetInteractor()
+                for tag in self._interactor_observer_tags:
+                    interactor.RemoveObserver(tag)
             except:
                 pass
+            self._render_observer_tags = []
+            self._interactor_observer_tags = []
 
         # Call parent closeEvent (VTK widget will clean itself up now that it's patched)
         super().closeEvent(event)
@@ -0,0 +1,67 @@
+"""Tests for the callbacks module."""
+
+import pytest
+
+from director.callbacks import CallbackRegistry
+
+
+def test_connect_process_and_disconnect():
+    callbacks = CallbackRegistry(["eat", "drink"])
+    calls = []
+
+    eatId = callbacks.connect("eat", lambda x: calls.append(("eat", x)))
+    callbacks.connect("drink", lambda x: calls.append(("drink", x)))
+
+    callbacks.process("eat", 1)
+    callbacks.process("drink", 2)
+    callbacks.disconnect(eatId)
+    callbacks.process("eat", 3)
+
+    assert calls == [("eat", 1), ("drink", 2)]
+
+    with pytest.raises(ValueError):
+        callbacks.connect("drunk", print)
+
+
+def test_disconnect_during_process():
+    callbacks = CallbackRegistry(["tick"])
+    calls = []
+    ids = []
+
+    def first():
+        calls.append("first")
+        callbacks.disconnect(ids[1])
+
+    def second():
+        calls.append("second")
+
+    ids.append(callbacks.connect("tick", first))
+    ids.append(callbacks.connect("tick", second))
+
+    # Both callbacks were connected when the signal was emitted
+    callbacks.process("tick")
+    assert sorted(calls) == ["first", "second"]
+
+    calls.clear()
+    callbacks.process("tick")
+    assert calls == ["first"]
+
+
+def test_signal_stats():
+    callbacks = CallbackRegistry(["tick", "tock"])
+    callbacks.connect("tick", lambda: None)
+    callbacks.process("tick")
+    assert callbacks.get_signal_stats() == {}
+
+    callbacks.set_profiling_enabled(True)
+    callbacks.process("tick")
+    callbacks.process("tick")
+    stats = callbacks.get_signal_stats()
+    assert stats["tick"]["count"] == 2
+    assert stats["tick"]["total_time"] >= 0.0
+    assert "tock" not in stats
+
+    callbacks.reset_signal_stats()
+    assert callbacks.get_signal_stats() == {}
+    callbacks.set_profiling_enabled(False)
+    assert not callbacks.is_profiling_enabled()
@@ -0,0 +1,205 @@
+"""Tests for the ffmpeg_writer module."""
+
+import os
+import subprocess
+import sys
+import threading
+
+import numpy as np
+import pytest
+from qtpy.QtWidgets import QMainWindow, QWidget
+
+from director import ffmpeg_writer
+from director.ffmpeg_writer import FFMpegWriter, SegmentedFFMpegWriter, ThreadedFrameWriter
+from director.screen_recorder import ScreenRecorder
+
+# Stands in for ffmpeg: writes more to stderr than a pipe buffer holds, then
+# consumes stdin and reports the number of bytes it read.
+FAKE_FFMPEG = """
+import sys
+for i in range(20000):
+    sys.stderr.write("frame=%d progress line\\n" % i)
+sys.stderr.flush()
+size = len(sys.stdin.buffer.read())
+sys.stderr.write("read %d bytes\\n" % size)
+"""
+
+
+@pytest.fixture
+def fake_ffmpeg(monkeypatch):
+    commands = []
+    popen = subprocess.Popen
+
+    def fake_popen(cmd, **kwargs):
+        commands.append(cmd)
+        return popen([sys.executable, "-c", FAKE_FFMPEG], **kwargs)
+
+    monkeypatch.setattr(ffmpeg_writer.subprocess, "Popen", fake_popen)
+    return commands
+
+
+class RecordingWriter:
+    def __init__(self, gate=None):
+        self.frames = []
+        self.closed = False
+        self.gate = gate
+
+    def write_frame(self, frame):
+        if self.gate is not None:
+            self.gate.wait()
+        self.frames.append(frame)
+
+    def close(self):
+        self.closed = True
+
+
+class FailingWriter(RecordingWriter):
+    def write_frame(self, frame):
+        raise IOError("disk full")
+
+
+def make_frame(value):
+    return np.full((4, 6, 3), value, dtype=np.uint8)
+
+
+def test_threaded_writer_writes_all_frames_in_order():
+    writer = RecordingWriter()
+    with ThreadedFrameWriter(writer, max_queue_size=2, policy="block") as threaded:
+        for i in range(10):
+            threaded.write_frame(make_frame(i))
+
+    assert writer.closed
+    assert [int(frame[0, 0, 0]) for frame in writer.frames] == list(range(10))
+    assert threaded.get_stats() == {"frames_captured": 10, "frames_encoded": 10, "frames_dropped": 0, "queue_depth": 0}
+
+
+def test_threaded_writer_drops_frames_when_full():
+    gate = threading.Event()
+    writer = RecordingWriter(gate)
+    threaded = ThreadedFrameWriter(writer, max_queue_size=2, policy="drop")
+    for i in range(10):
+        threaded.write_frame(make_frame(i))
+    gate.set()
+    threaded.close()
+
+    stats = threaded.get_stats()
+    assert stats["frames_captured"] == 10
+    assert stats["frames_dropped"] > 0
+    assert stats["frames_encoded"] + stats["frames_dropped"] == 10
+
+
+def test_threaded_writer_reports_errors():
+    threaded = ThreadedFrameWriter(FailingWriter())
+    threaded.write_frame(make_frame(0))
+    with pytest.raises(RuntimeError, match="disk full"):
+        threaded.close()
+
+
+def test_threaded_writer_rejects_unknown_policy():
+    with pytest.raises(ValueError):
+        ThreadedFrameWriter(RecordingWriter(), policy="skip")
+
+
+def test_ffmpeg_writer_profile_and_flip_arguments(fake_ffmpeg):
+    writer = FFMpegWriter("out.mp4", width=6, height=4, profile="realtime", flip_vertical=True)
+    writer.close()
+
+    cmd = fake_ffmpeg[0]
+    assert cmd[-1] == "out.mp4"
+    assert cmd[cmd.index("-vf") + 1] == "vflip"
+    assert cmd[cmd.index("-preset") + 1] == "ultrafast"
+
+    with pytest.raises(ValueError):
+        FFMpegWriter("out.mp4", width=6, height=4, profile="unknown")
+
+
+def test_ffmpeg_writer_drains_stderr(fake_ffmpeg):
+    writer = FFMpegWriter("out.mp4", width=6, height=4)
+    for i in range(100):
+        writer.write_frame(make_frame(i))
+    writer.close()
+
+    assert writer.stderr_output().splitlines()[-1] == f"read {100 * 4 * 6 * 3} bytes"
+
+
+def test_segmented_writer_encodes_segments_and_concatenates(fake_ffmpeg, tmp_path):
+    filename = str(tmp_path / "out.mp4")
+    with SegmentedFFMpegWriter(filename, width=6, height=4, num_segments=2, frames_per_segment=4) as writer:
+        for i in range(10):
+            writer.write_frame(make_frame(i))
+
+    segment_commands, concat_command = fake_ffmpeg[:-1], fake_ffmpeg[-1]
+    assert len(segment_commands) == 3
+    assert [cmd[-1].endswith(f"segment_{i:05d}.mp4") for i, cmd in enumerate(segment_commands)] == [True] * 3
+    assert concat_command[concat_command.index("-f") + 1] == "concat"
+    assert concat_command[-1] == filename
+    # segment files are removed after concatenation
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_segmented_writer_quotes_concat_list(fake_ffmpeg, tmp_path, monkeypatch):
+    """Paths with single quotes are escaped the way the ffmpeg concat demuxer expects."""
+    assert ffmpeg_writer._quote_concat_path("/a/it's.mp4") == "'/a/it'\\''s.mp4'"
+
+    list_files = []
+    run = subprocess.run
+
+    def recording_run(cmd, **kwargs):
+        with open(cmd[cmd.index("-i") + 1]) as f:
+            list_files.append(f.read())
+        return run(cmd, **kwargs)
+
+    monkeypatch.setattr(ffmpeg_writer.subprocess, "run", recording_run)
+    output_dir = tmp_path / "it's"
+    output_dir.mkdir()
+    with SegmentedFFMpegWriter(str(output_dir / "out.mp4"), width=6, height=4, frames_per_segment=4) as writer:
+        for i in range(5):
+            writer.write_frame(make_frame(i))
+
+    lines = list_files[0].splitlines()
+    assert len(lines) == 2
+    assert all(line.startswith(f"file '{tmp_path}/it'\\''s/segments_") for line in lines)
+
+
+def test_segmented_writer_waits_for_segments_on_error(tmp_path, monkeypatch):
+    """When a segment fails, the other segments finish before the segment directory is removed."""
+    release = threading.Event()
+    dir_exists_on_close = []
+
+    class SegmentWriter(RecordingWriter):
+        def __init__(self, filename, *args, **kwargs):
+            super().__init__()
+            self.filename = filename
+
+        def close(self):
+            if self.filename.endswith("segment_00000.mp4"):
+                raise IOError("encoder failed")
+            release.wait()
+            dir_exists_on_close.append(os.path.isdir(os.path.dirname(self.filename)))
+
+    monkeypatch.setattr(ffmpeg_writer, "FFMpegWriter", SegmentWriter)
+    writer = SegmentedFFMpegWriter(str(tmp_path / "out.mp4"), width=6, height=4, num_segments=3, frames_per_segment=1)
+    for i in range(3):
+        writer.write_frame(make_frame(i))
+
+    threading.Timer(0.1, release.set).start()
+    with pytest.raises(RuntimeError, match="encoder failed"):
+        writer.close()
+    assert dir_exists_on_close == [True, True]
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_screen_recorder_write_frame_accepts_top_down_frames(qapp):
+    """write_frame() takes top-down frames and converts them to the bottom-up order ffmpeg flips."""
+    recorder = ScreenRecorder(QMainWindow(), QWidget())
+    writer = RecordingWriter()
+    recorder.writer = writer
+    recorder.is_recording = True
+
+    frame = np.arange(4 * 2 * 3, dtype=np.uint8).reshape(4, 2, 3)
+    recorder.write_frame(frame)
+    recorder._write_raw_frame(frame)
+
+    np.testing.assert_array_equal(writer.frames[0], frame[::-1])
+    assert writer.frames[0].flags.c_contiguous
+    assert writer.frames[1] is frame
@@ -0,0 +1,79 @@
+"""Tests for HeadlessView."""
+
+import vtk
+
+from director.headless_view import HeadlessView
+from director.screen_recorder import capture_screenshot
+
+
+def add_sphere(view):
+    sphere_source = vtk.vtkSphereSource()
+    mapper = vtk.vtkPolyDataMapper()
+    mapper.SetInputConnection(sphere_source.GetOutputPort())
+    actor = vtk.vtkActor()
+    actor.SetMapper(mapper)
+    view.renderer().AddActor(actor)
+
+
+def test_headless_view_api():
+    view = HeadlessView(width=64, height=48)
+    assert isinstance(view.renderWindow(), vtk.vtkRenderWindow)
+    assert view.renderWindow().GetOffScreenRendering()
+    assert view.backgroundRenderer() is view.renderer()
+    assert view.camera() is view.renderer().GetActiveCamera()
+    assert (view.width(), view.height()) == (64, 48)
+    assert not view.isVisible()
+    view.close()
+
+
+def test_headless_view_render_is_deferred():
+    view = HeadlessView(width=64, height=48)
+    view.setRenderStatsEnabled(True)
+    assert not view.renderIfNeeded()
+
+    view.render()
+    view.render()
+    assert view.hasPendingRender()
+    assert view.renderIfNeeded()
+    assert not view.hasPendingRender()
+    assert len(view.renderStats().frames) == 1
+    view.close()
+
+
+def test_headless_view_capture_screenshot():
+    view = HeadlessView(width=64, height=48)
+    add_sphere(view)
+    view.resetCamera()
+    view.forceRender()
+
+    image = capture_screenshot(view)
+    assert image.shape[:2] == (48, 64)
+    assert image.max() > 0
+    view.close()
+
+
+def test_headless_view_render_stats_count_visible_scene():
+    view = HeadlessView(width=64, height=48)
+    view.setRenderStatsEnabled(True)
+    add_sphere(view)
+    add_sphere(view)
+    shown, hidden = view.renderer().GetActors()
+    hidden.SetVisibility(False)
+
+    view.forceRender()
+    sphere = shown.GetMapper().GetInput()
+    frame = view.renderStats().lastFrame()
+    assert frame.actors == 1
+    assert frame.triangles == sphere.GetNumberOfPolys()
+    assert frame.points == sphere.GetNumberOfPoints()
+    view.close()
+
+
+def test_headless_view_reset_camera_custom_bounds():
+    view = HeadlessView(width=64, height=48)
+    add_sphere(view)
+    view.addCustomBounds([9.0, 11.0, 9.0, 11.0, 9.0, 11.0])
+    view.resetCamera()
+    assert view.camera().GetFocalPoint() == (10.0, 10.0, 10.0)
+    assert view.hasPendingRender()
+    view.close()
@@ -0,0 +1,77 @@
+"""Tests for lod_point_cloud module."""
+
+import numpy as np
+
+import director.objectmodel as om
+from director.lod_point_cloud import (
+    allocatePointBudget,
+    buildVoxelHierarchy,
+    getLodManager,
+    setPointBudget,
+    showLodPointCloud,
+)
+from director.vtk_widget import VTKWidget
+
+
+def test_build_voxel_hierarchy():
+    """Voxels should be contiguous ranges that together cover every point once."""
+    points = np.random.default_rng(1).random((20000, 3))
+    hierarchy = buildVoxelHierarchy(points, pointsPerCell=500)
+
+    assert sorted(hierarchy.order) == list(range(len(points)))
+    assert hierarchy.cellCounts.sum() == len(points)
+    assert np.all(hierarchy.cellStarts == np.concatenate([[0], np.cumsum(hierarchy.cellCounts)[:-1]]))
+
+    # Every point lies within its voxel's bounding sphere
+    for cell in range(len(hierarchy.cellCounts)):
+        start, count = hierarchy.cellStarts[cell], hierarchy.cellCounts[cell]
+        cellPoints = points[hierarchy.order[start : start + count]]
+        distance = np.linalg.norm(cellPoints - hierarchy.cellCenters[cell], axis=1)
+        assert np.all(distance <= hierarchy.cellRadius + 1e-9)
+
+
+def test_allocate_point_budget():
+    """The budget should be split by weight, saturating small cells first."""
+    counts = np.array([10, 1000, 1000, 500])
+    weights = np.array([1.0, 1.0, 2.0, 0.0])
+
+    allocation = allocatePointBudget(counts, weights, 310)
+    assert allocation[0] == 10
+    assert allocation[3] == 0
+    assert allocation.sum() <= 310
+    assert abs(allocation[2] - 2 * allocation[1]) <= 1
+
+    # Everything visible fits in the budget
+    assert list(allocatePointBudget(counts, weights, 10000)) == [10, 1000, 1000, 0]
+
+
+def test_lod_point_cloud_item(qapp):
+    """The selected points should respect the view's point budget and the camera frustum."""
+    widget = VTKWidget()
+    om.init()
+
+    rng = np.random.default_rng(2)
+    points = rng.random((50000, 3)) * 10
+    item = showLodPointCloud(points, "lod cloud", pointData={"z": points[:, 2].copy()}, colorByName="z", view=widget)
+    assert item.rangeMap["z"][0] == points[:, 2].min()
+
+    setPointBudget(widget, 5000)
+    widget.resetCamera()
+    widget.forceRender()
+    assert 0 < item.getNumberOfSelectedPoints() <= 5000
+    assert item.polyData.GetNumberOfVerts() == item.getNumberOfSelectedPoints()
+
+    # Selected points are a subset of the input cloud
+    numSelected = item.getNumberOfSelectedPoints()
+    selected = item._outputPoints[:numSelected]
+    assert np.all((selected >= 0) & (selected <= 10))
+
+    # Looking away from the cloud selects nothing
+    camera = widget.camera()
+    camera.SetPosition(-10, -10, -10)
+    camera.SetFocalPoint(-20, -20, -20)
+    widget.forceRender()
+    assert item.getNumberOfSelectedPoints() == 0
+
+    om.removeFromObjectModel(item)
+    assert item not in getLodManager(widget).items
@@ -0,0 +1,163 @@
+"""Tests for mesh_cache module."""
+
+import os
+import tempfile
+
+import numpy as np
+
+import director.ioUtils as io
+import director.vtkAll as vtk
+import director.vtkNumpy as vnp
+from director import filterUtils
+from director.mesh_cache import MeshCache
+
+
+def _write_sphere_stl(filename):
+    source = vtk.vtkSphereSource()
+    source.SetThetaResolution(12)
+    source.SetPhiResolution(8)
+    source.Update()
+    writer = vtk.vtkSTLWriter()
+    writer.SetFileName(filename)
+    writer.SetInputData(source.GetOutput())
+    writer.Write()
+
+
+def test_mesh_cache_round_trip():
+    """Cached polydata should match the processed mesh it was created from."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        mesh_file = os.path.join(tmp_dir, "sphere.stl")
+        _write_sphere_stl(mesh_file)
+        cache = MeshCache(os.path.join(tmp_dir, "cache"))
+
+        def read_mesh(filename):
+            return filterUtils.computeNormals(io.readPolyData(filename))
+
+        expected = cache.getOrCreate(mesh_file, read_mesh)
+        assert cache.misses == 1
+        assert len(os.listdir(cache.cacheDir)) == 1
+
+        cached = cache.getOrCreate(mesh_file, read_mesh)
+        assert cache.hits == 1
+        assert cached.GetNumberOfPoints() == expected.GetNumberOfPoints()
+        assert cached.GetNumberOfPolys() == expected.GetNumberOfPolys()
+        np.testing.assert_array_equal(vnp.getNumpyFromVtk(cached), vnp.getNumpyFromVtk(expected))
+        np.testing.assert_array_equal(vnp.getNumpyFromVtk(cached, "Normals"), vnp.getNumpyFromVtk(expected, "Normals"))
+        assert cached.GetPointData().GetNormals() is not None
+
+
+def test_mesh_cache_invalidation():
+    """Changing the file or the processing options should miss the cache."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        mesh_file = os.path.join(tmp_dir, "sphere.stl")
+        _write_sphere_stl(mesh_file)
+        cache = MeshCache(os.path.join(tmp_dir, "cache"))
+
+        key = cache.getCacheKey(mesh_file)
+        assert cache.getCacheKey(mesh_file, {"computeNormals": True}) != key
+
+        stat = os.stat(mesh_file)
+        os.utime(mesh_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+        assert cache.getCacheKey(mesh_file) != key
+
+
+def test_read_poly_data_use_cache():
+    """readPolyData with useCache should return the same mesh on cold and warm reads."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        mesh_file = os.path.join(tmp_dir, "sphere.stl")
+        _write_sphere_stl(mesh_file)
+        cache = MeshCache(os.path.join(tmp_dir, "cache"))
+
+        cold = io.readPolyData(mesh_file, computeNormals=True, useCache=cache)
+        warm = io.readPolyData(mesh_file, computeNormals=True, useCache=cache)
+        assert cache.hits == 1
+        assert warm.GetNumberOfPoints() == cold.GetNumberOfPoints()
+        assert warm.GetNumberOfCells() == cold.GetNumberOfCells()
+        assert warm.GetPointData().GetNormals() is not None
+
+
+def test_mesh_cache_removes_stale_and_least_recently_used_entries():
+    """Saving should replace older versions of the same file and keep the cache under maxSize."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        mesh_files = [os.path.join(tmp_dir, f"sphere{i}.stl") for i in range(3)]
+        for mesh_file in mesh_files:
+            _write_sphere_stl(mesh_file)
+        cache = MeshCache(os.path.join(tmp_dir, "cache"))
+
+        cache.getOrCreate(mesh_files[0], io.readPolyData)
+        stat = os.stat(mesh_files[0])
+        os.utime(mesh_files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+        cache.getOrCreate(mesh_files[0], io.readPolyData)
+        assert os.listdir(cache.cacheDir) == [os.path.basename(cache.getCacheFile(mesh_files[0]))]
+
+        # Different options for the same file are kept
+        cache.getOrCreate(mesh_files[0], io.readPolyData, options={"computeNormals": True})
+        assert len(os.listdir(cache.cacheDir)) == 2
+        cache.clear()
+
+        # Limit the cache to two entries, the least recently loaded is removed first
+        cache.getOrCreate(mesh_files[0], io.readPolyData)
+        entrySize = os.path.getsize(cache.getCacheFile(mesh_files[0]))
+        cache.maxSize = 2 * entrySize
+        cache.getOrCreate(mesh_files[1], io.readPolyData)
+        for i, mesh_file in enumerate(mesh_files[:2]):
+            os.utime(cache.getCacheFile(mesh_file), ns=(i, i))
+        cache.load(mesh_files[0])
+        cache.getOrCreate(mesh_files[2], io.readPolyData)
+        assert sorted(os.listdir(cache.cacheDir)) == sorted(
+            os.path.basename(cache.getCacheFile(mesh_file)) for mesh_file in (mesh_files[0], mesh_files[2])
+        )
+
+
+def test_mesh_cache_round_trip_attributes():
+    """Cell data, field data and the active point and cell attributes should be restored."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        mesh_file = os.path.join(tmp_dir, "sphere.stl")
+        _write_sphere_stl(mesh_file)
+        cache = MeshCache(os.path.join(tmp_dir, "cache"))
+
+        def read_mesh(filename):
+            polyData = filterUtils.computeNormals(io.readPolyData(filename))
+            numPoints, numCells = polyData.GetNumberOfPoints(), polyData.GetNumberOfCells()
+            vnp.addNumpyToVtk(polyData, np.random.rand(numPoints, 2).astype(np.float32), "uv")
+            polyData.GetPointData().SetActiveTCoords("uv")
+            vnp.addNumpyToVtk(polyData, np.arange(numPoints, dtype=np.float64), "distance")
+            polyData.GetPointData().SetActiveScalars("distance")
+            vnp.addNumpyToVtk(polyData, np.arange(numCells, dtype=np.int32), "part", arrayType="cells")
+            polyData.GetCellData().SetActiveScalars("part")
+            scale = vnp.getVtkFromNumpy(np.array([0.001]))
+            scale.SetName("scale")
+            polyData.GetFieldData().AddArray(scale)
+            return polyData
+
+        expected = cache.getOrCreate(mesh_file, read_mesh)
+        cached = cache.getOrCreate(mesh_file, read_mesh)
+        assert cache.hits == 1
+
+        pointData, cellData = cached.GetPointData(), cached.GetCellData()
+        assert pointData.GetNormals().GetName() == expected.GetPointData().GetNormals().GetName()
+        assert pointData.GetTCoords().GetName() == "uv"
+        assert pointData.GetScalars().GetName() == "distance"
+        assert cellData.GetScalars().GetName() == "part"
+        np.testing.assert_array_equal(vnp.getNumpyFromVtk(cached, "uv"), vnp.getNumpyFromVtk(expected, "uv"))
+        np.testing.assert_array_equal(
+            vnp.numpy_support.vtk_to_numpy(cellData.GetArray("part")), np.arange(cached.GetNumberOfCells())
+        )
+        assert cached.GetFieldData().GetArray("scale").GetValue(0) == 0.001
+
+
+def test_mesh_cache_counts_concurrent_lookups():
+    """Hits and misses should be counted exactly when meshes are loaded from several threads."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        mesh_file = os.path.join(tmp_dir, "sphere.stl")
+        _write_sphere_stl(mesh_file)
+        cache = MeshCache(os.path.join(tmp_dir, "cache"))
+        cache.getOrCreate(mesh_file, io.readPolyData)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda i: cache.load(mesh_file, {"variant": i % 2}), range(200)))
+            list(executor.map(lambda i: cache.load(mesh_file), range(200)))
+        assert cache.misses == 1 + 200
+        assert cache.hits == 200
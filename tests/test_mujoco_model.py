@@ -183,3 +183,308 @@ class TestMujocoRobotModel:
         expected_joints = ["joint1", "joint2", "joint3", "joint4"]
         for expected_name in expected_joints:
             assert expected_name in joint_names, f"Expected joint '{expected_name}' not found"
+
+    def test_compute_body_poses(self, test_model_path, qapp):
+        """Test that batched body poses match MuJoCo's per-body results."""
+        import mujoco
+
+        from director.mujoco_model import MujocoRobotModel, forward_kinematics
+
+        model = MujocoRobotModel(test_model_path)
+        q_dict = {"joint1": 0.3, "joint2": -0.5, "joint4": 1.2}
+
+        world_T_base = np.eye(4)
+        world_T_base[:3, 3] = [1.0, 2.0, 3.0]
+        poses = model.compute_body_poses(q_dict, world_T_base)
+        assert poses.shape == (model.model.nbody, 4, 4)
+
+        data = mujoco.MjData(model.model)
+        data.qpos[:] = model.q_dict_to_qpos(q_dict)
+        mujoco.mj_forward(model.model, data)
+        for body_id in range(model.model.nbody):
+            expected = np.eye(4)
+            expected[:3, :3] = data.xmat[body_id].reshape(3, 3)
+            expected[:3, 3] = data.xpos[body_id]
+            assert np.allclose(poses[body_id], world_T_base @ expected)
+
+        body_poses = forward_kinematics(model.model, data, data.qpos.copy())
+        assert list(body_poses.keys()) == model.get_body_names()
+        link2_id = model.body_name_to_id["link2"]
+        assert np.allclose(world_T_base @ body_poses["link2"], poses[link2_id])
+
+        # kinematics_only computes the same body poses without the rest of mj_forward
+        kinematics_data = mujoco.MjData(model.model)
+        kinematics_poses = forward_kinematics(model.model, kinematics_data, data.qpos.copy(), kinematics_only=True)
+        for body_name, body_pose in body_poses.items():
+            assert np.allclose(kinematics_poses[body_name], body_pose)
+        assert np.allclose(model.compute_body_poses(q_dict, world_T_base, kinematics_only=True), poses)
+
+    def test_precompute_trajectory(self, test_model_path, qapp):
+        """Test computing body poses for a qpos time series."""
+        from director.mujoco_model import MujocoRobotModel
+
+        model = MujocoRobotModel(test_model_path)
+        num_samples = 20
+        timestamps = np.linspace(10.0, 11.0, num_samples)
+        qpos_array = np.outer(np.linspace(-1.0, 1.0, num_samples), np.ones(model.model.nq))
+
+        trajectory = model.precompute_trajectory(timestamps, qpos_array)
+        assert trajectory is model.trajectory
+        assert trajectory.body_poses.shape == (num_samples, model.model.nbody, 4, 4)
+        assert trajectory.body_poses.dtype == np.float32
+
+        for i in [0, 7, num_samples - 1]:
+            q_dict = {name: qpos_array[i, addr] for name, (addr, _) in model.joint_qpos_index.items()}
+            expected = model.compute_body_poses(q_dict)
+            assert np.allclose(trajectory.body_poses[i], expected, atol=1e-6)
+
+        # Lookups return the latest sample at or before the query time
+        assert trajectory.get_index(timestamps[7] + 1e-6) == 7
+        assert trajectory.get_index(0.0) == 0
+        assert np.array_equal(trajectory.get_body_poses(timestamps[3]), trajectory.body_poses[3])
+
+        parallel = model.precompute_trajectory(timestamps, qpos_array, num_workers=2)
+        assert np.array_equal(parallel.body_poses, trajectory.body_poses)
+
+    def test_merged_geoms(self, test_model_path, qapp):
+        """Test drawing the geoms of each group with a single merged item."""
+        from director import applogic
+        from director import objectmodel as om
+        from director import vtkNumpy as vnp
+        from director.mujoco_model import MergedGeomsItem, MujocoRobotModel
+        from director.vtk_widget import VTKWidget
+
+        om.init()
+        view = VTKWidget()
+        applogic.setCurrentRenderView(view)
+
+        model = MujocoRobotModel(test_model_path)
+        reference_folder = model.get_model_folder("reference model")
+
+        show_options = model.get_default_show_options()
+        show_options.merge_geoms = True
+        merged_folder = model.get_model_folder("merged model", show_options=show_options)
+
+        assert merged_folder.geom_items == {}
+        assert len(merged_folder.merged_items) > 0
+        # Before any forward kinematics call the merged points are at the default pose
+        default_poses = model.compute_body_poses({})
+        for item in merged_folder.merged_items:
+            assert isinstance(item, MergedGeomsItem)
+            points = vnp.getNumpyFromVtk(item.polyData, "Points")
+            for body_id, start, end in item.body_ranges:
+                rot, pos = default_poses[body_id, :3, :3], default_poses[body_id, :3, 3]
+                assert np.allclose(points[start:end], item.local_points[start:end] @ rot.T + pos, atol=1e-5)
+
+        q_dict = {"joint1": 0.4, "joint2": -0.7, "joint3": 0.2}
+        model.show_forward_kinematics(q_dict, name_or_folder=reference_folder)
+        poses = model.compute_body_poses(q_dict)
+        model.show_forward_kinematics(q_dict, name_or_folder=merged_folder)
+
+        # Each body's merged points must match the per-geom items transformed by their frames
+        reference_items = list(reference_folder.geom_items.values())
+        for item in merged_folder.merged_items:
+            points = vnp.getNumpyFromVtk(item.polyData, "Points")
+            for body_id, start, end in item.body_ranges:
+                expected = item.local_points[start:end] @ poses[body_id, :3, :3].T + poses[body_id, :3, 3]
+                assert np.allclose(points[start:end], expected, atol=1e-5)
+
+            body_names = {model.body_names[body_id] for body_id, _, _ in item.body_ranges}
+            bounds = np.array([np.inf, -np.inf] * 3)
+            for geom_item in reference_items:
+                if geom_item.body_name in body_names:
+                    actor_bounds = np.array(geom_item.actor.GetBounds())
+                    bounds[0::2] = np.minimum(bounds[0::2], actor_bounds[0::2])
+                    bounds[1::2] = np.maximum(bounds[1::2], actor_bounds[1::2])
+            assert np.allclose(item.polyData.GetBounds(), bounds, atol=1e-4)
+
+
+def test_load_primitive_geoms(test_model_path):
+    """Test that every primitive geom type in the test model produces polydata."""
+    import mujoco
+
+    from director.mujoco_model import load_geom_mesh
+
+    model = mujoco.MjModel.from_xml_path(test_model_path)
+    assert {int(geom_type) for geom_type in model.geom_type} == {
+        mujoco.mjtGeom.mjGEOM_PLANE,
+        mujoco.mjtGeom.mjGEOM_SPHERE,
+        mujoco.mjtGeom.mjGEOM_CAPSULE,
+        mujoco.mjtGeom.mjGEOM_ELLIPSOID,
+        mujoco.mjtGeom.mjGEOM_CYLINDER,
+        mujoco.mjtGeom.mjGEOM_BOX,
+    }
+    for geom_id in range(model.ngeom):
+        polydata = load_geom_mesh(model, geom_id, None)
+        assert polydata is not None and polydata.GetNumberOfPoints() > 0
+
+
+def test_mj_mesh_to_vtk_polydata():
+    """Test converting a MuJoCo mesh to vtkPolyData with triangles and normals."""
+    import mujoco
+
+    from director.mujoco_model import mj_mesh_to_vtk_polydata
+
+    xml = """
+    <mujoco>
+      <asset>
+        <mesh name="tetra" vertex="0 0 0  1 0 0  0 1 0  0 0 1"/>
+      </asset>
+      <worldbody>
+        <geom type="mesh" mesh="tetra"/>
+      </worldbody>
+    </mujoco>
+    """
+    model = mujoco.MjModel.from_xml_string(xml)
+
+    polyData = mj_mesh_to_vtk_polydata(model, 0)
+
+    assert polyData.GetNumberOfPoints() == model.mesh_vertnum[0]
+    assert polyData.GetNumberOfPolys() == model.mesh_facenum[0]
+    assert polyData.GetNumberOfVerts() == 0
+
+    faces = model.mesh_face[: model.mesh_facenum[0]]
+    for cell_id, face in enumerate(faces):
+        cell = polyData.GetCell(cell_id)
+        assert [cell.GetPointId(i) for i in range(3)] == list(face)
+
+    normals = polyData.GetPointData().GetNormals()
+    assert normals is not None
+    assert normals.GetNumberOfTuples() == polyData.GetNumberOfPoints()
+    for i in range(normals.GetNumberOfTuples()):
+        assert np.isclose(np.linalg.norm(normals.GetTuple3(i)), 1.0)
+
+    assert mj_mesh_to_vtk_polydata(model, model.nmesh) is None
+
+
+def test_preload_mesh_files(tmp_path, monkeypatch):
+    """Test loading mesh files on a thread pool with progress reporting."""
+    import director.vtkAll as vtk
+    from director import mujoco_model
+
+    monkeypatch.setenv("DIRECTOR_DISABLE_MESH_CACHE", "1")
+
+    mesh_files = []
+    for i in range(3):
+        source = vtk.vtkSphereSource()
+        source.SetThetaResolution(8 + i)
+        source.Update()
+        mesh_file = str(tmp_path / f"sphere_{i}.stl")
+        writer = vtk.vtkSTLWriter()
+        writer.SetFileName(mesh_file)
+        writer.SetInputData(source.GetOutput())
+        writer.Write()
+        mesh_files.append(mesh_file)
+
+    progress = []
+    mujoco_model.preload_mesh_files(
+        mesh_files + mesh_files[:1],
+        num_workers=3,
+        progress_callback=lambda *args: progress.append(args),
+    )
+
+    try:
+        assert sorted(p[0] for p in progress) == sorted(mesh_files)
+        assert sorted(p[1] for p in progress) == [1, 2, 3]
+        assert all(p[2] == 3 for p in progress)
+        for mesh_file in mesh_files:
+            polyData = mujoco_model._mesh_file_cache[mesh_file]
+            assert polyData.GetNumberOfPolys() > 0
+            assert polyData.GetPointData().GetNormals() is not None
+    finally:
+        for mesh_file in mesh_files:
+            mujoco_model._mesh_file_cache.pop(mesh_file, None)
+
+
+def test_preload_only_shown_geoms(test_model_path, qapp, monkeypatch):
+    """Test that mesh preloading skips the bodies and geoms ignored by the show options."""
+    from director import applogic, mujoco_model
+    from director import objectmodel as om
+    from director.vtk_widget import VTKWidget
+
+    om.init()
+    view = VTKWidget()
+    applogic.setCurrentRenderView(view)
+
+    monkeypatch.setattr(mujoco_model, "get_geom_mesh_file", lambda model, geom_id, resolver: f"geom_{geom_id % 2}.stl")
+    preloaded = []
+    monkeypatch.setattr(mujoco_model, "preload_mesh_files", lambda mesh_files, *args: preloaded.append(mesh_files))
+
+    model = mujoco_model.MujocoRobotModel(test_model_path)
+    geom_ids = {name: model.model.geom(name).id for name in ["link2_geom", "link3_geom", "link4_geom"]}
+    show_options = model.get_default_show_options()
+    show_options.ignore_body_names = ["link2"]
+    show_options.ignore_geom_names = ["link3_geom"]
+
+    shown = []
+    load_geom_mesh = mujoco_model.load_geom_mesh
+
+    def load_shown_geom_mesh(model, geom_id, mesh_resolver):
+        shown.append(geom_id)
+        return load_geom_mesh(model, geom_id, mesh_resolver)
+
+    monkeypatch.setattr(mujoco_model, "load_geom_mesh", load_shown_geom_mesh)
+    model.get_model_folder("filtered model", show_options=show_options)
+
+    assert len(preloaded) == 1
+    mesh_files = preloaded[0]
+    # Mesh files are deduplicated and only requested for the geoms that are created
+    assert len(mesh_files) == len(set(mesh_files))
+    assert set(mesh_files) == {f"geom_{geom_id % 2}.stl" for geom_id in shown}
+    assert geom_ids["link2_geom"] not in shown
+    assert geom_ids["link3_geom"] not in shown
+    assert geom_ids["link4_geom"] in shown
+
+
+def test_mesh_resolver_includes(tmp_path):
+    """Test resolving meshes, materials and geom transforms across included XML files."""
+    from director.mujoco_model import MuJoCoMeshResolver
+
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "assets.xml").write_text(
+        """
+        <mujocoinclude>
+          <compiler meshdir="meshes"/>
+          <asset>
+            <mesh name="part" file="part.stl" material="red"/>
+            <material name="red" rgba="1 0 0 1"/>
+          </asset>
+        </mujocoinclude>
+        """
+    )
+    (tmp_path / "model.xml").write_text(
+        """
+        <mujoco>
+          <compiler angle="degree"/>
+          <include file="assets/assets.xml"/>
+          <worldbody>
+            <body name="base">
+              <geom name="part_geom" type="mesh" mesh="part" pos="1 2 3" euler="0 0 90"/>
+              <geom name="bad_geom" type="sphere" size="0.1" euler="0 0 90" quat="1 0 0 0"/>
+            </body>
+          </worldbody>
+        </mujoco>
+        """
+    )
+
+    resolver = MuJoCoMeshResolver()
+    resolver.add_xml_path(str(tmp_path / "model.xml"))
+
+    assert resolver.find_all_xml_includes(str(tmp_path / "model.xml")) == [
+        str(tmp_path / "model.xml"),
+        str(tmp_path / "assets" / "assets.xml"),
+    ]
+    assert resolver.resolve_mesh_file("part") == str(tmp_path / "assets" / "meshes" / "part.stl")
+    assert resolver.get_material_rgba(resolver.mesh_name_to_material["part"]) == [1.0, 0.0, 0.0, 1.0]
+
+    transform = resolver.get_geom_transform("part_geom")
+    expected = np.array([[0, -1, 0, 1], [1, 0, 0, 2], [0, 0, 1, 3], [0, 0, 0, 1]])
+    assert np.allclose(transform, expected)
+
+    # Returned transforms are copies of the precomputed matrices
+    transform[:] = 0
+    assert np.allclose(resolver.get_geom_transform("part_geom"), expected)
+
+    assert resolver.get_geom_transform("missing_geom") is None
+    with pytest.raises(ValueError):
+        resolver.get_geom_transform("bad_geom")
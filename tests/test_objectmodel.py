@@ -104,3 +104,176 @@ def test_object_model_property_change_updates_tree_item(qapp):
     # Verify the tree item text has been updated again
     assert tree_item.text() == "another name"
     assert obj.getProperty("Name") == "another name"
+
+
+def test_object_model_actor_and_dataset_index(qapp):
+    """Test resolving actors and datasets to objects through the tree indexes."""
+    import director.vtkAll as vtk
+    from director.visualization import PolyDataItem, TextItem
+
+    tree = ObjectModelTree()
+    tree.init(QTreeView())
+
+    polyData = vtk.vtkPolyData()
+    item = PolyDataItem("poly", polyData, None)
+    text = TextItem("text")
+    assert tree.findObjectByProp(item.actor) is None
+
+    tree.addToObjectModel(item)
+    tree.addToObjectModel(text)
+    assert tree.findObjectByProp(item.actor) is item
+    assert tree.findObjectByDataSet(polyData) is item
+    assert tree.findObjectByProp(text.actor) is text
+    assert tree.findObjectByProp(vtk.vtkActor()) is None
+
+    # Replacing the polydata updates the dataset index
+    newPolyData = vtk.vtkPolyData()
+    item.setPolyData(newPolyData)
+    assert tree.findObjectByDataSet(polyData) is None
+    assert tree.findObjectByDataSet(newPolyData) is item
+
+    tree.removeFromObjectModel(item)
+    assert tree.findObjectByProp(item.actor) is None
+    assert tree.findObjectByDataSet(newPolyData) is None
+
+
+def test_get_object_by_prop(qapp):
+    """Test the visualization lookups used for picking."""
+    import director.objectmodel as om
+    import director.visualization as vis
+    import director.vtkAll as vtk
+    from director.vtk_widget import VTKWidget
+
+    view = VTKWidget()
+    om.init()
+
+    obj = vis.showPolyData(vtk.vtkPolyData(), "index test", view=view)
+    frame = vis.showFrame(vtk.vtkTransform(), "index test frame", view=view)
+
+    assert vis.getObjectByProp(obj.actor) is obj
+    assert vis.getObjectByDataSet(obj.polyData) is obj
+    assert vis.getObjectByProp(frame.actor) is frame
+    assert vis.getObjectByDataSet(frame.transform) is frame
+
+    # Frame widget actors resolve to the frame while editing
+    frame.setProperty("Edit", True)
+    assert vis.getObjectByProp(frame.frameWidget.getActors()[0]) is frame
+
+    om.removeFromObjectModel(obj)
+    om.removeFromObjectModel(frame)
+    assert vis.getObjectByProp(obj.actor) is None
+    assert vis.getObjectByProp(frame.actor) is None
+
+
+def test_weak_identity_map():
+    """Test that WeakIdentityMap compares by identity and drops collected keys."""
+    import gc
+
+    import director.vtkAll as vtk
+    from director.objectmodel import WeakIdentityMap
+
+    index = WeakIdentityMap()
+    first, second = vtk.vtkPolyData(), vtk.vtkPolyData()
+    assert index.setdefault(first, "first") == "first"
+    assert index.setdefault(first, "other") == "first"
+    assert index.get(second) is None
+
+    index.setdefault(second, "second")
+    assert index.pop(second) == "second"
+    assert index.get(second) is None
+
+    del first
+    gc.collect()
+    assert len(index) == 0
+
+
+def test_object_model_batch(qapp):
+    """Test adding, renaming and removing objects inside a batch."""
+    tree = ObjectModelTree()
+    tree.init(QTreeView())
+
+    existing = tree.addContainer("existing")
+    child = tree.addContainer("child", existing)
+    tree.setSelectedObject(child)
+    tree.collapse(existing)
+
+    added = []
+    tree.connectObjectAdded(lambda tree, obj: added.append(obj))
+
+    # The item model is reset once, with no row or data signals inside the reset
+    signals = []
+    tree.itemModel.modelAboutToBeReset.connect(lambda: signals.append("aboutToBeReset"))
+    tree.itemModel.modelReset.connect(lambda: signals.append("reset"))
+    tree.itemModel.rowsInserted.connect(lambda *args: signals.append("rowsInserted"))
+    tree.itemModel.rowsRemoved.connect(lambda *args: signals.append("rowsRemoved"))
+    tree.itemModel.dataChanged.connect(lambda *args: signals.append("dataChanged"))
+
+    with tree.batch():
+        folder = tree.addContainer("folder")
+        items = [ObjectModelItem(f"item {i}") for i in range(100)]
+        for item in items:
+            tree.addToObjectModel(item, folder)
+
+        # Lookups work inside the batch, and batches can be nested
+        assert folder.findChild("item 5") is items[5]
+        with tree.batch():
+            items[5].setProperty("Name", "renamed")
+            tree.removeFromObjectModel(items[6])
+        assert folder.findChild("renamed") is items[5]
+
+        # OBJECT_ADDED is deferred until the batch exits
+        assert added == []
+
+    assert added == [folder] + items[:6] + items[7:]
+    assert signals == ["aboutToBeReset", "reset"]
+
+    # The proxy model and view see the final tree
+    folderIndex = tree.sortModel.mapFromSource(tree._getItemForObject(folder).index())
+    assert tree.sortModel.rowCount(folderIndex) == 99
+    assert tree.sortModel.index(5, 0, folderIndex).data() == "renamed"
+    assert tree.treeView.isExpanded(folderIndex)
+
+    # Expansion and selection of existing objects are restored
+    assert not tree.treeView.isExpanded(tree.sortModel.mapFromSource(tree._getItemForObject(existing).index()))
+    assert tree.getSelectedObject() is child
+
+    with tree.batch():
+        tree.removeFromObjectModel(folder)
+    assert tree.sortModel.rowCount() == 1
+    assert tree.findObjectByName("renamed") is None
+
+
+def test_object_model_path_index(qapp):
+    """Test that child and path lookups follow adds, renames and removals."""
+    tree = ObjectModelTree()
+    tree.init(QTreeView())
+
+    robot = tree.addContainer("robot")
+    frames = tree.addContainer("frames", robot)
+    base = tree.addContainer("base", frames)
+    tree.addContainer("base", robot)
+    arm = tree.addContainer("arm", frames)
+
+    assert tree.findTopLevelObjectByName("robot") is robot
+    assert robot.findChild("frames") is frames
+    assert frames.findChild("base") is base
+    assert tree.findObjectByPath("/robot/frames/arm") is arm
+    assert tree.getObjectPath(arm) == ("robot", "frames", "arm")
+    assert frames.children() == [base, arm]
+    assert arm.parent() is frames and robot.parent() is None
+
+    robot.setProperty("Name", "robot 2")
+    assert tree.findObjectByPath("/robot/frames/arm") is None
+    assert tree.findObjectByPath("/robot 2/frames/arm") is arm
+    assert tree.getObjectPath(arm) == ("robot 2", "frames", "arm")
+
+    # Renaming keeps the child order of the Qt model
+    base.setProperty("Name", "link")
+    assert frames.findChild("base") is None
+    assert frames.findChild("link") is base
+    assert frames.children() == [base, arm]
+
+    tree.removeFromObjectModel(frames)
+    assert robot.findChild("frames") is None
+    assert tree.findObjectByPath("robot 2/frames/arm") is None
+    assert [child.getProperty("Name") for child in robot.children()] == ["base"]
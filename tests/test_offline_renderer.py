@@ -0,0 +1,51 @@
+"""Tests for the offline_renderer module."""
+
+import numpy as np
+import pytest
+
+from director.headless_view import HeadlessView
+from director.offline_renderer import OfflineVideoRenderer
+from director.timestamp_slider import TimestampSlider
+
+
+class FrameCollector:
+    def __init__(self):
+        self.frames = []
+
+    def write_frame(self, frame):
+        self.frames.append(frame)
+
+
+def test_frame_times_are_exact(qapp):
+    slider = TimestampSlider(min_timestamp=10.0, max_timestamp=11.0)
+    renderer = OfflineVideoRenderer(slider, HeadlessView(width=32, height=24), framerate=30.0)
+
+    times = renderer.frame_times()
+    assert len(times) == 31
+    assert times[0] == 10.0
+    assert times[-1] == pytest.approx(11.0)
+    np.testing.assert_allclose(np.diff(times), 1.0 / 30.0)
+
+    with pytest.raises(ValueError):
+        OfflineVideoRenderer(slider, renderer.view, start_time=11.0, end_time=10.0)
+
+
+def test_run_steps_slider_and_writes_frames(qapp):
+    slider = TimestampSlider(min_timestamp=0.0, max_timestamp=1.0)
+    slider.set_time(0.5)
+    view = HeadlessView(width=33, height=24)
+
+    handled = []
+    slider.connect_on_time_changed(handled.append)
+
+    renderer = OfflineVideoRenderer(slider, view, framerate=10.0, start_time=0.2, end_time=0.6)
+    writer = FrameCollector()
+    num_frames = renderer.run(writer)
+
+    assert num_frames == 5
+    np.testing.assert_allclose(handled[:5], [0.2, 0.3, 0.4, 0.5, 0.6])
+    assert [frame.shape for frame in writer.frames] == [(24, 32, 3)] * 5
+    assert all(frame.flags["C_CONTIGUOUS"] for frame in writer.frames)
+    # the slider is restored to its time before rendering
+    assert slider.get_time() == 0.5
+    view.close()
@@ -0,0 +1,90 @@
+"""Tests for plot_lod module."""
+
+import numpy as np
+
+from director.plot_lod import LodPlotDataItem, MinMaxPyramid
+from director.plot_widget import PlotWidget
+
+
+def test_min_max_pyramid_levels():
+    """Each level should hold the min and max of its buckets of raw samples."""
+    rng = np.random.default_rng(0)
+    x = np.arange(100_003) * 0.001
+    y = rng.normal(size=len(x))
+    pyramid = MinMaxPyramid(x, y, factor=8, min_samples=1000)
+
+    assert pyramid.num_levels() == 3
+    assert pyramid.num_buckets(pyramid.num_levels() - 1) <= 2048
+    assert pyramid.y_range == (y.min(), y.max())
+    assert pyramid.x_range == (x[0], x[-1])
+
+    for level in range(1, pyramid.num_levels()):
+        bucket = pyramid.bucket_size(level)
+        mins, maxs = pyramid.levels[level - 1]
+        assert len(mins) == -(-len(y) // bucket)
+        for i in [0, 1, len(mins) // 2, len(mins) - 1]:
+            np.testing.assert_equal(mins[i], y[i * bucket : (i + 1) * bucket].min())
+            np.testing.assert_equal(maxs[i], y[i * bucket : (i + 1) * bucket].max())
+
+
+def test_min_max_pyramid_select():
+    """select() should pick the finest level that fits the point budget and cover the range."""
+    x = np.arange(1_000_000) * 0.001
+    y = np.sin(x)
+    pyramid = MinMaxPyramid(x, y)
+
+    # zoomed in far enough to draw raw samples
+    level, start, stop = pyramid.select(500.0, 500.5, max_points=8000)
+    assert level == 0
+    assert start <= 500_000 - 1 and stop >= 500_500 + 1
+    assert pyramid.covers((level, start, stop), 500.0, 500.5)
+
+    # full range, every level but the coarsest fits
+    level, start, stop = pyramid.select(x[0], x[-1], max_points=8000)
+    assert level > 0
+    data_x, data_y = pyramid.get_data(level, start, stop)
+    assert len(data_x) == len(data_y) <= 8000
+    assert data_x[0] == x[0]
+    assert np.isclose(data_y.min(), y.min()) and np.isclose(data_y.max(), y.max())
+
+    # small series are always drawn in full
+    small = MinMaxPyramid(x[:1000], y[:1000])
+    assert small.num_levels() == 1
+    assert small.select(0.1, 0.2, max_points=10) == (0, 0, 1000)
+
+
+def test_min_max_pyramid_ignores_nan():
+    x = np.arange(200_000, dtype=float)
+    y = np.ones_like(x)
+    y[101:106] = np.nan
+    y[1000] = 5.0
+    pyramid = MinMaxPyramid(x, y)
+    mins, maxs = pyramid.levels[0]
+    assert np.all(np.isfinite(mins)) and np.all(np.isfinite(maxs))
+    assert pyramid.y_range == (1.0, 5.0)
+
+
+def test_plot_widget_lod(qapp):
+    """Series added to a PlotWidget should switch levels as the x range changes."""
+    plot_widget = PlotWidget()
+    plot_item = plot_widget.add_plot(title="LOD")
+    x = np.arange(2_000_000) * 0.001
+    plot_widget.add_data_to_plot(plot_item, x, [("sin", np.sin(x))])
+
+    series = plot_widget._plot_entries[plot_item].line_series[0]
+    assert isinstance(series, LodPlotDataItem)
+
+    plot_item.setXRange(x[0], x[-1], padding=0)
+    assert series.lod_level() > 0
+    assert len(series.getData()[0]) <= series.points_per_pixel * max(int(plot_item.getViewBox().width()), 1)
+
+    plot_item.setXRange(1000.0, 1000.1, padding=0)
+    assert series.lod_level() == 0
+    data_x, _ = series.getData()
+    assert data_x[0] <= 1000.0 and data_x[-1] >= 1000.1
+
+    # bounds and the time range cover the full series, not just the drawn part
+    assert series.dataBounds(0) == (x[0], x[-1])
+    assert plot_widget._get_data_time_range() == (x[0], x[-1])
+
+    plot_widget.plot_widget.close()
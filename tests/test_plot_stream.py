@@ -0,0 +1,106 @@
+"""Tests for plot_stream module."""
+
+import numpy as np
+import pytest
+
+from director.plot_stream import SampleBuffer
+from director.plot_widget import PlotWidget
+
+
+def test_sample_buffer_grows():
+    buffer = SampleBuffer(capacity=4)
+    for i in range(10):
+        buffer.append(float(i), float(i * i))
+    buffer.append(np.arange(10, 20), np.arange(10, 20) ** 2)
+
+    t, values = buffer.get_data()
+    np.testing.assert_array_equal(t, np.arange(20))
+    np.testing.assert_array_equal(values, np.arange(20) ** 2)
+    assert buffer.capacity() == 32
+    assert buffer.x_range() == (0.0, 19.0)
+    assert buffer.y_range() == (0.0, 361.0)
+
+
+def test_sample_buffer_wraps_at_max_samples():
+    """Once full, new samples should overwrite the oldest and the data should stay contiguous."""
+    buffer = SampleBuffer(capacity=4, max_samples=10)
+    t = np.arange(37, dtype=float)
+    values = np.sin(t)
+    for start in range(0, len(t), 3):
+        buffer.append(t[start : start + 3], values[start : start + 3])
+        stop = min(start + 3, len(t))
+        expected = t[max(0, stop - 10) : stop]
+        np.testing.assert_array_equal(buffer.get_data()[0], expected)
+
+    assert len(buffer) == 10
+    assert buffer.capacity() == 10
+    np.testing.assert_array_equal(buffer.get_data()[1], values[-10:])
+    assert buffer.x_range() == (27.0, 36.0)
+    assert buffer.y_range() == (values[-10:].min(), values[-10:].max())
+
+    # a batch larger than the buffer keeps its last samples
+    buffer.append(np.arange(100, 125), np.zeros(25))
+    np.testing.assert_array_equal(buffer.get_data()[0], np.arange(115, 125))
+    assert buffer.y_range() == (0.0, 0.0)
+
+
+def test_sample_buffer_value_range_after_wrapping():
+    """The value range should follow the retained window as the extremes are overwritten."""
+    rng = np.random.default_rng(0)
+    buffer = SampleBuffer(capacity=8, max_samples=50)
+    values = np.concatenate([rng.normal(size=120), [np.nan], rng.normal(size=80) * 10])
+    t = np.arange(len(values), dtype=float)
+    start = 0
+    while start < len(values):
+        stop = min(start + int(rng.integers(1, 30)), len(values))
+        buffer.append(t[start:stop], values[start:stop])
+        start = stop
+        retained = values[max(0, stop - 50) : stop]
+        assert buffer.y_range() == (np.nanmin(retained), np.nanmax(retained))
+
+    buffer.append(np.arange(300, 350), np.full(50, np.nan))
+    assert buffer.y_range() is None
+
+
+def test_sample_buffer_rejects_mismatched_shapes():
+    buffer = SampleBuffer()
+    with pytest.raises(ValueError):
+        buffer.append([0.0, 1.0], [1.0])
+    assert buffer.x_range() is None and buffer.y_range() is None
+
+
+def test_plot_widget_append_samples(qapp):
+    """Appends should be drawn once per frame and the scroll window should follow the newest sample."""
+    plot_widget = PlotWidget()
+    plot_item = plot_widget.add_plot(title="Live")
+
+    for i in range(100):
+        series = plot_widget.append_samples(plot_item, "value", i * 0.01, np.sin(i * 0.01))
+    assert plot_widget.get_series_names(plot_item) == ["value"]
+    assert len(series.buffer) == 100
+    assert series.getData()[0] is None
+    assert series.dataBounds(0) == (0.0, 0.99)
+
+    # all appends are drawn with one setData() when the flush timer fires
+    assert plot_widget._flush_timer.isActive() and plot_widget._flush_timer.isSingleShot()
+    set_data_calls = []
+    set_data = series.setData
+    series.setData = lambda *args: set_data_calls.append(args) or set_data(*args)
+    plot_widget._flush_timer.timeout.emit()
+    assert not plot_widget._flush_timer.isActive()
+    assert len(set_data_calls) == 1
+    assert len(series.getData()[0]) == 100
+    assert not series.is_dirty()
+
+    plot_widget.set_scroll_window(0.5)
+    plot_widget.append_samples(plot_item, "value", np.arange(100, 200) * 0.01, np.zeros(100))
+    plot_widget.flush_samples()
+    x_min, x_max = plot_item.getViewBox().viewRange()[0]
+    assert np.isclose(x_min, 1.49) and np.isclose(x_max, 1.99)
+    assert plot_widget._get_data_time_range() == (0.0, 1.99)
+
+    plot_widget.add_data_to_plot(plot_item, np.arange(10.0), [("batch", np.zeros(10))])
+    with pytest.raises(ValueError):
+        plot_widget.append_samples(plot_item, "batch", 10.0, 0.0)
+
+    plot_widget.plot_widget.close()
@@ -0,0 +1,67 @@
+"""Tests for plot_widget module."""
+
+import numpy as np
+
+from director.plot_widget import PlotWidget
+
+
+def make_plot_widget(num_plots=3, duration_s=10.0):
+    plot_widget = PlotWidget()
+    t = np.linspace(0.0, duration_s, 1001)
+    for i in range(num_plots):
+        plot_item = plot_widget.add_plot(title=f"plot {i}")
+        plot_widget.add_data_to_plot(plot_item, t, [("value", np.sin(t + i))])
+    return plot_widget
+
+
+def test_data_time_range_is_cached(qapp):
+    plot_widget = make_plot_widget()
+    plots = plot_widget.get_plots()
+    assert plot_widget._get_data_time_range() == (0.0, 10.0)
+
+    # cached until data changes
+    series = plot_widget._plot_entries[plots[0]].line_series[0]
+    series.dataBounds = None
+    assert plot_widget._get_data_time_range() == (0.0, 10.0)
+
+    plot_widget.add_data_to_plot(plots[1], np.array([-5.0, 20.0]), [("wide", np.zeros(2))])
+    assert plot_widget._plot_entries[plots[0]].time_range == (0.0, 10.0)
+    assert plot_widget._plot_entries[plots[1]].time_range is None
+    assert plot_widget._get_data_time_range() == (-5.0, 20.0)
+
+    plot_widget.remove_series(plots[1], "wide")
+    assert plot_widget._get_data_time_range() == (0.0, 10.0)
+
+    plot_widget.append_samples(plots[2], "live", 30.0, 1.0)
+    assert plot_widget._get_data_time_range() == (0.0, 30.0)
+
+    plot_widget.plot_widget.close()
+
+
+def test_update_vlines_scrolls_linked_plots(qapp):
+    """Moving the playhead should move every vline and scroll every plot through the link source."""
+    plot_widget = make_plot_widget()
+    plots = plot_widget.get_plots()
+    plots[0].setXRange(2.0, 4.0, padding=0)
+    for plot_item in plots:
+        plot_widget._plot_entries[plot_item].vline.setPos(3.0)
+
+    scrolled_plots = []
+    scroll_to_timestamp = plot_widget._scroll_to_timestamp
+
+    def counting_scroll_to_timestamp(plot_item, *args):
+        scrolled_plots.append(plot_item)
+        scroll_to_timestamp(plot_item, *args)
+
+    plot_widget._scroll_to_timestamp = counting_scroll_to_timestamp
+
+    # stepping forward past the middle of the view keeps the playhead at the same fraction
+    plot_widget._update_vlines(3.5)
+    assert plot_widget.auto_scroll
+    assert scrolled_plots == [plots[0]]
+    for plot_item in plots:
+        assert plot_widget._plot_entries[plot_item].vline.pos().x() == 3.5
+        x_min, x_max = plot_item.getViewBox().viewRange()[0]
+        assert np.isclose(x_min, 2.5) and np.isclose(x_max, 4.5)
+
+    plot_widget.plot_widget.close()
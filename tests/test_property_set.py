@@ -153,3 +153,57 @@ def test_enum_properties_accept_string_and_int():
 
     with pytest.raises(ValueError):
         props.setProperty("Surface Mode", "Invalid")
+
+
+def test_batch_update_coalesces_notifications():
+    props = create_sample_property_set()
+    changed = []
+    groups = []
+    props.connectPropertyChanged(lambda propertySet, name: changed.append(name))
+    props.connectPropertiesChanged(lambda propertySet, names: groups.append(names))
+
+    props.setProperty("Visible", False)
+    assert changed == ["Visible"]
+    assert groups == [("Visible",)]
+    changed.clear()
+    groups.clear()
+
+    with props.batch_update():
+        props.setProperty("Position", [1.0, 1.0, 1.0])
+        with props.batch_update():
+            props.setProperty("Name", "frame2")
+            props.setProperty("Position", [2.0, 2.0, 2.0])
+        # Set and then restored inside the batch, so not reported
+        props.setProperty("Visible", True)
+        props.setProperty("Visible", False)
+        assert props.isBatchUpdating()
+        assert props.getProperty("Position") == (2.0, 2.0, 2.0)
+        assert changed == [] and groups == []
+
+    assert not props.isBatchUpdating()
+    assert changed == ["Position", "Name"]
+    assert groups == [("Position", "Name")]
+
+
+def test_attributes_share_class_defaults():
+    props = create_sample_property_set()
+    props.addProperty("Alpha", 1.0)
+    props.addProperty("Beta", 2.0)
+
+    props.setPropertyAttribute("Alpha", "decimals", 2)
+    assert props.getPropertyAttribute("Alpha", "decimals") == 2
+    assert props.getPropertyAttribute("Beta", "decimals") == PropertyAttributes.decimals
+    assert PropertyAttributes().to_dict()["maximum"] == 1e4
+
+
+def test_alternate_names_and_unknown_attributes():
+    props = create_sample_property_set()
+    props.visible = False
+    assert props.getProperty("Visible") is False
+    assert props.position == (0.0, 1.0, 2.0)
+
+    # Names that are not properties are set as plain attributes
+    assert not hasattr(props, "unknown")
+    props.unknown = 1
+    assert props.unknown == 1
+    assert "unknown" not in props.propertyNames()
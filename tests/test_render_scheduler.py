@@ -0,0 +1,82 @@
+"""Tests for the render_scheduler module."""
+
+import time
+
+from qtpy.QtWidgets import QWidget
+
+from director.render_scheduler import RenderScheduler
+
+
+class FakeView(QWidget):
+    def __init__(self, scheduler):
+        super().__init__()
+        self.scheduler = scheduler
+        self.renderCount = 0
+        scheduler.registerView(self)
+
+    def render(self, interactive=False):
+        self.scheduler.requestRender(self, interactive=interactive)
+
+    def forceRender(self):
+        self.scheduler.cancelPendingRender(self)
+        self.scheduler.notifyRendered(self)
+        self.renderCount += 1
+
+
+def process_events_until(qapp, predicate, timeout=1.0):
+    end = time.perf_counter() + timeout
+    while not predicate() and time.perf_counter() < end:
+        qapp.processEvents()
+        time.sleep(0.001)
+
+
+def test_redundant_requests_are_coalesced(qapp):
+    scheduler = RenderScheduler(maxFps=None)
+    view = FakeView(scheduler)
+
+    for _ in range(10):
+        view.render()
+    process_events_until(qapp, lambda: not scheduler.hasPendingRender(view))
+
+    assert view.renderCount == 1
+    assert scheduler.getStats(view) == {"requested": 10, "serviced": 1, "skipped": 9}
+
+
+def test_max_fps_delays_next_render(qapp):
+    scheduler = RenderScheduler(maxFps=10.0)
+    view = FakeView(scheduler)
+    view.forceRender()
+
+    view.render()
+    qapp.processEvents()
+    assert view.renderCount == 1
+    assert scheduler.hasPendingRender(view)
+
+    process_events_until(qapp, lambda: not scheduler.hasPendingRender(view))
+    assert view.renderCount == 2
+
+
+def test_interactive_request_bypasses_cap(qapp):
+    scheduler = RenderScheduler(maxFps=1.0)
+    view = FakeView(scheduler)
+    view.forceRender()
+
+    view.render()
+    view.render(interactive=True)
+    process_events_until(qapp, lambda: not scheduler.hasPendingRender(view), timeout=0.5)
+
+    assert view.renderCount == 2
+    assert scheduler.getStats(view)["serviced"] == 1
+
+
+def test_request_covered_by_other_render_is_skipped(qapp):
+    scheduler = RenderScheduler(maxFps=None)
+    view = FakeView(scheduler)
+
+    view.render()
+    # e.g. the interactor rendered the view directly during camera motion
+    scheduler.notifyRendered(view)
+    process_events_until(qapp, lambda: scheduler.getStats(view)["skipped"] == 1)
+
+    assert view.renderCount == 0
+    assert scheduler.getStats(view) == {"requested": 1, "serviced": 0, "skipped": 1}
@@ -0,0 +1,65 @@
+"""Tests for the render_stats module."""
+
+import numpy as np
+import pytest
+
+import director.vtkAll as vtk
+import director.vtkNumpy as vnp
+from director import render_stats
+from director.render_stats import RenderStats
+
+
+def test_frames_record_render_and_update_time():
+    stats = RenderStats(maxFrames=3)
+    assert stats.lastFrame() is None
+    assert stats.getPercentiles() == {50: 0.0, 95: 0.0, 99: 0.0}
+
+    render_stats.addUpdateTime(0.25)
+    stats.startFrame()
+    stats.endFrame(actors=2, triangles=10, points=8)
+
+    frame = stats.lastFrame()
+    assert frame.renderTime >= 0.0
+    assert frame.updateTime == pytest.approx(0.25)
+    assert (frame.actors, frame.triangles, frame.points) == (2, 10, 8)
+
+    # update time is only attributed to the first frame after it was recorded
+    stats.startFrame()
+    stats.endFrame()
+    assert stats.lastFrame().updateTime == 0.0
+
+
+def test_percentiles_and_histogram():
+    stats = RenderStats(maxFrames=100)
+    for i in range(1, 101):
+        stats.frames.append(render_stats.FrameStats(0.0, i / 1000.0, 0.0, 0, 0, 0))
+
+    percentiles = stats.getPercentiles()
+    assert percentiles[50] == pytest.approx(0.0505)
+    assert percentiles[99] == pytest.approx(0.09901)
+
+    counts, edges = stats.getHistogram(bins=10)
+    assert counts.sum() == 100
+    assert len(edges) == 11
+
+    assert "p95" in stats.formatSummary()
+
+
+def test_end_without_start_is_ignored():
+    stats = RenderStats()
+    stats.endFrame()
+    assert len(stats.frames) == 0
+
+
+def test_count_triangles():
+    """Polygons and strips with n points draw n - 2 triangles."""
+    assert render_stats.countTriangles(None) == 0
+    assert render_stats.countTriangles(vtk.vtkCellArray()) == 0
+
+    quads = vnp.getVtkCellArrayFromNumpy(np.array([[0, 1, 2, 3], [4, 5, 6, 7]]))
+    assert render_stats.countTriangles(quads) == 4
+
+    cells = vtk.vtkCellArray()
+    cells.InsertNextCell(3, [0, 1, 2])
+    cells.InsertNextCell(102, list(range(102)))
+    assert render_stats.countTriangles(cells) == 1 + 100
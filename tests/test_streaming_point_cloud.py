@@ -0,0 +1,78 @@
+"""Tests for StreamingPointCloudItem."""
+
+import numpy as np
+import pytest
+
+import director.objectmodel as om
+import director.vtkNumpy as vnp
+from director.streaming_point_cloud import StreamingPointCloudItem, showStreamingPointCloud
+from director.vtk_widget import VTKWidget
+
+
+def _vert_ids(item):
+    connectivity = item.polyData.GetVerts().GetConnectivityArray()
+    return vnp.numpy_support.vtk_to_numpy(connectivity)
+
+
+def test_add_frame_in_place(qapp):
+    """Frames should be written into the preallocated buffer without replacing VTK arrays."""
+    widget = VTKWidget()
+    om.init()
+
+    item = showStreamingPointCloud(
+        "stream",
+        100,
+        scalarNames=["intensity"],
+        scalarRanges={"intensity": (0, 1)},
+        colorByName="intensity",
+        view=widget,
+    )
+    points_array = item.polyData.GetPoints().GetData()
+    intensity_array = item.polyData.GetPointData().GetArray("intensity")
+
+    points = np.random.rand(40, 3)
+    item.addFrame(points, {"intensity": np.full(40, 0.5)})
+
+    assert item.getNumberOfPoints() == 40
+    assert item.polyData.GetNumberOfVerts() == 40
+    assert item.polyData.GetPoints().GetData() is points_array
+    assert item.polyData.GetPointData().GetArray("intensity") is intensity_array
+    assert np.allclose(vnp.getNumpyFromVtk(item.polyData)[:40], points)
+    assert np.allclose(vnp.getNumpyFromVtk(item.polyData, "intensity")[:40], 0.5)
+    assert item.properties.getPropertyEnumValue("Color By") == "intensity"
+
+    # Vertex cells are only rebuilt when the number of points changes
+    connectivity = item.polyData.GetVerts().GetConnectivityArray()
+    item.addFrame(points * 2)
+    assert item.polyData.GetVerts().GetConnectivityArray() is connectivity
+    assert np.allclose(vnp.getNumpyFromVtk(item.polyData)[:40], points * 2)
+
+    item.addFrame(points[:10])
+    assert item.polyData.GetNumberOfVerts() == 10
+    assert item.polyData.GetVerts().GetConnectivityArray() is not connectivity
+
+    with pytest.raises(ValueError):
+        item.addFrame(np.zeros((101, 3)))
+
+    item.clear()
+    assert item.polyData.GetNumberOfVerts() == 0
+
+
+def test_frame_ring(qapp):
+    """The last numFrames frames should be kept, with their age from newest to oldest."""
+    widget = VTKWidget()
+
+    item = StreamingPointCloudItem("ring", widget, maxPointsPerFrame=10, numFrames=3)
+    for i in range(4):
+        item.addFrame(np.full((i + 1, 3), float(i)))
+
+    # Frame 0 was replaced by frame 3, which was written into slot 0
+    assert item.getNumberOfPoints() == 2 + 3 + 4
+    ids = _vert_ids(item)
+    assert list(ids) == [0, 1, 2, 3, 10, 11, 20, 21, 22]
+
+    points = vnp.getNumpyFromVtk(item.polyData)
+    assert list(points[ids, 0]) == [3, 3, 3, 3, 1, 1, 2, 2, 2]
+
+    age = vnp.getNumpyFromVtk(item.polyData, StreamingPointCloudItem.FRAME_AGE_ARRAY)
+    assert list(age[ids]) == [0, 0, 0, 0, 2, 2, 1, 1, 1]
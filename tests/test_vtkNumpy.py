@@ -7,7 +7,9 @@ from director.vtkNumpy import (
     addNumpyToVtk,
     getNumpyFromVtk,
     getNumpyImageFromVtk,
+    getVtkCellArrayFromNumpy,
     getVtkPointsFromNumpy,
+    getVtkVertexCells,
     numpyToImageData,
     numpyToPolyData,
 )
@@ -37,6 +39,39 @@ def test_numpy_to_polydata_with_point_data():
     assert polyData.GetPointData().GetArray("labels") is not None
 
 
+def test_numpy_to_polydata_no_copy():
+    """Test that copy=False shares memory with the input arrays."""
+    points = np.random.rand(100, 3).astype(np.float32)
+    intensity = np.random.rand(100).astype(np.float32)
+
+    polyData = numpyToPolyData(points, pointData={"intensity": intensity}, copy=False)
+
+    assert polyData.GetNumberOfVerts() == 100
+    assert np.shares_memory(getNumpyFromVtk(polyData), points)
+    assert np.shares_memory(getNumpyFromVtk(polyData, "intensity"), intensity)
+
+    points[0] = [1.0, 2.0, 3.0]
+    assert polyData.GetPoint(0) == (1.0, 2.0, 3.0)
+
+    # The default mode copies
+    polyData = numpyToPolyData(points, pointData={"intensity": intensity})
+    assert not np.shares_memory(getNumpyFromVtk(polyData), points)
+    assert not np.shares_memory(getNumpyFromVtk(polyData, "intensity"), intensity)
+
+
+def test_get_vtk_vertex_cells():
+    """Test creating one vertex cell per point."""
+    cells = getVtkVertexCells(5)
+    assert cells.GetNumberOfCells() == 5
+    ids = vtk.vtkIdList()
+    for i in range(5):
+        cells.GetCellAtId(i, ids)
+        assert ids.GetNumberOfIds() == 1
+        assert ids.GetId(0) == i
+
+    assert getVtkVertexCells(0).GetNumberOfCells() == 0
+
+
 def test_get_numpy_from_vtk_points():
     """Test getting numpy array from VTK PolyData points."""
     # Create a simple sphere
@@ -115,3 +150,15 @@ def test_get_vtk_points_from_numpy():
 
     assert vtkPoints is not None
     assert vtkPoints.GetNumberOfPoints() == 3
+
+
+def test_get_vtk_cell_array_from_numpy():
+    """Test converting an (N, 3) numpy array of point ids to a VTK cell array."""
+    triangles = np.array([[0, 1, 2], [2, 1, 3]], dtype=np.int32)
+
+    cells = getVtkCellArrayFromNumpy(triangles)
+
+    assert cells.GetNumberOfCells() == 2
+    ids = vtk.vtkIdList()
+    cells.GetCellAtId(1, ids)
+    assert [ids.GetId(i) for i in range(ids.GetNumberOfIds())] == [2, 1, 3]
@@ -1,7 +1,9 @@
 """Tests for vtk_widget module."""
 
+import numpy as np
 import vtk
 
+import director.vtkNumpy as vnp
 from director.vtk_widget import FPSCounter, VTKWidget
 
 
@@ -129,6 +131,53 @@ def test_vtk_widget_get_average_fps(qapp):
     assert fps >= 0.0
 
 
+def test_vtk_widget_render_stats(qapp):
+    """Test per-frame render statistics."""
+    widget = VTKWidget()
+    sphere_source = vtk.vtkSphereSource()
+    sphere_source.Update()
+    mapper = vtk.vtkPolyDataMapper()
+    mapper.SetInputData(sphere_source.GetOutput())
+    actor = vtk.vtkActor()
+    actor.SetMapper(mapper)
+    widget.renderer().AddActor(actor)
+
+    # A quad draws 2 triangles and a 6 point triangle strip draws 4
+    quad_and_strip = vtk.vtkPolyData()
+    quad_and_strip.SetPoints(vnp.getVtkPointsFromNumpy(np.random.rand(6, 3)))
+    quad_and_strip.SetPolys(vnp.getVtkCellArrayFromNumpy(np.array([[0, 1, 2, 3]])))
+    quad_and_strip.SetStrips(vnp.getVtkCellArrayFromNumpy(np.array([[0, 1, 2, 3, 4, 5]])))
+    quad_mapper = vtk.vtkPolyDataMapper()
+    quad_mapper.SetInputData(quad_and_strip)
+    quad_actor = vtk.vtkActor()
+    quad_actor.SetMapper(quad_mapper)
+    widget.renderer().AddActor(quad_actor)
+
+    widget.forceRender()
+    assert len(widget.renderStats().frames) == 0
+
+    widget.setRenderStatsEnabled(True)
+    widget.forceRender()
+    widget.forceRender()
+
+    stats = widget.renderStats()
+    assert len(stats.frames) == 2
+    frame = stats.lastFrame()
+    assert frame.renderTime >= 0.0
+    assert frame.actors == 2
+    assert frame.triangles == sphere_source.GetOutput().GetNumberOfPolys() + 2 + 4
+    assert frame.points == sphere_source.GetOutput().GetNumberOfPoints() + 6
+    assert set(stats.getPercentiles()) == {50, 95, 99}
+
+    # The overlay shows the summary through the TextItem Text property
+    widget.setRenderStatsOverlayVisible(True)
+    overlay = widget._render_stats_overlay
+    widget.forceRender()
+    assert overlay.getProperty("Text") == stats.formatSummary()
+    assert f"triangles {frame.triangles:d}" in overlay.getProperty("Text")
+    assert overlay.actor.GetInput() == overlay.getProperty("Text")
+
+
 def test_vtk_widget_show_and_close(qapp):
     """Test that VTKWidget can be shown and closed."""
     widget = VTKWidget()
@@ -136,3 +185,18 @@ def test_vtk_widget_show_and_close(qapp):
 
     # Verify widget is visible
     assert widget.isVisible()
+
+
+def test_vtk_widget_close_removes_observers(qapp):
+    """Test that closing the widget removes its render and interaction observers."""
+    widget = VTKWidget()
+    render_window = widget.renderWindow()
+    interactor = render_window.GetInteractor()
+    render_tags = list(widget._render_observer_tags)
+    interactor_tags = list(widget._interactor_observer_tags)
+    assert all(render_window.GetCommand(tag) is not None for tag in render_tags)
+    assert all(interactor.GetCommand(tag) is not None for tag in interactor_tags)
+
+    widget.close()
+    assert all(render_window.GetCommand(tag) is None for tag in render_tags)
+    assert all(interactor.GetCommand(tag) is None for tag in interactor_tags)